@@ -43,7 +43,6 @@ from peekingduck.commands import LOGGER_NAME
 from peekingduck.runner import Runner
 from peekingduck.utils.deprecation import deprecate
 from peekingduck.utils.logger import LoggerSetup
-from peekingduck.viewer import Viewer
 
 logger = logging.getLogger(LOGGER_NAME)  # pylint: disable=invalid-name
 
@@ -89,12 +88,93 @@ def init(custom_folder_name: str) -> None:
     is_flag=True,
     help="Launch PeekingDuck viewer",
 )
-def run(  # pylint: disable=too-many-arguments
+@click.option(
+    "--pipelined",
+    default=False,
+    is_flag=True,
+    help="Run each node in its own worker thread so that consecutive frames overlap",
+)
+@click.option(
+    "--concurrent",
+    default=False,
+    is_flag=True,
+    help="Run nodes which do not depend on each other's outputs concurrently",
+)
+@click.option(
+    "--metrics_path",
+    default=None,
+    type=click.Path(),
+    help="Periodically write per-node latency and output size statistics to this file",
+)
+@click.option(
+    "--metrics_format",
+    default="json",
+    type=click.Choice(["json", "prometheus"]),
+    help="Format of the file written to --metrics_path",
+)
+@click.option(
+    "--batch_size",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Batch up to this many frames in nodes which support batched inference, requires --pipelined",
+)
+@click.option(
+    "--release_outputs",
+    default=False,
+    is_flag=True,
+    help="Drop each output once its last consumer has run to lower memory usage",
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help=(
+        "Split the files of a directory source, or the frames of a video file, "
+        "across this many worker processes"
+    ),
+)
+@click.option(
+    "--segment_overlap",
+    default=30,
+    type=click.IntRange(min=0),
+    help="Warm-up frames read before each video segment when --workers splits a video",
+)
+@click.option(
+    "--init_workers",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Initialize up to this many nodes concurrently, 1 initializes them one by one",
+)
+@click.option(
+    "--warmup",
+    default=False,
+    is_flag=True,
+    help="Run every model node once on a blank frame before the first real frame",
+)
+@click.option(
+    "--profile-startup",
+    "profile_startup",
+    default=False,
+    is_flag=True,
+    help="Report the import and init time of every node before running the pipeline",
+)
+def run(  # pylint: disable=too-many-arguments, too-many-locals
     config_path: str,
     log_level: str,
     node_config: str,
     num_iter: int,
     viewer: bool,
+    pipelined: bool,
+    concurrent: bool,
+    metrics_path: str,
+    metrics_format: str,
+    batch_size: int,
+    release_outputs: bool,
+    workers: int,
+    segment_overlap: int,
+    init_workers: int,
+    warmup: bool,
+    profile_startup: bool,
     nodes_parent_dir: str = "src",
 ) -> None:
     """Runs PeekingDuck"""
@@ -115,8 +195,15 @@ def run(  # pylint: disable=too-many-arguments
         else:
             config_path = curr_dir / "pipeline_config.yml"
     pipeline_config_path = Path(config_path)
+    if profile_startup and (viewer or workers > 1):
+        raise click.UsageError(
+            "--profile-startup cannot be used with --viewer or --workers."
+        )
 
     if viewer:
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.viewer import Viewer
+
         logger.info("Launching PeekingDuck Viewer")
         start_time = perf_counter()
         pkd_viewer = Viewer(
@@ -128,6 +215,30 @@ def run(  # pylint: disable=too-many-arguments
         end_time = perf_counter()
         logger.debug(f"Startup time = {end_time - start_time:.2f} sec")
         pkd_viewer.run()
+    elif workers > 1:
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.parallel_runner import ParallelRunner
+
+        start_time = perf_counter()
+        parallel_runner = ParallelRunner(
+            pipeline_path=pipeline_config_path,
+            config_updates_cli=node_config,
+            custom_nodes_parent_subdir=nodes_parent_dir,
+            num_workers=workers,
+            segment_overlap=segment_overlap,
+            log_level=log_level,
+            num_iter=num_iter,
+            mode=_get_run_mode(pipelined, concurrent),
+            metrics_path=metrics_path,
+            metrics_format=metrics_format,
+            batch_size=batch_size,
+            release_outputs=release_outputs,
+            init_workers=init_workers,
+            warmup=warmup,
+        )
+        end_time = perf_counter()
+        logger.debug(f"Startup time = {end_time - start_time:.2f} sec")
+        parallel_runner.run()
     else:
         start_time = perf_counter()
         runner = Runner(
@@ -135,9 +246,22 @@ def run(  # pylint: disable=too-many-arguments
             config_updates_cli=node_config,
             custom_nodes_parent_subdir=nodes_parent_dir,
             num_iter=num_iter,
+            mode=_get_run_mode(pipelined, concurrent),
+            metrics_path=metrics_path,
+            metrics_format=metrics_format,
+            batch_size=batch_size,
+            release_outputs=release_outputs,
+            init_workers=init_workers,
+            warmup=warmup,
         )
         end_time = perf_counter()
         logger.debug(f"Startup time = {end_time - start_time:.2f} sec")
+        if profile_startup:
+            _log_startup_profile(
+                runner.node_loader.startup_times,
+                runner.node_loader.nodes_time,
+                end_time - start_time,
+            )
         runner.run()
 
 
@@ -191,6 +315,54 @@ def _create_custom_folder(custom_folder_name: str) -> None:
     custom_nodes_config_dir.mkdir(parents=True, exist_ok=True)
 
 
+def _log_startup_profile(
+    startup_times: List[Dict[str, Any]], nodes_time: float, total_time: float
+) -> None:
+    """Logs the import and init time of every node, and the packages which
+    were first imported by each node.
+
+    Args:
+        startup_times (:obj:`List[Dict[str, Any]]`): Startup times recorded
+            by the DeclarativeLoader.
+        nodes_time (:obj:`float`): Wall-clock time taken by the
+            DeclarativeLoader to import and initialize all nodes.
+        total_time (:obj:`float`): Time taken to create the Runner.
+    """
+    logger.info("Startup profile:")
+    for entry in startup_times:
+        new_packages = ", ".join(entry["new_packages"]) or "none"
+        logger.info(
+            f"  {entry['node']}: import = {entry['import_time']:.2f} sec, "
+            f"init = {entry['init_time']:.2f} sec, new packages: {new_packages}"
+        )
+    # per-node times overlap when nodes are initialized concurrently, so the
+    # time outside the loader is based on its wall-clock time instead
+    logger.info(
+        f"  nodes = {nodes_time:.2f} sec (wall-clock), "
+        f"other = {max(0.0, total_time - nodes_time):.2f} sec, "
+        f"total = {total_time:.2f} sec"
+    )
+
+
+def _get_run_mode(pipelined: bool, concurrent: bool) -> str:
+    """Selects the pipeline execution mode from the CLI flags.
+
+    Args:
+        pipelined (:obj:`bool`): Whether --pipelined was passed.
+        concurrent (:obj:`bool`): Whether --concurrent was passed.
+
+    Returns:
+        (:obj:`str`): The execution mode to be passed to the Runner.
+    """
+    if pipelined and concurrent:
+        raise click.UsageError("--pipelined and --concurrent cannot be used together.")
+    if pipelined:
+        return "pipelined"
+    if concurrent:
+        return "concurrent"
+    return "sequential"
+
+
 def _create_pipeline_config_yml(
     default_nodes: List[Union[str, Dict[str, Any]]] = None,
     default_path: Path = Path("pipeline_config.yml"),
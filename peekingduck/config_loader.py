@@ -77,4 +77,7 @@ class ConfigLoader:  # pylint: disable=too-few-public-methods
 
         # some models require the knowledge of where the root is for loading
         node_config["root"] = self._base_dir
+        # scheduling configs accepted by every node, see FrameScheduler
+        node_config.setdefault("run_every", 1)
+        node_config.setdefault("latency_budget", None)
         return node_config
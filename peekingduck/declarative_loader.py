@@ -38,7 +38,10 @@ import logging
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
@@ -58,6 +61,10 @@ PEEKINGDUCK_OBJ_DET_MODELS = [
     "model.efficientdet", "model.mask_rcnn", "model.yolo", "model.yolox", "model.yolact_edge",
 ]
 
+# Node modules are imported one at a time, even when the nodes are initialized
+# concurrently, as importing them runs the optional requirement checks
+_IMPORT_LOCK = threading.Lock()
+
 
 class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """A helper class to create
@@ -78,20 +85,32 @@ class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-ins
             used with PeekingDuck. For more information on using custom nodes,
             please refer to
             `Getting Started <getting_started/03_custom_nodes.html>`_.
+        pkd_viewer (:obj:`bool`): Whether PeekingDuck Viewer is activated.
+            **Default: False**.
+        init_workers (:obj:`int`): Maximum number of nodes initialized
+            concurrently, e.g., to overlap the loading of model weights. Set
+            to 1 to initialize the nodes one after another. **Default: 4**.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         pipeline_path: Path,
         config_updates_cli: str,
         custom_nodes_parent_subdir: str,
         pkd_viewer: bool = False,
+        init_workers: int = 4,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.pkd_viewer = pkd_viewer
+        self.init_workers = init_workers
 
         self.pkd_base_dir = Path(__file__).resolve().parent
         self.config_loader = ConfigLoader(self.pkd_base_dir)
+        # import and init time of each node, in pipeline order
+        self.startup_times: List[Dict[str, Any]] = []
+        # wall-clock time taken to import and initialize all nodes, which is
+        # less than the sum of startup_times when nodes load concurrently
+        self.nodes_time = 0.0
 
         if pipeline_path.parent != Path.cwd() and pipeline_path.is_absolute():
             parent_path = str(pipeline_path.parent)
@@ -181,9 +200,14 @@ class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-ins
         return custom_name
 
     def _instantiate_nodes(self) -> List[AbstractNode]:
-        """Given a list of imported nodes, instantiate nodes"""
-        instantiated_nodes = []
+        """Given a list of imported nodes, instantiate nodes.
 
+        Up to ``init_workers`` nodes are initialized concurrently but are
+        returned in the declared order. Their modules are imported one at a
+        time. If any node fails to initialize, the error of every failed node
+        is logged and the first one, in the declared order, is raised.
+        """
+        node_args = []
         for node_str, config_updates_yml in self.node_list:
             node_str_split = node_str.split(".")
 
@@ -194,23 +218,63 @@ class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-ins
                 path_to_node = f"{self.custom_nodes_dir.name}."
                 node_name = ".".join(node_str_split[-2:])
 
-                instantiated_node = self._init_node(
-                    path_to_node,
-                    node_name,
-                    self.custom_config_loader,
-                    config_updates_yml,
+                node_args.append(
+                    (
+                        path_to_node,
+                        node_name,
+                        self.custom_config_loader,
+                        config_updates_yml,
+                    )
                 )
             else:
                 path_to_node = "peekingduck.pipeline.nodes."
 
-                instantiated_node = self._init_node(
-                    path_to_node, node_str, self.config_loader, config_updates_yml
+                node_args.append(
+                    (path_to_node, node_str, self.config_loader, config_updates_yml)
                 )
 
-            instantiated_nodes.append(instantiated_node)
+        if self.init_workers <= 1 or len(node_args) <= 1:
+            return [self._init_node(*args) for args in node_args]
+
+        num_recorded = len(self.startup_times)
+        with ThreadPoolExecutor(
+            max_workers=min(self.init_workers, len(node_args)),
+            thread_name_prefix="node_init",
+        ) as executor:
+            futures = [executor.submit(self._init_node, *args) for args in node_args]
+
+        instantiated_nodes = []
+        errors = []
+        for (node_str, _), future in zip(self.node_list, futures):
+            error = future.exception()
+            if error is None:
+                instantiated_nodes.append(future.result())
+            else:
+                self.logger.error(f"Failed to initialize {node_str} node: {error}")
+                errors.append(error)
+        if errors:
+            raise errors[0]
 
+        self._sort_startup_times(num_recorded, node_args)
         return instantiated_nodes
 
+    def _sort_startup_times(
+        self, num_recorded: int, node_args: List[Tuple[Any, ...]]
+    ) -> None:
+        """Restores the declared order of the startup times recorded after the
+        first ``num_recorded`` entries, as concurrently initialized nodes
+        record them in order of completion.
+        """
+        entries = self.startup_times[num_recorded:]
+        del self.startup_times[num_recorded:]
+        for path_to_node, node_name, *_ in node_args:
+            label = _get_node_label(path_to_node, node_name)
+            for entry in entries:
+                if entry["node"] == label:
+                    entries.remove(entry)
+                    self.startup_times.append(entry)
+                    break
+
     def _init_node(
         self,
         path_to_node: str,
@@ -219,7 +283,12 @@ class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-ins
         config_updates_yml: Optional[Dict[str, Any]],
     ) -> AbstractNode:
         """Imports node to filepath and initializes node with config."""
-        node = importlib.import_module(path_to_node + node_name)
+        with _IMPORT_LOCK:
+            # sys.modules is copied as other nodes may be importing concurrently
+            loaded_packages = {name.split(".")[0] for name in list(sys.modules)}
+            start_time = perf_counter()
+            node = importlib.import_module(path_to_node + node_name)
+            import_time = perf_counter() - start_time
         config = config_loader.get(node_name)
 
         # First, override default configs with values from pipeline_config.yml
@@ -235,7 +304,22 @@ class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-ins
 
         # inform node if PeekingDuck Viewer is activated or not
         config["pkd_viewer"] = self.pkd_viewer
-        return node.Node(config)
+        start_time = perf_counter()
+        instantiated_node = node.Node(config)
+        self.startup_times.append(
+            {
+                "node": _get_node_label(path_to_node, node_name),
+                "import_time": import_time,
+                "init_time": perf_counter() - start_time,
+                # approximate when nodes are initialized concurrently
+                "new_packages": sorted(
+                    {name.split(".")[0] for name in list(sys.modules)}
+                    - loaded_packages
+                    - {"peekingduck"}
+                ),
+            }
+        )
+        return instantiated_node
 
     def _edit_config(
         self, dict_orig: Dict[str, Any], dict_update: Dict[str, Any], node_name: str
@@ -277,20 +361,31 @@ class DeclarativeLoader:  # pylint: disable=too-few-public-methods, too-many-ins
                     )
         return dict_orig
 
-    def get_pipeline(self) -> Pipeline:
+    def get_pipeline(self, release_outputs: bool = False) -> Pipeline:
         """Returns a compiled
         :py:class:`Pipeline <peekingduck.pipeline.pipeline.Pipeline>` for
         PeekingDuck :py:class:`Runner <peekingduck.runner.Runner>` to execute.
+
+        Args:
+            release_outputs (:obj:`bool`): Whether the pipeline drops data
+                pool entries once they are no longer needed.
         """
+        start_time = perf_counter()
         instantiated_nodes = self._instantiate_nodes()
+        self.nodes_time = perf_counter() - start_time
 
         try:
-            return Pipeline(instantiated_nodes)
+            return Pipeline(instantiated_nodes, release_outputs)
         except ValueError as error:
             self.logger.error(str(error))
             sys.exit(1)
 
 
+def _get_node_label(path_to_node: str, node_name: str) -> str:
+    """Returns the name of the node as declared in the pipeline config file."""
+    return f"{path_to_node}{node_name}".replace("peekingduck.pipeline.nodes.", "")
+
+
 class NodeList:
     """Iterator class to return node string and node configs (if any) from the
     nodes declared in the run config file.
@@ -0,0 +1,545 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Runs a declared pipeline in several worker processes.
+"""
+
+import copy
+import csv
+import logging
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import cv2
+
+from peekingduck.declarative_loader import DeclarativeLoader
+from peekingduck.pipeline.nodes.input.utils.read import VideoNoThread
+from peekingduck.pipeline.nodes.input.visual import VIDEO_EXTENSIONS
+from peekingduck.runner import Runner
+from peekingduck.utils.logger import LoggerSetup
+
+
+class Segment(NamedTuple):
+    """Frames ``[start, end)`` of a video processed by a single worker. The
+    worker starts reading ``num_warmup_frames`` frames earlier so that
+    stateful nodes, e.g., trackers, are warmed up by ``start``. The outputs of
+    the warm-up frames are discarded.
+    """
+
+    start: int
+    end: int
+    num_warmup_frames: int
+
+
+class ParallelRunner:  # pylint: disable=too-many-instance-attributes
+    """Runs copies of a declared pipeline in several worker processes.
+
+    If the source of the ``input.visual`` node is a directory, or a list of
+    files, the files are split into contiguous shards. Per-file outputs of
+    ``output.media_writer`` are written to the shared output directory as
+    usual.
+
+    If the source is a single video file, its frames are split into
+    contiguous segments instead. Each worker seeks to the start of its
+    segment, less ``segment_overlap`` warm-up frames. The videos written by
+    the workers' ``output.media_writer`` are stitched, without their warm-up
+    frames, into a single video once all workers are done. The warm-up frames
+    are dropped by count, so ``output.media_writer`` has to write every frame,
+    i.e., ``backpressure: drop`` is not supported. Stitching decodes and
+    re-encodes every segment, one after another, with the same ``mp4v`` codec
+    as ``output.media_writer``. Stateful nodes are only warmed up, not
+    synchronized, across segments, so, e.g., tracking IDs restart in every
+    segment.
+
+    Each worker creates its own :py:class:`Runner <peekingduck.runner.Runner>`.
+    Each worker's ``output.csv_writer`` writes to its own CSV file, and these
+    files are merged, in order, into a single CSV file once all workers are
+    done.
+
+    Args:
+        pipeline_path (:obj:`pathlib.Path`): Path to *pipeline_config.yml*.
+        config_updates_cli (:obj:`str`): Configuration changes passed as part
+            of the CLI command.
+        custom_nodes_parent_subdir (:obj:`str`): Relative path to a folder
+            which contains custom nodes.
+        num_workers (:obj:`int`): Maximum number of worker processes.
+        segment_overlap (:obj:`int`): Number of frames read before the start
+            of each video segment to warm up stateful nodes. **Default: 30**.
+        log_level (:obj:`str`): Log level of the worker processes.
+            **Default: "info"**.
+        **runner_kwargs (:obj:`Any`): Other arguments passed to the
+            :py:class:`Runner <peekingduck.runner.Runner>` of every worker,
+            e.g., ``mode`` or ``release_outputs``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pipeline_path: Path,
+        config_updates_cli: str,
+        custom_nodes_parent_subdir: str,
+        num_workers: int,
+        segment_overlap: int = 30,
+        log_level: str = "info",
+        **runner_kwargs: Any,
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.pipeline_path = Path(pipeline_path).resolve()
+        self.custom_nodes_parent_subdir = custom_nodes_parent_subdir
+        self.log_level = log_level
+        self.runner_kwargs = runner_kwargs
+        self.shards: List[List[Path]] = []
+        self.segments: List[Segment] = []
+        self._summary: Dict[str, Any] = {}
+        try:
+            if num_workers < 1:
+                raise ValueError(
+                    f"num_workers must be a positive integer, got: {num_workers}"
+                )
+            if segment_overlap < 0:
+                raise ValueError(
+                    "segment_overlap must be a non-negative integer, got: "
+                    f"{segment_overlap}"
+                )
+            self.node_loader = DeclarativeLoader(
+                self.pipeline_path, config_updates_cli, custom_nodes_parent_subdir
+            )
+            source = self._get_source()
+            if _is_video_file(source):
+                self._init_segments(Path(source), num_workers, segment_overlap)
+            else:
+                self.shards = split_into_shards(
+                    self._get_source_files(source), num_workers
+                )
+                self.logger.info(
+                    f"Processing {sum(len(shard) for shard in self.shards)} files "
+                    f"with {self.num_workers} workers"
+                )
+        except (FileNotFoundError, ValueError) as error:
+            self.logger.error(str(error))
+            sys.exit(1)
+
+    @property
+    def num_workers(self) -> int:
+        """Number of worker processes, one per shard or segment."""
+        return len(self.segments) if self.segments else len(self.shards)
+
+    def run(self) -> None:
+        """Runs every shard or segment in its own worker process and merges
+        their outputs.
+        """
+        start_time = perf_counter()
+        results: List[Dict[str, Any]] = []
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.num_workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(
+                    _run_shard,
+                    self.pipeline_path,
+                    self._get_shard_config_updates(shard_idx),
+                    self.custom_nodes_parent_subdir,
+                    self.log_level,
+                    self._get_shard_runner_kwargs(shard_idx),
+                )
+                for shard_idx in range(self.num_workers)
+            ]
+            for shard_idx, future in enumerate(futures):
+                try:
+                    result = future.result()
+                except (Exception, SystemExit) as error:  # pylint: disable=broad-except
+                    self.logger.error(f"Worker {shard_idx} failed: {error!r}")
+                    result = {"csv_paths": [], "video_paths": [], "error": repr(error)}
+                result.update(worker=shard_idx, **self._describe_shard(shard_idx))
+                results.append(result)
+
+        num_skipped = [
+            self.segments[result["worker"]].num_warmup_frames if self.segments else 0
+            for result in results
+        ]
+        csv_path = self._merge_csv_files(
+            [
+                (Path(path), skipped)
+                for result, skipped in zip(results, num_skipped)
+                for path in result["csv_paths"]
+            ]
+        )
+        video_path = None
+        if self.segments:
+            video_path = self._stitch_videos(
+                [
+                    (Path(path), skipped)
+                    for result, skipped in zip(results, num_skipped)
+                    for path in result["video_paths"]
+                ]
+            )
+        self._summary = {
+            "elapsed": perf_counter() - start_time,
+            "num_files": 1 if self.segments else sum(map(len, self.shards)),
+            "num_iterations": sum(
+                result.get("num_iterations", 0) for result in results
+            ),
+            "csv_path": str(csv_path) if csv_path else None,
+            "video_path": str(video_path) if video_path else None,
+            "failed_workers": [
+                result["worker"] for result in results if "error" in result
+            ],
+            "workers": results,
+        }
+        self._log_summary()
+        if self._summary["failed_workers"]:
+            sys.exit(1)
+
+    def summary(self) -> Dict[str, Any]:
+        """Retrieves the merged summary of the workers after :py:meth:`run`.
+
+        Returns:
+            (:obj:`Dict[str, Any]`): The total ``elapsed`` time in seconds,
+            ``num_files`` and ``num_iterations`` over all workers, the paths
+            of the merged CSV file ``csv_path`` and the stitched video
+            ``video_path`` (if any), the indices of ``failed_workers``, and
+            the result of each worker in ``workers``.
+        """
+        return self._summary
+
+    def _describe_shard(self, shard_idx: int) -> Dict[str, Any]:
+        """Returns the files or frames processed by the specified worker."""
+        if self.segments:
+            segment = self.segments[shard_idx]
+            return {"frames": (segment.start, segment.end)}
+        return {"num_files": len(self.shards[shard_idx])}
+
+    def _get_node_config(self, node_name: str) -> Optional[Dict[str, Any]]:
+        """Returns the configuration of the specified node after applying the
+        updates from the pipeline config file and the CLI, or None if the node
+        is not in the pipeline.
+        """
+        for node_str, config_updates_yml in self.node_loader.node_list:
+            if node_str != node_name:
+                continue
+            config = self.node_loader.config_loader.get(node_name)
+            config.update(config_updates_yml or {})
+            config_updates_cli = self.node_loader.config_updates_cli or {}
+            config.update(config_updates_cli.get(node_name, {}))
+            return config
+        return None
+
+    def _get_source(self) -> Any:
+        """Returns the source of the ``input.visual`` node."""
+        config = self._get_node_config("input.visual")
+        if config is None:
+            raise ValueError("Running with several workers requires input.visual.")
+        return config["source"]
+
+    def _get_source_files(self, source: Any) -> List[Path]:
+        """Lists the files to be processed by the ``input.visual`` node."""
+        if isinstance(source, list):
+            return [Path(file_path).resolve() for file_path in source]
+        if isinstance(source, str) and Path(source).is_dir():
+            return sorted(path.resolve() for path in Path(source).iterdir())
+        raise ValueError(
+            "Running with several workers requires the source of input.visual "
+            f"to be a directory, a list of files, or a video file, got: {source}"
+        )
+
+    def _init_segments(
+        self, video_path: Path, num_workers: int, segment_overlap: int
+    ) -> None:
+        """Splits the frames of `video_path` into segments."""
+        csv_config = self._get_node_config("output.csv_writer")
+        if csv_config is not None and csv_config["logging_interval"] != 0:
+            raise ValueError(
+                "Processing video segments with several workers requires "
+                "output.csv_writer to log every frame with logging_interval: 0."
+            )
+        visual_config = self._get_node_config("input.visual") or {}
+        if visual_config.get("frame_stride", 1) != 1 or visual_config.get(
+            "target_fps", 0
+        ):
+            raise ValueError(
+                "Processing video segments with several workers does not "
+                "support frame_stride or target_fps of input.visual."
+            )
+        media_config = self._get_node_config("output.media_writer")
+        if media_config is not None and media_config["backpressure"] == "drop":
+            raise ValueError(
+                "Processing video segments with several workers requires "
+                "output.media_writer to write every frame with backpressure: "
+                "block."
+            )
+        num_frames = VideoNoThread(str(video_path), False).frame_count
+        self.segments = split_into_segments(num_frames, num_workers, segment_overlap)
+        self.logger.info(
+            f"Processing {num_frames} frames of {video_path} in "
+            f"{self.num_workers} segments, each with up to {segment_overlap} "
+            "warm-up frames"
+        )
+
+    def _get_shard_config_updates(self, shard_idx: int) -> str:
+        """Returns the stringified CLI config updates of the specified
+        worker.
+        """
+        config_updates = copy.deepcopy(self.node_loader.config_updates_cli) or {}
+        visual_updates = config_updates.setdefault("input.visual", {})
+        if self.segments:
+            segment = self.segments[shard_idx]
+            visual_updates["start_frame"] = segment.start - segment.num_warmup_frames
+            # the frame count of some containers is approximate, so the last
+            # worker reads until the end of the video
+            is_last = shard_idx == len(self.segments) - 1
+            visual_updates["end_frame"] = -1 if is_last else segment.end
+            media_config = self._get_node_config("output.media_writer")
+            if media_config is not None:
+                config_updates.setdefault("output.media_writer", {})[
+                    "output_dir"
+                ] = str(Path(media_config["output_dir"]) / f"worker{shard_idx}")
+        else:
+            visual_updates["source"] = [
+                str(file_path) for file_path in self.shards[shard_idx]
+            ]
+        csv_config = self._get_node_config("output.csv_writer")
+        if csv_config is not None:
+            file_path = Path(csv_config["file_path"])
+            config_updates.setdefault("output.csv_writer", {})["file_path"] = str(
+                file_path.with_name(f"{file_path.stem}_worker{shard_idx}.csv")
+            )
+        return str(config_updates)
+
+    def _get_shard_runner_kwargs(self, shard_idx: int) -> Dict[str, Any]:
+        """Returns the Runner arguments of the specified worker. The path of
+        the statistics file, if any, is made unique to the worker.
+        """
+        runner_kwargs = dict(self.runner_kwargs)
+        if runner_kwargs.get("metrics_path"):
+            metrics_path = Path(runner_kwargs["metrics_path"])
+            runner_kwargs["metrics_path"] = metrics_path.with_name(
+                f"{metrics_path.stem}_worker{shard_idx}{metrics_path.suffix}"
+            )
+        return runner_kwargs
+
+    def _merge_csv_files(self, csv_paths: List[Tuple[Path, int]]) -> Optional[Path]:
+        """Concatenates the CSV files written by the workers, in worker order,
+        into a single timestamped CSV file and removes the worker files. The
+        specified number of leading rows, i.e., warm-up frames, is dropped
+        from each file.
+        """
+        if not csv_paths:
+            return None
+        file_path = Path(self._get_node_config("output.csv_writer")["file_path"])
+        time_str = datetime.now().strftime("%d%m%y-%H-%M-%S")
+        merged_path = file_path.with_name(f"{file_path.stem}_{time_str}.csv")
+
+        fieldnames: List[str] = []
+        rows: List[Dict[str, str]] = []
+        for csv_path, num_skipped in csv_paths:
+            if not csv_path.exists():
+                continue
+            with open(csv_path, newline="") as csv_file:
+                reader = csv.DictReader(csv_file)
+                for fieldname in reader.fieldnames or []:
+                    if fieldname not in fieldnames:
+                        fieldnames.append(fieldname)
+                rows.extend(list(reader)[num_skipped:])
+            csv_path.unlink()
+        with open(merged_path, "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        return merged_path
+
+    def _stitch_videos(self, video_paths: List[Tuple[Path, int]]) -> Optional[Path]:
+        """Concatenates the videos written by the workers, in worker order,
+        into a single timestamped video and removes the worker videos. The
+        specified number of leading frames, i.e., warm-up frames, is dropped
+        from each video. The frames are re-encoded with the ``mp4v`` codec of
+        ``output.media_writer``.
+        """
+        if not video_paths:
+            return None
+        output_dir = Path(self._get_node_config("output.media_writer")["output_dir"])
+        source_path = Path(self._get_source())
+        time_str = datetime.now().strftime("%y%m%d_%H%M%S")
+        stitched_path = (
+            output_dir / f"{source_path.stem}_{time_str}{source_path.suffix}"
+        )
+
+        writer = None
+        for video_path, num_skipped in video_paths:
+            if not video_path.exists():
+                continue
+            stream = cv2.VideoCapture(str(video_path))
+            frame_idx = 0
+            success, frame = stream.read()
+            while success:
+                if frame_idx >= num_skipped:
+                    if writer is None:
+                        writer = cv2.VideoWriter(
+                            str(stitched_path),
+                            cv2.VideoWriter_fourcc(*"mp4v"),
+                            stream.get(cv2.CAP_PROP_FPS),
+                            (frame.shape[1], frame.shape[0]),
+                        )
+                    writer.write(frame)
+                frame_idx += 1
+                success, frame = stream.read()
+            stream.release()
+            video_path.unlink()
+            if not any(video_path.parent.iterdir()):
+                video_path.parent.rmdir()
+        if writer is None:
+            return None
+        writer.release()
+        return stitched_path
+
+    def _log_summary(self) -> None:
+        """Logs the merged summary of the workers."""
+        for result in self._summary["workers"]:
+            if "error" in result:
+                continue
+            processed = (
+                f"frames {result['frames'][0]} to {result['frames'][1]}"
+                if self.segments
+                else f"{result['num_files']} files"
+            )
+            self.logger.info(
+                f"Worker {result['worker']}: {processed}, "
+                f"{result['num_iterations']} iterations in "
+                f"{result['elapsed']:.2f} sec"
+            )
+        self.logger.info(
+            f"Processed {self._summary['num_files']} files "
+            f"({self._summary['num_iterations']} iterations) with "
+            f"{self.num_workers} workers in {self._summary['elapsed']:.2f} sec"
+        )
+        if self._summary["csv_path"]:
+            self.logger.info(f"Merged CSV file: {self._summary['csv_path']}")
+        if self._summary["video_path"]:
+            self.logger.info(f"Stitched video: {self._summary['video_path']}")
+        if self._summary["failed_workers"]:
+            self.logger.error(f"Failed workers: {self._summary['failed_workers']}")
+
+
+def split_into_shards(files: List[Path], num_shards: int) -> List[List[Path]]:
+    """Splits `files` into at most `num_shards` contiguous shards whose sizes
+    differ by at most one.
+
+    Args:
+        files (:obj:`List[pathlib.Path]`): Files to be processed, in order.
+        num_shards (:obj:`int`): Maximum number of shards.
+
+    Returns:
+        (:obj:`List[List[pathlib.Path]]`): The non-empty shards, in order.
+
+    Raises:
+        ValueError: `files` is empty.
+    """
+    if not files:
+        raise ValueError("No files to process.")
+    return [files[start:end] for start, end in _split_evenly(len(files), num_shards)]
+
+
+def split_into_segments(
+    num_frames: int, num_segments: int, overlap: int
+) -> List[Segment]:
+    """Splits `num_frames` frames of a video into at most `num_segments`
+    contiguous segments whose lengths differ by at most one.
+
+    Args:
+        num_frames (:obj:`int`): Number of frames of the video.
+        num_segments (:obj:`int`): Maximum number of segments.
+        overlap (:obj:`int`): Number of warm-up frames read before the start
+            of each segment, if available.
+
+    Returns:
+        (:obj:`List[Segment]`): The non-empty segments, in order.
+
+    Raises:
+        ValueError: The number of frames is unknown.
+    """
+    if num_frames <= 0:
+        raise ValueError("Unable to determine the number of frames of the video.")
+    return [
+        Segment(start, end, min(start, overlap))
+        for start, end in _split_evenly(num_frames, num_segments)
+    ]
+
+
+def _split_evenly(num_items: int, num_parts: int) -> List[Tuple[int, int]]:
+    """Returns the ``[start, end)`` bounds of at most `num_parts` contiguous
+    non-empty parts of `num_items` items.
+    """
+    num_parts = min(num_parts, num_items)
+    part_size, remainder = divmod(num_items, num_parts)
+    bounds = []
+    start = 0
+    for part_idx in range(num_parts):
+        end = start + part_size + int(part_idx < remainder)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _is_video_file(source: Any) -> bool:
+    """Checks if `source` is the path to a local video file."""
+    return (
+        isinstance(source, str)
+        and Path(source).suffix[1:].lower() in VIDEO_EXTENSIONS
+        and Path(source).is_file()
+    )
+
+
+def _run_shard(
+    pipeline_path: Path,
+    config_updates_cli: str,
+    custom_nodes_parent_subdir: str,
+    log_level: str,
+    runner_kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Runs the pipeline on a single shard or segment in a worker process.
+
+    Returns:
+        (:obj:`Dict[str, Any]`): The ``elapsed`` time in seconds, the number
+        of pipeline iterations ``num_iterations``, and the paths of the CSV
+        files ``csv_paths`` and videos ``video_paths`` written by the worker.
+    """
+    LoggerSetup.set_log_level(log_level)
+    start_time = perf_counter()
+    runner = Runner(
+        pipeline_path=pipeline_path,
+        config_updates_cli=config_updates_cli,
+        custom_nodes_parent_subdir=custom_nodes_parent_subdir,
+        **runner_kwargs,
+    )
+    runner.run()
+    metrics = runner.metrics()
+    return {
+        "elapsed": perf_counter() - start_time,
+        "num_iterations": next(iter(metrics.values()))["count"] if metrics else 0,
+        "csv_paths": [
+            str(node.output_file_path)
+            for node in runner.pipeline.nodes
+            if node.node_name == "output.csv_writer"
+        ],
+        "video_paths": [
+            node.output_file_path
+            for node in runner.pipeline.nodes
+            if node.node_name == "output.media_writer" and node.output_file_path
+        ],
+    }
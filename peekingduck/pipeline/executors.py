@@ -0,0 +1,507 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Alternative execution strategies for running a
+:py:class:`Pipeline <peekingduck.pipeline.pipeline.Pipeline>`.
+"""
+
+import logging
+import queue
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from peekingduck.pipeline.metrics import MetricsRecorder
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.pipeline import Pipeline
+from peekingduck.pipeline.scheduler import FrameScheduler
+
+# Sentinel passed down the stage queues to signal the end of the frame stream
+_END_OF_STREAM = object()
+# Interval (in seconds) at which blocked workers check if they should stop
+_POLL_INTERVAL = 0.1
+
+# A frame is its index, its data pool, and the keys produced for it so far
+Frame = Tuple[int, Dict[str, Any], Set[str]]
+
+
+class PipelinedExecutor:
+    """Runs every node of a pipeline in its own worker thread, with bounded
+    FIFO queues between consecutive stages, so that decoding, inference,
+    drawing and writing of different frames overlap.
+
+    Every stage processes frames strictly in the order produced by the source
+    node, so stateful nodes (e.g., trackers, ``dabble.statistics``) observe
+    the same sequence of frames as in sequential execution. Each frame
+    carries its own data pool, which is handed from one stage to the next.
+
+    Nodes which support batching (see ``AbstractNode.run_batch()``), e.g.,
+    batched model inference, receive up to ``batch_size`` frames at a time.
+    Such a stage waits at most ``batch_timeout`` seconds for a batch to fill
+    up before processing the frames received so far.
+
+    Nodes must not hold on to, and later modify, objects which they have
+    already returned as outputs since frames are processed concurrently by
+    different stages.
+
+    Args:
+        pipeline (:obj:`Pipeline`): The pipeline to run.
+        num_iter (:obj:`int`): Stop pipeline after running this number of
+            iterations. ``0`` runs the pipeline until ``pipeline_end``.
+        queue_size (:obj:`int`): Maximum number of frames buffered between
+            two consecutive stages.
+        metrics (:obj:`MetricsRecorder` | :obj:`None`): If provided, records
+            the statistics of every ``node.run()`` call.
+        batch_size (:obj:`int`): Maximum number of frames passed to nodes
+            which support batching.
+        batch_timeout (:obj:`float`): Maximum time, in seconds, to wait for a
+            batch to fill up.
+        scheduler (:obj:`FrameScheduler` | :obj:`None`): If provided, decides
+            which nodes are skipped on each frame. The skipped nodes' outputs
+            from their previous frame are carried over.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pipeline: Pipeline,
+        num_iter: int = 0,
+        queue_size: int = 4,
+        metrics: Optional[MetricsRecorder] = None,
+        batch_size: int = 1,
+        batch_timeout: float = 0.1,
+        scheduler: Optional[FrameScheduler] = None,
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be a positive integer.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        self.logger = logging.getLogger(__name__)
+        self.pipeline = pipeline
+        self.num_iter = num_iter
+        self.metrics = metrics
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.scheduler = scheduler
+        self.queues: List["queue.Queue[Any]"] = [
+            queue.Queue(maxsize=queue_size) for _ in pipeline.nodes[1:]
+        ]
+        self.num_frames = 0
+        # Index of the frame in which pipeline_end was raised, frames after it
+        # are discarded
+        self._end_frame: Optional[int] = None
+        # Indices of the nodes skipped on each frame in flight
+        self._skipped_nodes: Dict[int, Set[int]] = {}
+        # Time at which the last stage finished the previous frame
+        self._last_frame_time: Optional[float] = None
+        self._error: Optional[BaseException] = None
+        self._stop = Event()
+
+    def run(self) -> int:
+        """Runs the pipeline until ``pipeline_end``, ``num_iter`` frames
+        have been processed, or ``Pipeline.terminate`` is set.
+
+        Returns:
+            (:obj:`int`): Number of frames produced by the source node.
+
+        Raises:
+            Exception: The first exception raised by any of the nodes.
+        """
+        nodes = self.pipeline.nodes
+        workers = [Thread(target=self._run_source, args=(nodes[0],), daemon=True)]
+        for idx, node in enumerate(nodes[1:]):
+            out_queue = self.queues[idx + 1] if idx + 1 < len(self.queues) else None
+            workers.append(
+                Thread(
+                    target=self._run_stage,
+                    args=(idx + 1, self.queues[idx], out_queue),
+                    daemon=True,
+                )
+            )
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                while worker.is_alive():
+                    worker.join(_POLL_INTERVAL)
+        except KeyboardInterrupt:
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+            raise
+        self.pipeline.terminate = True
+        if self._error is not None:
+            raise self._error
+        return self.num_frames
+
+    def _run_source(self, node: AbstractNode) -> None:
+        """Repeatedly runs the source node and feeds each frame's data pool to
+        the first stage queue.
+        """
+        try:
+            while (
+                not self._stop.is_set()
+                and not self.pipeline.terminate
+                and self._end_frame is None
+            ):
+                outputs = self._run_node(node, [{}])[0]
+                if self.pipeline.is_empty_frame(outputs):
+                    continue  # no new frame from the source yet
+                self.num_frames += 1
+                frame: Frame = (self.num_frames, dict(outputs), set(outputs))
+                self.pipeline.release_data(0, frame[1])
+                if self.scheduler is not None and self.scheduler.enabled:
+                    skipped = self.scheduler.plan_frame()
+                    self._skipped_nodes[self.num_frames] = skipped
+                    frame[1]["stale_outputs"] = self.scheduler.get_stale_outputs(
+                        skipped
+                    )
+                if not self._put(frame, self.queues[0] if self.queues else None):
+                    return
+                if outputs.get("pipeline_end", False):
+                    break
+                if 0 < self.num_iter <= self.num_frames:
+                    self.logger.info(
+                        f"Stopping pipeline after {self.num_frames} iterations"
+                    )
+                    break
+            self._put(_END_OF_STREAM, self.queues[0] if self.queues else None)
+        except BaseException as error:  # pylint: disable=broad-except
+            self._fail(error)
+
+    def _run_stage(
+        self,
+        node_idx: int,
+        in_queue: "queue.Queue[Any]",
+        out_queue: Optional["queue.Queue[Any]"],
+    ) -> None:
+        """Runs a non-source node on every frame received from ``in_queue``.
+
+        When a frame signals ``pipeline_end`` and the node does not consume
+        ``pipeline_end``, or the scheduler skips the node on the frame, the
+        node is skipped and its outputs from the previous frame are carried
+        over, mirroring the persistent data pool of sequential execution.
+        Frames which were already in flight when a downstream node raised
+        ``pipeline_end`` are discarded.
+        """
+        node = self.pipeline.nodes[node_idx]
+        batch_size = self.batch_size if node.supports_batching else 1
+        prev_outputs: Dict[str, Any] = {}
+        try:
+            while True:
+                frames, is_end_of_stream = self._get_frames(in_queue, batch_size)
+                if frames is None:
+                    return
+                frames = [frame for frame in frames if not self._is_discarded(frame)]
+                pending = [
+                    frame for frame in frames if not self._is_skipped(node_idx, frame)
+                ]
+                if pending:
+                    batch_outputs = self._run_node(
+                        node, [data for _, data, _ in pending]
+                    )
+                    for frame, outputs in zip(pending, batch_outputs):
+                        if self._is_discarded(frame):
+                            break
+                        frame[1].update(outputs)
+                        frame[2].update(outputs)
+                        prev_outputs = outputs
+                        if outputs.get("pipeline_end", False):
+                            self._end_frame = frame[0]
+                for frame in frames:
+                    if self._is_discarded(frame):
+                        break
+                    if self._is_skipped(node_idx, frame):
+                        _, data, fresh_keys = frame
+                        for key, value in prev_outputs.items():
+                            if key not in fresh_keys:
+                                data[key] = value
+                    self.pipeline.release_data(node_idx, frame[1])
+                    if not self._put(frame, out_queue):
+                        return
+                if is_end_of_stream:
+                    self._put(_END_OF_STREAM, out_queue)
+                    return
+        except BaseException as error:  # pylint: disable=broad-except
+            self._fail(error)
+
+    def _get_frames(
+        self, in_queue: "queue.Queue[Any]", batch_size: int
+    ) -> Tuple[Optional[List[Frame]], bool]:
+        """Receives up to ``batch_size`` frames from ``in_queue``, waiting at
+        most ``batch_timeout`` seconds for the frames after the first.
+
+        Returns:
+            (:obj:`Tuple[List[Frame] | None, bool]`): The received frames, or
+            ``None`` if the executor is stopped while waiting, and whether the
+            end of the frame stream has been reached.
+        """
+        item = self._get(in_queue)
+        if item is None:
+            return None, False
+        if item is _END_OF_STREAM:
+            return [], True
+        frames = [item]
+        deadline = perf_counter() + self.batch_timeout
+        # No more frames follow a frame which signals pipeline_end
+        while len(frames) < batch_size and not frames[-1][1].get(
+            "pipeline_end", False
+        ):
+            timeout = deadline - perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = in_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _END_OF_STREAM:
+                return frames, True
+            frames.append(item)
+        return frames, False
+
+    def _is_discarded(self, frame: Frame) -> bool:
+        """Checks if ``frame`` comes after the frame in which ``pipeline_end``
+        was raised.
+        """
+        return self._end_frame is not None and frame[0] > self._end_frame
+
+    def _is_skipped(self, node_idx: int, frame: Frame) -> bool:
+        """Checks if the node at ``node_idx`` should be skipped for ``frame``,
+        i.e., the frame signals ``pipeline_end`` but the node does not consume
+        it, or the scheduler skips the node on the frame.
+        """
+        if node_idx in self._skipped_nodes.get(frame[0], ()):
+            return True
+        return (
+            frame[1].get("pipeline_end", False)
+            and "pipeline_end" not in self.pipeline.nodes[node_idx].inputs
+        )
+
+    def _run_node(
+        self, node: AbstractNode, frames_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Runs ``node`` with inputs collected from the data pool of each
+        frame, using ``run_batch()`` when there is more than one frame.
+        """
+        inputs = [self.pipeline.get_node_inputs(node, data) for data in frames_data]
+        if len(inputs) == 1:
+            if self.metrics is None:
+                return [node.run(inputs[0])]
+            return [self.metrics.run_node(node, inputs[0])]
+        if self.metrics is None:
+            return node.run_batch(inputs)
+        return self.metrics.run_node_batch(node, inputs)
+
+    def _end_frame_timing(self, index: int) -> None:
+        """Reports the time between the last two frames leaving the pipeline
+        to the scheduler.
+        """
+        if self.scheduler is None or not self.scheduler.enabled:
+            return
+        self._skipped_nodes.pop(index, None)
+        now = perf_counter()
+        if self._last_frame_time is not None:
+            self.scheduler.end_frame(now - self._last_frame_time)
+        self._last_frame_time = now
+
+    def _fail(self, error: BaseException) -> None:
+        """Records the first error raised by a worker and stops all workers."""
+        if self._error is None:
+            self._error = error
+        self._stop.set()
+
+    def _get(self, in_queue: "queue.Queue[Any]") -> Any:
+        """Blocks until an item is available. Returns ``None`` if the executor
+        is stopped while waiting.
+        """
+        while not self._stop.is_set():
+            try:
+                return in_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put(self, item: Any, out_queue: Optional["queue.Queue[Any]"]) -> bool:
+        """Blocks until ``item`` is enqueued. The last stage has no output
+        queue, its frames become the pipeline's data pool instead.
+
+        Returns:
+            (:obj:`bool`): ``False`` if the executor is stopped while waiting.
+        """
+        if out_queue is None:
+            if item is not _END_OF_STREAM:
+                self.pipeline.data = item[1]
+                self._end_frame_timing(item[0])
+            return True
+        while not self._stop.is_set():
+            try:
+                out_queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class ConcurrentExecutor:
+    """Runs the nodes of a pipeline which do not depend on each other
+    concurrently on a thread pool, following the data dependency graph in
+    :py:attr:`Pipeline.dependencies
+    <peekingduck.pipeline.pipeline.Pipeline.dependencies>`.
+
+    Frames are processed one at a time. Since PyTorch and TensorFlow release
+    the GIL during inference, independent models running on the same frame,
+    e.g., ``model.yolo_face`` and ``model.yolo_license_plate``, take close to
+    the latency of the slowest model instead of the sum of their latencies.
+
+    Each node receives the same inputs as in sequential execution: the
+    outputs of the nodes before it, in pipeline order, on top of the data
+    pool of the previous frame.
+
+    Args:
+        pipeline (:obj:`Pipeline`): The pipeline to run.
+        num_iter (:obj:`int`): Stop pipeline after running this number of
+            iterations. ``0`` runs the pipeline until ``pipeline_end``.
+        metrics (:obj:`MetricsRecorder` | :obj:`None`): If provided, records
+            the statistics of every ``node.run()`` call.
+        scheduler (:obj:`FrameScheduler` | :obj:`None`): If provided, decides
+            which nodes are skipped on each frame.
+        max_workers (:obj:`int` | :obj:`None`): Maximum number of nodes
+            running at the same time. Defaults to the number of nodes.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pipeline: Pipeline,
+        num_iter: int = 0,
+        metrics: Optional[MetricsRecorder] = None,
+        scheduler: Optional[FrameScheduler] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.pipeline = pipeline
+        self.num_iter = num_iter
+        self.metrics = metrics
+        self.scheduler = scheduler
+        self.max_workers = max_workers or len(pipeline.nodes)
+        self.dependents: List[List[int]] = [[] for _ in pipeline.nodes]
+        for idx, dependencies in enumerate(pipeline.dependencies):
+            for dependency in dependencies:
+                self.dependents[dependency].append(idx)
+        self.num_frames = 0
+        # Nodes planned to be skipped, kept until a frame is processed
+        self._skipped: Optional[Set[int]] = None
+
+    def run(self) -> int:
+        """Runs the pipeline until ``pipeline_end``, ``num_iter`` frames
+        have been processed, or ``Pipeline.terminate`` is set.
+
+        Returns:
+            (:obj:`int`): Number of frames processed.
+
+        Raises:
+            Exception: The first exception raised by any of the nodes.
+        """
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            while not self.pipeline.terminate:
+                if not self._run_frame(pool):
+                    continue
+                self.num_frames += 1
+                if 0 < self.num_iter <= self.num_frames:
+                    self.logger.info(
+                        f"Stopping pipeline after {self.num_frames} iterations"
+                    )
+                    break
+        return self.num_frames
+
+    def _run_frame(self, pool: ThreadPoolExecutor) -> bool:
+        """Runs every node on one frame, starting each node as soon as the
+        nodes it depends on have finished.
+
+        Returns:
+            (:obj:`bool`): ``False`` if the source node had no new frame, in
+            which case the nodes depending on it are not run and the data pool
+            is left unchanged.
+        """
+        start_time = perf_counter()
+        skipped: Set[int] = set()
+        if self.scheduler is not None and self.scheduler.enabled:
+            if self._skipped is None:
+                self._skipped = self.scheduler.plan_frame()
+            skipped = self._skipped
+            self.pipeline.data["stale_outputs"] = self.scheduler.get_stale_outputs(
+                skipped
+            )
+        outputs: Dict[int, Dict[str, Any]] = {}
+        num_remaining = [len(deps) for deps in self.pipeline.dependencies]
+        ready = [idx for idx, count in enumerate(num_remaining) if count == 0]
+        running: Dict["Future[Dict[str, Any]]", int] = {}
+        while ready or running:
+            for idx in ready:
+                data = self._get_data(outputs, idx)
+                running[pool.submit(self._run_node, idx, data, idx in skipped)] = idx
+            ready = []
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                outputs[idx] = future.result()
+                if idx == 0 and self.pipeline.is_empty_frame(outputs[idx]):
+                    continue
+                for dependent in self.dependents[idx]:
+                    num_remaining[dependent] -= 1
+                    if num_remaining[dependent] == 0:
+                        ready.append(dependent)
+        if self.pipeline.is_empty_frame(outputs[0]):
+            return False
+        for idx in sorted(outputs):
+            self.pipeline.data.update(outputs[idx])
+        for idx in range(len(self.pipeline.nodes)):
+            self.pipeline.release_data(idx)
+        if self.scheduler is not None:
+            self.scheduler.end_frame(perf_counter() - start_time)
+        self._skipped = None
+        return True
+
+    def _get_data(
+        self, outputs: Dict[int, Dict[str, Any]], idx: int
+    ) -> Dict[str, Any]:
+        """Builds the data pool seen by the node at ``idx``. The outputs of
+        the last producer of each of the node's inputs are guaranteed to be
+        available and to take precedence over earlier producers.
+        """
+        data = dict(self.pipeline.data)
+        for producer in sorted(outputs):
+            if producer < idx:
+                data.update(outputs[producer])
+        return data
+
+    def _run_node(
+        self, idx: int, data: Dict[str, Any], is_skipped: bool
+    ) -> Dict[str, Any]:
+        """Runs the node at ``idx`` unless ``pipeline_end`` has been raised
+        and the node does not consume it, or the node is skipped by the
+        scheduler.
+        """
+        node = self.pipeline.nodes[idx]
+        if data.get("pipeline_end", False):
+            self.pipeline.terminate = True
+            if "pipeline_end" not in node.inputs:
+                return {}
+        if is_skipped:
+            return {}
+        inputs = self.pipeline.get_node_inputs(node, data)
+        if self.metrics is None:
+            return node.run(inputs)
+        return self.metrics.run_node(node, inputs)
@@ -0,0 +1,280 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Per-node latency and memory instrumentation for pipeline runs.
+"""
+
+import collections
+import json
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+from time import perf_counter, thread_time
+from typing import Any, Deque, Dict, List, Optional, Union
+
+import numpy as np
+
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+
+METRICS_FORMATS = ["json", "prometheus"]
+QUANTILES = [50, 95, 99]
+
+
+class NodeMetrics:
+    """Accumulates the run statistics of a single node. Quantiles are
+    computed over a rolling window of the most recent calls.
+
+    Args:
+        window (:obj:`int`): Number of most recent calls used to compute the
+            rolling quantiles.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.total_wall_time = 0.0
+        self.total_cpu_time = 0.0
+        self.total_output_bytes = 0
+        self.wall_times: Deque[float] = collections.deque(maxlen=window)
+        self.cpu_times: Deque[float] = collections.deque(maxlen=window)
+        self.output_bytes: Deque[int] = collections.deque(maxlen=window)
+
+    def record(self, wall_time: float, cpu_time: float, output_bytes: int) -> None:
+        """Records the statistics of a single ``node.run()`` call."""
+        self.count += 1
+        self.total_wall_time += wall_time
+        self.total_cpu_time += cpu_time
+        self.total_output_bytes += output_bytes
+        self.wall_times.append(wall_time)
+        self.cpu_times.append(cpu_time)
+        self.output_bytes.append(output_bytes)
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the accumulated statistics. Times are in seconds."""
+        return {
+            "count": self.count,
+            "wall_time": _describe(self.wall_times, self.total_wall_time),
+            "cpu_time": _describe(self.cpu_times, self.total_cpu_time),
+            "output_bytes": _describe(self.output_bytes, self.total_output_bytes),
+        }
+
+
+class MetricsRecorder:
+    """Records wall time, CPU time, and size of outputs of every
+    ``node.run()`` call in a pipeline, and optionally exports the statistics
+    to a file at regular intervals.
+
+    CPU time is measured for the thread calling ``node.run()`` and excludes
+    threads spawned internally by the node, e.g., intra-op threads of the
+    deep learning framework.
+
+    Args:
+        nodes (:obj:`List[AbstractNode]`): The nodes in the pipeline. Nodes
+            sharing the same name are labelled with their position in the
+            pipeline, e.g., ``model.yolox[2]``.
+        window (:obj:`int`): Number of most recent calls used to compute the
+            rolling quantiles of each node.
+        export_path (:obj:`pathlib.Path` | :obj:`str` | :obj:`None`): Path of
+            the file to write the statistics to. Statistics are not exported
+            if ``None``.
+        export_format (:obj:`str`): Either ``"json"`` or ``"prometheus"``
+            (Prometheus text-based exposition format).
+        export_interval (:obj:`float`): Minimum interval, in seconds, between
+            two exports.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        nodes: List[AbstractNode],
+        window: int = 1000,
+        export_path: Optional[Union[Path, str]] = None,
+        export_format: str = "json",
+        export_interval: float = 10.0,
+    ) -> None:
+        if export_format not in METRICS_FORMATS:
+            raise ValueError(
+                f"export_format must be one of {METRICS_FORMATS}, got: {export_format}"
+            )
+        self.logger = logging.getLogger(__name__)
+        self.export_path = None if export_path is None else Path(export_path)
+        self.export_format = export_format
+        self.export_interval = export_interval
+        self.labels: Dict[int, str] = {}
+        self.node_metrics: Dict[str, NodeMetrics] = {}
+
+        names = [node.node_name for node in nodes]
+        for idx, node in enumerate(nodes):
+            label = node.node_name
+            if names.count(label) > 1:
+                label = f"{label}[{idx}]"
+            self.labels[id(node)] = label
+            self.node_metrics[label] = NodeMetrics(window)
+        self._lock = Lock()
+        self._last_export_time = perf_counter()
+
+    def run_node(self, node: AbstractNode, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs ``node`` on ``inputs`` and records the statistics of the
+        call.
+
+        Returns:
+            (:obj:`Dict[str, Any]`): The outputs of ``node.run()``.
+        """
+        start_time = perf_counter()
+        start_cpu_time = thread_time()
+        outputs = node.run(inputs)
+        cpu_time = thread_time() - start_cpu_time
+        wall_time = perf_counter() - start_time
+        self.record(node, wall_time, cpu_time, _get_nbytes(outputs))
+        return outputs
+
+    def run_node_batch(
+        self, node: AbstractNode, inputs: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Runs ``node.run_batch()`` on the inputs of several frames. The
+        time taken is split evenly across the frames in the batch.
+
+        Returns:
+            (:obj:`List[Dict[str, Any]]`): The outputs of
+            ``node.run_batch()``.
+        """
+        start_time = perf_counter()
+        start_cpu_time = thread_time()
+        outputs = node.run_batch(inputs)
+        cpu_time = (thread_time() - start_cpu_time) / len(inputs)
+        wall_time = (perf_counter() - start_time) / len(inputs)
+        for frame_outputs in outputs:
+            self.record(node, wall_time, cpu_time, _get_nbytes(frame_outputs))
+        return outputs
+
+    def record(
+        self, node: AbstractNode, wall_time: float, cpu_time: float, output_bytes: int
+    ) -> None:
+        """Records the statistics of a single ``node.run()`` call and exports
+        the statistics if ``export_interval`` has elapsed since the last
+        export.
+        """
+        with self._lock:
+            self.node_metrics[self.labels[id(node)]].record(
+                wall_time, cpu_time, output_bytes
+            )
+            if (
+                self.export_path is not None
+                and perf_counter() - self._last_export_time >= self.export_interval
+            ):
+                self._export()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the statistics of every node, in pipeline order."""
+        with self._lock:
+            return self._summary()
+
+    def export(self) -> None:
+        """Writes the statistics to ``export_path``."""
+        if self.export_path is None:
+            return
+        with self._lock:
+            self._export()
+
+    def to_json(self) -> str:
+        """Formats the statistics as a JSON string."""
+        return _format_json(self.summary())
+
+    def to_prometheus(self) -> str:
+        """Formats the statistics in the Prometheus text-based exposition
+        format.
+        """
+        return _format_prometheus(self.summary())
+
+    def _export(self) -> None:
+        """Writes the statistics to ``export_path``. The file is replaced
+        atomically so that readers never see a partially written file. Must be
+        called with ``self._lock`` held.
+        """
+        if self.export_format == "json":
+            content = _format_json(self._summary())
+        else:
+            content = _format_prometheus(self._summary())
+        tmp_path = self.export_path.with_name(f".{self.export_path.name}.tmp")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as outfile:
+            outfile.write(content)
+        os.replace(tmp_path, self.export_path)
+        self._last_export_time = perf_counter()
+
+    def _summary(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the statistics of every node. Must be called with
+        ``self._lock`` held.
+        """
+        return {label: metrics.summary() for label, metrics in self.node_metrics.items()}
+
+
+def _describe(values: Deque[Union[float, int]], total: Union[float, int]) -> Dict[str, Any]:
+    """Computes the mean, maximum, and rolling quantiles of ``values``."""
+    stats: Dict[str, Any] = {"total": total}
+    if values:
+        array = np.asarray(values, dtype=float)
+        stats["mean"] = float(array.mean())
+        stats["max"] = float(array.max())
+        for quantile, value in zip(QUANTILES, np.percentile(array, QUANTILES)):
+            stats[f"p{quantile}"] = float(value)
+    else:
+        stats.update({"mean": 0.0, "max": 0.0})
+        stats.update({f"p{quantile}": 0.0 for quantile in QUANTILES})
+    return stats
+
+
+def _format_json(summary: Dict[str, Dict[str, Any]]) -> str:
+    """Formats the node statistics as a JSON string."""
+    return json.dumps({"nodes": summary}, indent=2)
+
+
+def _format_prometheus(summary: Dict[str, Dict[str, Any]]) -> str:
+    """Formats the node statistics in the Prometheus text-based exposition
+    format.
+    """
+    lines = []
+    for metric, key, help_text in [
+        ("latency_seconds", "wall_time", "Wall time of node.run() calls."),
+        ("cpu_seconds", "cpu_time", "CPU time of node.run() calls."),
+        ("output_bytes", "output_bytes", "Size of the outputs of node.run() calls."),
+    ]:
+        name = f"peekingduck_node_{metric}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} summary")
+        for label, stats in summary.items():
+            for quantile in QUANTILES:
+                lines.append(
+                    f'{name}{{node="{label}",quantile="{quantile / 100}"}} '
+                    f"{stats[key][f'p{quantile}']}"
+                )
+            lines.append(f'{name}_sum{{node="{label}"}} {stats[key]["total"]}')
+            lines.append(f'{name}_count{{node="{label}"}} {stats["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def _get_nbytes(value: Any) -> int:
+    """Estimates the number of bytes held by numpy arrays, strings, and
+    containers thereof in ``value``.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_get_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_get_nbytes(item) for item in value)
+    return 0
@@ -35,7 +35,7 @@ import collections
 import logging
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from typeguard import check_type
 
@@ -56,6 +56,11 @@ class AbstractNode(metaclass=ABCMeta):
             ``peekingduck`` directory.
     """
 
+    # Scheduling configs accepted by every node, see
+    # peekingduck.pipeline.scheduler.FrameScheduler
+    run_every: int = 1
+    latency_budget: Optional[float] = None
+
     def __init__(
         self,
         config: Dict[str, Any] = None,
@@ -74,6 +79,16 @@ class AbstractNode(metaclass=ABCMeta):
         # This is only initialized when the `optional_inputs` key is found in
         # the nodes' config file
         self.optional_inputs: List[str]
+        # Outputs which are only produced on frames where the node's inputs
+        # are stale. Added to the node's outputs by Pipeline when the
+        # producers of its inputs may be skipped. This is only initialized
+        # when the `propagated_outputs` key is found in the nodes' config file
+        self.propagated_outputs: List[str]
+
+        # Outputs which are not consumed by any node in the pipeline. Nodes
+        # may skip computing (and returning) these outputs. Set by Pipeline
+        # when it is created with `release_outputs=True`
+        self.unused_outputs: Set[str] = set()
 
         # NOTE: ``config`` and ``kwargs_config`` are similar but are from
         # different inputs. ``config`` is when users input a dictionary to
@@ -101,6 +116,47 @@ class AbstractNode(metaclass=ABCMeta):
         """abstract method needed for running node"""
         raise NotImplementedError("This method needs to be implemented")
 
+    def run_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Runs the node on the inputs of several consecutive frames.
+
+        Nodes which can process several frames more efficiently in a single
+        call, e.g., batched model inference, should override this method. The
+        default implementation calls ``run()`` on each frame's inputs in turn.
+
+        Args:
+            inputs (:obj:`List[Dict[str, Any]]`): Inputs of each frame, in
+                frame order.
+
+        Returns:
+            (:obj:`List[Dict[str, Any]]`): Outputs of each frame, in frame
+            order.
+        """
+        return [self.run(frame_inputs) for frame_inputs in inputs]
+
+    def warm_up(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs the node on synthetic inputs before the first frame, so that
+        lazy allocations, graph tracing, and kernel selection do not stall the
+        first frame. The default implementation calls ``run()``.
+
+        Nodes which keep state across frames, e.g., trackers, should override
+        this method to discard the state created by the synthetic inputs.
+
+        Args:
+            inputs (:obj:`Dict[str, Any]`): Synthetic inputs, e.g., a blank
+                ``img`` of the input resolution.
+
+        Returns:
+            (:obj:`Dict[str, Any]`): Outputs of the node.
+        """
+        return self.run(inputs)
+
+    @property
+    def supports_batching(self) -> bool:
+        """Whether the node overrides ``run_batch()`` to process several
+        frames in a single call.
+        """
+        return type(self).run_batch is not AbstractNode.run_batch
+
     # pylint: disable=R0201, W0107
     def release_resources(self) -> None:
         """To gracefully release any acquired system resources, e.g. webcam
@@ -30,18 +30,19 @@
 """Mixin classes for PeekingDuck nodes and models."""
 
 import hashlib
+import json
 import operator
 import os
 import re
-import sys
-import zipfile
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Union
-
-import requests
-from tqdm import tqdm
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from dotenv import load_dotenv
+
+from peekingduck.utils.downloader import Downloader, extract_zip, read_json
+
 load_dotenv()
 
 
@@ -50,7 +51,8 @@ load_dotenv()
 WEIGHTS_PARENT_DIR = os.getenv(
     "PEEKINGDUCK_DIR", None
 )
-# 2. URL to download the original PKD model weights from.
+# 2. URL to download the original PKD model weights from. May also be a local
+#    mirror directory or a `file://` URL.
 BASE_URL = os.getenv(
     "BASE_URL", "https://storage.googleapis.com/peekingduck/models"
 )
@@ -58,6 +60,17 @@ BASE_URL = os.getenv(
 PEEKINGDUCK_WEIGHTS_SUBDIR = os.getenv(
     "PEEKINGDUCK_WEIGHTS_SUBDIR", "peekingduck_weights"
 )
+# 4. Path of a local weights checksum manifest, e.g., for air-gapped hosts.
+#    Defaults to the copy saved in `peekingduck_weights/` by the last download.
+WEIGHTS_CHECKSUMS_PATH = os.getenv("PEEKINGDUCK_WEIGHTS_CHECKSUMS", None)
+
+# Files in `peekingduck_weights/` storing the checksum manifest and the
+# signatures and digests of the weights which were verified against it
+WEIGHTS_CHECKSUMS_FILENAME = "weights_checksums.json"
+WEIGHTS_VERIFIED_FILENAME = "weights_verified.json"
+IGNORED_FILENAMES = {".DS_Store", "__MACOSX"}
+# Serializes updates to `weights_verified.json` by nodes loading in parallel
+_VERIFIED_LOCK = threading.Lock()
 
 
 class ThresholdCheckerMixin:
@@ -258,6 +271,9 @@ class WeightsDownloaderMixin:
 
         Returns:
             (Path): Path to the directory where the model's weights are stored.
+
+        Raises:
+            ValueError: The downloaded weights do not match their checksum.
         """
         model_dir = self._find_paths()
         if self._has_weights(model_dir):
@@ -268,6 +284,11 @@ class WeightsDownloaderMixin:
         model_dir.mkdir(parents=True, exist_ok=True)
         self._download_to(self.blob_filename, model_dir)
         self._extract_file(model_dir)
+        if not self._has_weights(model_dir):
+            raise ValueError(
+                f"Downloaded weights in {model_dir} do not match their checksum. "
+                "Please try again."
+            )
         if self.classes_filename is not None:
             self._download_to(self.classes_filename, model_dir)
 
@@ -276,21 +297,19 @@ class WeightsDownloaderMixin:
         return model_dir
 
     def _download_to(self, filename: str, destination_dir: Path) -> None:
-        """Downloads publicly shared files from Google Cloud Platform.
+        """Downloads publicly shared files from Google Cloud Platform, or
+        copies them from the local mirror at ``BASE_URL``.
 
-        Saves download content in chunks. Chunk size set to large integer as
-        weights are usually pretty large.
+        Large files are downloaded over parallel range requests and resumed
+        from the completed ranges if interrupted.
 
         Args:
             destination_dir (Path): Destination directory of downloaded file.
         """
-        with open(destination_dir / filename, "wb") as outfile, requests.get(
+        Downloader().download(
             f"{BASE_URL}/{self.model_subdir}/{self.config['model_format']}/{filename}",
-            stream=True,
-        ) as response:
-            for chunk in tqdm(response.iter_content(chunk_size=32768)):
-                if chunk:  # filter out keep-alive new chunks
-                    outfile.write(chunk)
+            destination_dir / filename,
+        )
 
     def _extract_file(self, destination_dir: Path) -> None:
         """Extracts the zip file to ``destination_dir``.
@@ -299,10 +318,7 @@ class WeightsDownloaderMixin:
             destination_dir (Path): Destination directory for extraction.
         """
         zip_path = destination_dir / self.blob_filename
-        with zipfile.ZipFile(zip_path, "r") as infile:
-            file_list = infile.namelist()
-            for file in tqdm(file=sys.stdout, iterable=file_list, total=len(file_list)):
-                infile.extract(member=file, path=destination_dir)
+        extract_zip(zip_path, destination_dir)
 
         os.remove(zip_path)
 
@@ -344,13 +360,50 @@ class WeightsDownloaderMixin:
             / self.config["model_format"]
         )
 
-    def _get_weights_checksum(self) -> str:
-        with requests.get(f"{BASE_URL}/weights_checksums.json") as response:
-            checksums = response.json()
-        self.logger.debug(f"weights_checksums: {checksums[self.model_subdir]}")
-        return checksums[self.model_subdir][self.config["model_format"]][
-            str(self.config["model_type"])
+    def _get_weights_checksum(
+        self, weights_root: Optional[Path] = None, refresh: bool = False
+    ) -> Tuple[str, bool]:
+        """Looks up the expected SHA256 checksum of the selected weights.
+
+        The local manifest, either `PEEKINGDUCK_WEIGHTS_CHECKSUMS` or the copy
+        saved in ``weights_root``, is used if it contains the weights. The
+        manifest is otherwise fetched from ``BASE_URL`` and saved to
+        ``weights_root``.
+
+        Args:
+            weights_root (Optional[Path]): The `peekingduck_weights`
+                directory.
+            refresh (bool): If ``True``, skips the copy saved in
+                ``weights_root`` and fetches the manifest again.
+
+        Returns:
+            (Tuple[str, bool]): The expected checksum and whether it was read
+            from the copy saved in ``weights_root``.
+        """
+        keys = [
+            self.model_subdir,
+            self.config["model_format"],
+            str(self.config["model_type"]),
         ]
+        local_paths = []
+        if WEIGHTS_CHECKSUMS_PATH is not None:
+            local_paths.append(Path(WEIGHTS_CHECKSUMS_PATH))
+        if weights_root is not None and not refresh:
+            local_paths.append(weights_root / WEIGHTS_CHECKSUMS_FILENAME)
+        for manifest_path in local_paths:
+            checksum = _get_nested(_load_json(manifest_path), keys)
+            if checksum is not None:
+                self.logger.debug(f"Using weights checksum from {manifest_path}")
+                is_cached = weights_root is not None and manifest_path == (
+                    weights_root / WEIGHTS_CHECKSUMS_FILENAME
+                )
+                return checksum, is_cached
+
+        checksums = read_json(f"{BASE_URL}/{WEIGHTS_CHECKSUMS_FILENAME}")
+        self.logger.debug(f"weights_checksums: {checksums[self.model_subdir]}")
+        if weights_root is not None:
+            _save_json(weights_root / WEIGHTS_CHECKSUMS_FILENAME, checksums)
+        return _get_nested(checksums, keys), False
 
     def _has_weights(self, model_dir: Path) -> bool:
         """Checks if the specified weights file is present in the model
@@ -368,11 +421,54 @@ class WeightsDownloaderMixin:
         if not weights_path.exists():
             self.logger.warning("No weights detected.")
             return False
-        if self.sha256sum(weights_path).hexdigest() != self._get_weights_checksum():
+        weights_root = model_dir.parents[1]
+        verified_path = weights_root / WEIGHTS_VERIFIED_FILENAME
+        signature = self.file_signature(weights_path)
+        checksum, is_cached = self._get_weights_checksum(weights_root)
+        # weights which are unchanged since they were last verified against
+        # the same checksum are not hashed again
+        verified_entry = _load_json(verified_path).get(str(weights_path))
+        if verified_entry == {"signature": signature, "digest": checksum}:
+            return True
+        digest = self.sha256sum(weights_path).hexdigest()
+        if digest != checksum and is_cached:
+            # the saved manifest predates any weights updated since, refetch it
+            # once and keep using the saved copy when offline
+            try:
+                checksum, _ = self._get_weights_checksum(weights_root, refresh=True)
+            except (OSError, ValueError) as error:
+                self.logger.debug(f"Failed to refresh weights checksums: {error}")
+        if digest != checksum:
             self.logger.warning("Weights file is corrupted/out-of-date.")
             return False
+        with _VERIFIED_LOCK:
+            verified = _load_json(verified_path)
+            verified[str(weights_path)] = {"signature": signature, "digest": digest}
+            _save_json(verified_path, verified)
         return True
 
+    @staticmethod
+    def file_signature(path: Path) -> str:
+        """Summarizes the size, modification time, and inode number of the
+        specified file, or of every file in the specified directory. The
+        signature changes whenever the content is modified or replaced.
+
+        Args:
+            path (Path): Path to the file or directory.
+
+        Returns:
+            (str): The signature of the file/directory.
+        """
+        if path.is_dir():
+            signatures = [
+                f"{subpath.name}/{WeightsDownloaderMixin.file_signature(subpath)}"
+                for subpath in sorted(path.iterdir())
+                if subpath.name not in IGNORED_FILENAMES
+            ]
+            return hashlib.sha256("\n".join(signatures).encode()).hexdigest()
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}"
+
     @staticmethod
     def sha256sum(path: Path, hash_func: "hashlib._Hash" = None) -> "hashlib._Hash":
         """Hashes the specified file/directory using SHA256. Reads the file in
@@ -394,7 +490,7 @@ class WeightsDownloaderMixin:
 
         if path.is_dir():
             for subpath in sorted(path.iterdir()):
-                if subpath.name not in {".DS_Store", "__MACOSX"}:
+                if subpath.name not in IGNORED_FILENAMES:
                     hash_func = WeightsDownloaderMixin.sha256sum(subpath, hash_func)
         else:
             buffer_size = hash_func.block_size * 1024
@@ -402,3 +498,41 @@ class WeightsDownloaderMixin:
                 for chunk in iter(lambda: infile.read(buffer_size), b""):
                     hash_func.update(chunk)
         return hash_func
+
+
+def _get_nested(content: Dict[str, Any], keys: List[str]) -> Any:
+    """Returns the value of the nested dictionary ``content`` at ``keys``, or
+    None if any of the keys is missing.
+    """
+    for key in keys:
+        if not isinstance(content, dict) or key not in content:
+            return None
+        content = content[key]
+    return content
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    """Loads the JSON file at ``path``, or returns an empty dictionary if the
+    file is missing or unreadable.
+    """
+    try:
+        with open(path) as infile:
+            content = json.load(infile)
+    except (OSError, ValueError):
+        return {}
+    return content if isinstance(content, dict) else {}
+
+
+def _save_json(path: Path, content: Dict[str, Any]) -> None:
+    """Saves ``content`` to the JSON file at ``path``. Writes to a temporary
+    file first as other processes may be reading ``path``.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, delete=False, suffix=".tmp"
+        ) as outfile:
+            json.dump(content, outfile, indent=2)
+        os.replace(outfile.name, path)
+    except OSError:
+        pass
@@ -15,7 +15,7 @@
 
 """🎯 Performs multiple object tracking for detected bboxes."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 from peekingduck.pipeline.nodes.dabble.bot_sortv1.detection_tracker import (
@@ -42,6 +42,9 @@ class Node(AbstractNode):
         |bboxes_labels_data|
         |bboxes_scores_data|   
 
+        If the frames carry a :term:`source_id`, e.g., from
+        :mod:`input.multi_visual`, each source is tracked separately.
+
 
     Configs:
         track_high_thresh (:obj:`float`): **[0, 1], default=0.6**. |br|
@@ -57,6 +60,11 @@ class Node(AbstractNode):
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
         self.tracker = DetectionTracker(self.config)
+        self._last_outputs: Dict[str, Any] = {}
+        # Trackers and last outputs of the sources other than the current
+        # one, by source_id
+        self._source_id: Any = None
+        self._source_states: Dict[Any, Tuple[DetectionTracker, Dict]] = {}
 
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -74,15 +82,22 @@ class Node(AbstractNode):
         reset_model = metadata.get("reset_model", False)
         if reset_model:
             self._reset_model()
+        self._switch_source(inputs.get("source_id"))
+
+        if "bboxes" in inputs.get("stale_outputs", set()) and self._last_outputs:
+            # The object detector was skipped on this frame, hold the tracks
+            # from the last frame with detections
+            return self._last_outputs
 
         outputs = self.tracker.track_detections(inputs)
 
-        return {
+        self._last_outputs = {
             "obj_attrs": {"ids": outputs.get("ids")},
             "bboxes": outputs.get("bboxes"),
             "bbox_labels": outputs.get("bbox_labels"),
             "bbox_scores": outputs.get("bbox_scores"),
         }
+        return self._last_outputs
     
 
     def _get_config_types(self) -> Dict[str, Any]:
@@ -101,3 +116,17 @@ class Node(AbstractNode):
         """Creates a new instance of DetectionTracker."""
         self.logger.info(f"Creating new BoT-SORT tracker...")
         self.tracker = DetectionTracker(self.config)
+        self._last_outputs = {}
+        self._source_states = {}
+
+    def _switch_source(self, source_id: Any) -> None:
+        """Swaps in the tracker of the input source `source_id`, creating it
+        on its first frame, so that tracks are never matched across sources.
+        """
+        if source_id == self._source_id:
+            return
+        self._source_states[self._source_id] = (self.tracker, self._last_outputs)
+        self.tracker, self._last_outputs = self._source_states.pop(
+            source_id, (DetectionTracker(self.config), {})
+        )
+        self._source_id = source_id
@@ -32,7 +32,7 @@ of interest over time.
 """
 
 import operator
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 from peekingduck.pipeline.nodes.dabble.statisticsv1 import utils
@@ -151,6 +151,10 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         there are no detections in the following 500 frames, :term:`cum_avg` is
         still 10 for video frame 501.
 
+        If the frames carry a :term:`source_id`, e.g., from
+        :mod:`input.multi_visual`, the statistics of each source are
+        calculated separately.
+
         |cum_max_data|
 
         |cum_min_data|
@@ -186,6 +190,10 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         super().__init__(config, node_path=__name__, **kwargs)
         self.cum_avg, self.cum_min, self.cum_max = 0.0, float("inf"), float("-inf")
         self.num_iter = 0
+        # cum_avg, cum_min, cum_max, and num_iter of the sources other than the
+        # current one, by source_id
+        self._source_id: Any = None
+        self._source_stats: Dict[Any, Tuple[float, float, float, int]] = {}
         all_funcs = {
             "cond_count": self.cond_count,
             "identity": self.identity,
@@ -206,6 +214,7 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
             outputs (dict): Dictionary with keys "cum_avg", "cum_min" and "cum_max".
         """
 
+        self._switch_source(inputs.get("source_id"))
         self.curr = self.stats.get_curr_result(inputs[self.data_type], self.keys.copy())
 
         # if no detections in this frame, do not update and return stats from previous detections
@@ -228,6 +237,21 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
             "cond_count": Optional[str],
         }
 
+    def _switch_source(self, source_id: Any) -> None:
+        """Swaps in the statistics of the input source `source_id`."""
+        if source_id == self._source_id:
+            return
+        self._source_stats[self._source_id] = (
+            self.cum_avg,
+            self.cum_min,
+            self.cum_max,
+            self.num_iter,
+        )
+        self.cum_avg, self.cum_min, self.cum_max, self.num_iter = (
+            self._source_stats.pop(source_id, (0.0, float("inf"), float("-inf"), 0))
+        )
+        self._source_id = source_id
+
     def _update_stats(self, curr: Union[float, int]) -> None:
         """Updates the cum_avg, cum_min and cum_max values with the current value."""
         if not isinstance(curr, (float, int)):
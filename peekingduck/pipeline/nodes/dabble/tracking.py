@@ -29,12 +29,20 @@
 
 """🎯 Performs multiple object tracking for detected bboxes."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 from peekingduck.pipeline.nodes.dabble.trackingv1.detection_tracker import (
     DetectionTracker,
 )
+from peekingduck.pipeline.nodes.dabble.trackingv1.tracking_files.utils import (
+    tlwh2xyxyn,
+)
+
+# Label and score of tracks which do not have a detection label and score
+UNKNOWN_TRACK_ATTRS = ("", 0.0)
 
 
 class Node(AbstractNode):
@@ -58,6 +66,22 @@ class Node(AbstractNode):
         :mod:`dabble.tracking` produces the ``ids`` attribute which contains
         the tracking IDs of the detections.
 
+        |bboxes_data|
+
+        |bbox_labels_data|
+
+        |bbox_scores_data|
+
+        The bboxes are only output when the upstream object detector sets
+        ``run_every`` or ``latency_budget``, and only updated on the frames
+        where the detector is skipped. The tracked bboxes are then propagated
+        to the frame, by the MOSSE tracker, or held at their last detected
+        position, by the IOU tracker. Nodes which read ``bboxes`` after
+        :mod:`dabble.tracking` then run after it.
+
+        If the frames carry a :term:`source_id`, e.g., from
+        :mod:`input.multi_visual`, each source is tracked separately.
+
 
     Configs:
         tracking_type (:obj:`str`): **{"iou", "mosse"}, default="iou"**. |br|
@@ -74,6 +98,12 @@ class Node(AbstractNode):
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
         self.tracker = DetectionTracker(self.config)
+        # Label and score of the latest detection of each track
+        self._track_attrs: Dict[int, Tuple[Any, Any]] = {}
+        # Trackers and track attributes of the sources other than the current
+        # one, by source_id
+        self._source_id: Any = None
+        self._source_states: Dict[Any, Tuple[DetectionTracker, Dict]] = {}
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Tracks detection bounding boxes.
@@ -92,8 +122,21 @@ class Node(AbstractNode):
         reset_model = metadata["reset_model"]
         if reset_model:
             self._reset_model()
+        self._switch_source(inputs.get("source_id"))
+
+        if "bboxes" in inputs.get("stale_outputs", set()):
+            # The object detector was skipped on this frame
+            return self._propagate_tracks(inputs["img"])
 
         track_ids = self.tracker.track_detections(inputs)
+        if "bbox_labels" in inputs and "bbox_scores" in inputs:
+            self._track_attrs.update(
+                zip(track_ids, zip(inputs["bbox_labels"], inputs["bbox_scores"]))
+            )
+            active_track_ids = set(self.tracker.track_ids)
+            for track_id in list(self._track_attrs):
+                if track_id not in active_track_ids:
+                    del self._track_attrs[track_id]
 
         return {"obj_attrs": {"ids": track_ids}}
 
@@ -101,7 +144,47 @@ class Node(AbstractNode):
         """Returns dictionary mapping the node's config keys to respective types."""
         return {"tracking_type": str, "iou_threshold": float, "max_lost": int}
 
+    def _propagate_tracks(self, frame: np.ndarray) -> Dict[str, Any]:
+        """Propagates the existing tracks to a frame without new detections.
+
+        Args:
+            frame (np.ndarray): Image frame parsed from video.
+
+        Returns:
+            outputs (Dict[str, Any]): Tracking IDs and bboxes of the tracks,
+            along with the labels and scores of their latest detections.
+        """
+        track_ids, tlwhs = self.tracker.propagate_tracks(frame)
+        bboxes = np.clip(tlwh2xyxyn(tlwhs, *frame.shape[:2]), 0, 1)
+        # Tracks without a detection label and score, e.g., when the upstream
+        # detector does not output them, are given placeholders so the labels
+        # and scores stay aligned with the bboxes
+        attrs = [
+            self._track_attrs.get(track_id, UNKNOWN_TRACK_ATTRS)
+            for track_id in track_ids
+        ]
+        return {
+            "obj_attrs": {"ids": track_ids},
+            "bboxes": bboxes,
+            "bbox_labels": np.array([label for label, _ in attrs]),
+            "bbox_scores": np.array([score for _, score in attrs]),
+        }
+
     def _reset_model(self) -> None:
         """Creates a new instance of DetectionTracker."""
         self.logger.info(f"Creating new {self.config['tracking_type']} tracker...")
         self.tracker = DetectionTracker(self.config)
+        self._track_attrs = {}
+        self._source_states = {}
+
+    def _switch_source(self, source_id: Any) -> None:
+        """Swaps in the tracker of the input source `source_id`, creating it
+        on its first frame, so that tracks are never matched across sources.
+        """
+        if source_id == self._source_id:
+            return
+        self._source_states[self._source_id] = (self.tracker, self._track_attrs)
+        self.tracker, self._track_attrs = self._source_states.pop(
+            source_id, (DetectionTracker(self.config), {})
+        )
+        self._source_id = source_id
@@ -30,7 +30,9 @@
 """Tracker for object detector bounding boxes."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 from peekingduck.pipeline.nodes.base import ThresholdCheckerMixin
 from peekingduck.pipeline.nodes.dabble.trackingv1.tracking_files.iou_tracker import (
@@ -94,3 +96,21 @@ class DetectionTracker(ThresholdCheckerMixin):  # pylint: disable=too-few-public
         """
         track_ids = self.tracker.track_detections(inputs)
         return track_ids
+
+    def propagate_tracks(self, frame: np.ndarray) -> Tuple[List[int], np.ndarray]:
+        """Propagates the existing tracks to a frame without detections, e.g.,
+        when the upstream object detector was skipped.
+
+        Args:
+            frame (np.ndarray): Image frame parsed from video.
+
+        Returns:
+            (Tuple[List[int], np.ndarray]): Track IDs and their bboxes with
+                (t, l, w, h) format.
+        """
+        return self.tracker.propagate_tracks(frame)
+
+    @property
+    def track_ids(self) -> List[int]:
+        """IDs of all tracks which are currently kept by the tracker."""
+        return list(self.tracker.tracks.keys())
@@ -104,6 +104,24 @@ class IOUTracker:
 
         return track_ids
 
+    def propagate_tracks(
+        self, frame: np.ndarray  # pylint: disable=unused-argument
+    ) -> Tuple[List[int], np.ndarray]:
+        """Holds the tracked bboxes on a frame without detections. The IoU
+        tracker does not use image information, so the tracks keep their
+        last detected bboxes and are not counted as lost.
+
+        Args:
+            frame (np.ndarray): Image frame parsed from video.
+
+        Returns:
+            (Tuple[List[int], np.ndarray]): Track IDs and their bboxes with
+                (t, l, w, h) format.
+        """
+        tracks = self._get_tracks()
+        bboxes = np.array([track.bbox for track in tracks])
+        return [track.track_id for track in tracks], bboxes.reshape(-1, 4)
+
     def update(self, detections: np.ndarray) -> List[Track]:
         """Updates the tracker. Creates new tracks for untracked objects,
         updates tracked objects with the new class ID and bounding box
@@ -83,6 +83,21 @@ class OpenCVTracker:  # pylint: disable=too-few-public-methods
 
         return obj_track_ids
 
+    def propagate_tracks(self, frame: np.ndarray) -> Tuple[List[int], np.ndarray]:
+        """Updates the tracked bboxes on a frame without detections.
+
+        Args:
+            frame (np.ndarray): Image frame parsed from video.
+
+        Returns:
+            (Tuple[List[int], np.ndarray]): Track IDs and their bboxes with
+                (t, l, w, h) format.
+        """
+        self._update_tracker_bboxes(frame)
+        track_ids = list(self.tracks.keys())
+        bboxes = np.array([self.tracks[track_id].bbox for track_id in track_ids])
+        return track_ids, bboxes.reshape(-1, 4)
+
     def _initialize_tracker(self, frame: np.ndarray, bbox: np.ndarray) -> None:
         """Starts a tracker for each bbox.
 
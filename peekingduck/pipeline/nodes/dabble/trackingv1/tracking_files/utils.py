@@ -122,3 +122,25 @@ def xyxyn2tlwh(inputs: np.ndarray, height: int, width: int) -> np.ndarray:
     outputs[:, 2] = (inputs[:, 2] - inputs[:, 0]) * width  # Top right x
     outputs[:, 3] = (inputs[:, 3] - inputs[:, 1]) * height  # Top right y
     return outputs
+
+
+def tlwh2xyxyn(inputs: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Converts bounding boxes format from (t, l, w, h) to (x1, y2, x2, y2).
+    This is the inverse of :func:`xyxyn2tlwh`.
+
+    Args:
+        inputs (np.ndarray): Bounding box coordinates with (t, l, w, h)
+            format.
+        height (int): Original height of bounding box.
+        width (int): Original width of bounding box.
+
+    Returns:
+        (np.ndarray): Converted bounding box coordinates with normalized
+            (x1, y1, x2, y2) format.
+    """
+    outputs = np.empty_like(inputs, dtype=float)
+    outputs[:, 0] = inputs[:, 0] / width
+    outputs[:, 1] = inputs[:, 1] / height
+    outputs[:, 2] = (inputs[:, 0] + inputs[:, 2]) / width
+    outputs[:, 3] = (inputs[:, 1] + inputs[:, 3]) / height
+    return outputs
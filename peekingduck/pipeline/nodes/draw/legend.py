@@ -108,6 +108,9 @@ class Node(AbstractNode):
             outputs (dict): Dictionary with keys "none".
         """
         _check_data_type(inputs, self.show)
+        if not inputs["img"].flags.writeable:
+            # The data pool is read-only for nodes with "all" as input
+            inputs["img"] = inputs["img"].copy()
         self.legend.draw(inputs)
         # cv2 weighted does not update the referenced image. Need to return and replace.
         return {"img": inputs["img"]}
@@ -0,0 +1,133 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Replays decoded frames from a memory-mapped frame file, without decoding
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.nodes.input.utils.frame_file import open_frame_file
+
+
+class Node(AbstractNode):
+    r"""Receives frames from a ``.npy`` or raw BGR frame file of N×H×W×3
+    ``uint8`` pixels. The file is memory-mapped and each frame is output as a
+    view of the mapping, so frames are neither decoded nor copied. This
+    separates the throughput of the rest of the pipeline, e.g., model
+    inference and postprocessing, from video decoding, for reproducible
+    benchmarks.
+
+    A video is converted once into a frame file with
+    ``scripts/benchmarks/video_to_frames.py``. Frame files are large, e.g.,
+    about 2.7 MB per 1280 by 720 frame, and are best kept on a local disk.
+
+    Inputs:
+        |none_input_data|
+
+    Outputs:
+        |img_data|
+
+        |filename_data|
+
+        |pipeline_end_data|
+
+        |saved_video_fps_data|
+
+    Configs:
+        source (:obj:`str`): **default = "frames.npy"**. |br|
+            Path of the frame file: |br|
+            - ``.npy`` : NumPy array of shape (N, H, W, 3) |br|
+            - ``.bgr`` or ``.raw`` : BGR pixels of the frames back to back,
+            of the size given by ``frame_width`` and ``frame_height``
+        frame_width (:obj:`int`): **default = 0**. |br|
+            Width of the frames of a raw frame file. Not used for ``.npy``
+            files.
+        frame_height (:obj:`int`): **default = 0**. |br|
+            Height of the frames of a raw frame file. Not used for ``.npy``
+            files.
+        read_only (:obj:`bool`): **default = True**. |br|
+            If True, frames are read-only views of the file and nodes which
+            draw on ``img`` in place fail. Set to False to allow such nodes:
+            the pages of the frames which are modified are then copied in
+            memory, and never written back to the file.
+        filename (:obj:`str`): **default = "video.mp4"**. |br|
+            Name of the MP4 file if the media is exported.
+        saved_video_fps (:obj:`int`): **default = 10**. |br|
+            FPS of the output file, as frame files do not store the FPS of
+            the video they were converted from.
+        frames_log_freq (:obj:`int`): **default = 100**. [1]_ |br|
+            Logs frequency of frames passed in CLI
+
+    .. [1] advanced configuration
+    """
+
+    def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
+        super().__init__(config, node_path=__name__, **kwargs)
+        path = Path(self.source)
+        if not path.exists():
+            raise FileNotFoundError(f"Path '{path}' does not exist")
+        self.frames: Optional[np.ndarray] = open_frame_file(
+            path, self.frame_width, self.frame_height, self.read_only
+        )
+        self.frame_counter: int = 0
+        self.total_frame_count: int = len(self.frames)
+        num_frames, height, width, _ = self.frames.shape
+        self.logger.info(
+            f"Frame file: {path}, {num_frames} frames of {width} by {height}"
+        )
+
+    def release_resources(self) -> None:
+        """Override base class method to unmap the frame file"""
+        self.frames = None
+
+    @property
+    def frame_size(self) -> Optional[Tuple[int, int]]:
+        """(width, height) of the frames this node outputs."""
+        if self.frames is None:
+            return None
+        return self.frames.shape[2], self.frames.shape[1]
+
+    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        outputs = {
+            "img": None,
+            "filename": self.filename,
+            "pipeline_end": True,
+            "saved_video_fps": self.saved_video_fps,
+        }
+        if self.frames is not None and self.frame_counter < self.total_frame_count:
+            # np.asarray drops the np.memmap subclass without copying
+            outputs["img"] = np.asarray(self.frames[self.frame_counter])
+            outputs["pipeline_end"] = False
+            self.frame_counter += 1
+            if self.frame_counter % self.frames_log_freq == 0:
+                self.logger.info(f"Frames Processed: {self.frame_counter}")
+        return outputs
+
+    def _get_config_types(self) -> Dict[str, Any]:
+        """Returns dictionary mapping the node's config keys to respective types."""
+        return {
+            "filename": str,
+            "frame_height": int,
+            "frame_width": int,
+            "frames_log_freq": int,
+            "read_only": bool,
+            "saved_video_fps": int,
+            "source": str,
+        }
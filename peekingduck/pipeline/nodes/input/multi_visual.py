@@ -0,0 +1,270 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Reads inputs from several visual sources, e.g., multiple CCTV or webcam live
+feeds, into a single pipeline
+"""
+
+from collections import deque
+from pathlib import Path
+from threading import Event
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.nodes.input.utils.preprocess import resize_image
+from peekingduck.pipeline.nodes.input.utils.read import VideoThread
+
+
+class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
+    r"""Receives frames from several visual sources, each read by its own
+    thread, and outputs them one at a time, tagged with the index of their
+    source. This allows a single pipeline, and a single copy of each model, to
+    process many cameras.
+
+    Sources are served in turn: each call outputs the next frame of the
+    source after the one which was last output, skipping sources without a
+    new frame. Nodes which keep state across frames, e.g.,
+    :mod:`dabble.tracking`, :mod:`dabble.bot_sort`, :mod:`dabble.statistics`,
+    :mod:`model.jde`, :mod:`model.fairmot`, and :mod:`output.media_writer`,
+    keep a separate state for each :term:`source_id`. As consecutive frames
+    generally come from different sources, running the pipeline in
+    ``"pipelined"`` mode with a ``batch_size`` greater than 1 batches the
+    frames of different cameras in model nodes which support batching.
+
+    Inputs:
+        |none_input_data|
+
+    Outputs:
+        |img_data|
+
+        |filename_data|
+
+        |pipeline_end_data|
+
+        |saved_video_fps_data|
+
+        |source_id_data|
+
+    Configs:
+        sources (:obj:`List[Union[int, str]]`):
+            **default = [https://storage.googleapis.com/peekingduck/videos/wave.mp4]**.
+            |br|
+            Input sources, each of which can be: |br|
+            - filename : local image or video file |br|
+            - http URL for online cloud source : http[s]://... |br|
+            - rtsp URL for CCTV : rtsp://... |br|
+            - integer index of a webcam |br|
+            The index of a source in this list is its :term:`source_id`.
+        filename (:obj:`str`): **default = "video.mp4"**. |br|
+            Name of the MP4 file if the media is exported. The
+            :term:`source_id` is appended to the name of each source's file,
+            e.g., ``video_0.mp4``. If a source is a local file, its name is
+            used instead of this value.
+        mirror_image (:obj:`bool`): **default = False**. |br|
+            Flag to set extracted image frames as mirror images of the input
+            streams.
+        resize (:obj:`Dict[str, Any]`):
+            **default = { do_resizing: False, width: 1280, height: 720 }** |br|
+            Dimension of extracted image frames.
+        frames_log_freq (:obj:`int`): **default = 100**. [1]_ |br|
+            Logs frequency of frames passed in CLI
+        saved_video_fps (:obj:`int`): **default = 10**. [1]_ |br|
+            FPS of the output file of a source whose FPS is not known, see
+            :mod:`input.visual`.
+        buffering (:obj:`bool`): **default = False**. [1]_ |br|
+            Boolean to indicate if the threaded readers should buffer image
+            frames, see :mod:`input.visual`.
+        buffer_size (:obj:`int`): **default = 16**. [1]_ |br|
+            Maximum number of frames held in the buffer of each source when
+            buffering is True.
+        drop_policy (:obj:`str`): **default = "latest"**. [1]_ |br|
+            What happens when a frame is read while the buffer of its source
+            is full, see :mod:`input.visual`.
+        drop_every (:obj:`int`): **default = 2**. [1]_ |br|
+            Interval of the frames discarded by the "drop_nth" policy.
+        frame_timeout (:obj:`float`): **default = 1.0**. [1]_ |br|
+            Maximum time, in seconds, to wait for a new frame from any source.
+            If no new frame arrives in time, ``img`` is None and the rest of
+            the pipeline is skipped for the iteration.
+
+    .. [1] advanced configuration
+
+    ``pipeline_end`` is True once every source has ended. Sources which end
+    before the others, e.g., video files, are closed and no longer served.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
+        super().__init__(config, node_path=__name__, **kwargs)
+        if not self.sources:
+            raise ValueError("sources must contain at least one input source")
+        self.do_resize: bool = self.resize["do_resizing"]
+        self.frame_counter: int = 0
+        self._frame_event = Event()
+        self._file_names = [
+            self._get_file_name(source_id, source)
+            for source_id, source in enumerate(self.sources)
+        ]
+        self.readers: List[Optional[VideoThread]] = []
+        self._fps: List[float] = []
+        # ids of the sources which have not ended, in the order they are served
+        self._active: Deque[int] = deque()
+        try:
+            for source_id, source in enumerate(self.sources):
+                self._open_source(source_id, source)
+        except Exception:
+            self.release_resources()
+            raise
+
+    def release_resources(self) -> None:
+        """Override base class method to free video resources"""
+        for source_id, reader in enumerate(self.readers):
+            if reader is not None:
+                self._close_source(source_id)
+
+    @property
+    def frame_size(self) -> Optional[Tuple[int, int]]:
+        """(width, height) of the frames of the first source, or None if no
+        source is open.
+        """
+        if self.do_resize:
+            return self.resize["width"], self.resize["height"]
+        for reader in self.readers:
+            if reader is not None:
+                return reader.resolution
+        return None
+
+    def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        deadline = perf_counter() + self.frame_timeout
+        while self._active:
+            # cleared before polling, so that frames read while polling are
+            # not missed by the wait below
+            self._frame_event.clear()
+            for _ in range(len(self._active)):
+                source_id = self._active.popleft()
+                success, img = self.readers[source_id].read_frame(0)  # type: ignore
+                if not success:
+                    self._close_source(source_id)
+                    continue
+                self._active.append(source_id)
+                if img is not None:
+                    return self._get_outputs(source_id, img)
+            remaining = deadline - perf_counter()
+            if not self._active or remaining <= 0:
+                break
+            self._frame_event.wait(remaining)
+        return {
+            "img": None,
+            "filename": self.filename,
+            "pipeline_end": not self._active,
+            "saved_video_fps": self.saved_video_fps,
+            "source_id": None,
+        }
+
+    def _get_config_types(self) -> Dict[str, Any]:
+        """Returns dictionary mapping the node's config keys to respective types."""
+        return {
+            "buffer_size": int,
+            "buffering": bool,
+            "drop_every": int,
+            "drop_policy": str,
+            "filename": str,
+            "frame_timeout": float,
+            "frames_log_freq": int,
+            "mirror_image": bool,
+            "resize": Dict[str, Union[bool, int]],
+            "resize.do_resizing": bool,
+            "resize.height": int,
+            "resize.width": int,
+            "saved_video_fps": int,
+            "sources": List[Union[int, str]],
+        }
+
+    def _get_file_name(self, source_id: int, source: Union[int, str]) -> str:
+        """Returns the output file name of a source, which is made unique by
+        appending its `source_id`.
+
+        Raises:
+            FileNotFoundError: a local source does not exist.
+            ValueError: a local source is a directory.
+        """
+        path = Path(self.filename)
+        if isinstance(source, str) and not source.startswith(
+            ("http://", "https://", "rtsp://")
+        ):
+            path = Path(source)
+            if not path.exists():
+                raise FileNotFoundError(f"Path '{path}' does not exist")
+            if path.is_dir():
+                raise ValueError(
+                    f"Source '{path}' is a directory, use input.visual to read "
+                    "directories"
+                )
+        return f"{path.stem}_{source_id}{path.suffix}"
+
+    def _get_outputs(self, source_id: int, img: np.ndarray) -> Dict[str, Any]:
+        """Returns the outputs of a frame read from the source `source_id`."""
+        if self.do_resize:
+            img = resize_image(img, self.resize["width"], self.resize["height"])
+        self.frame_counter += 1
+        if self.frame_counter % self.frames_log_freq == 0:
+            self.logger.info(
+                f"Frames Processed: {self.frame_counter}, "
+                f"sources open: {len(self._active)} / {len(self.sources)}"
+            )
+        fps = self._fps[source_id]
+        return {
+            "img": img,
+            "filename": self._file_names[source_id],
+            "pipeline_end": False,
+            "saved_video_fps": fps if 0 < fps <= 200 else self.saved_video_fps,
+            "source_id": source_id,
+        }
+
+    def _open_source(self, source_id: int, source: Union[int, str]) -> None:
+        """Starts the threaded reader of a source."""
+        reader = VideoThread(
+            source,
+            self.mirror_image,
+            self.buffering,
+            self.buffer_size,
+            self.drop_policy,
+            self.drop_every,
+            self._frame_event,
+        )
+        self.readers.append(reader)
+        self._fps.append(reader.fps)
+        self._active.append(source_id)
+        width, height = reader.resolution
+        self.logger.info(f"Source {source_id}: {source}, size: {width} by {height}")
+
+    def _close_source(self, source_id: int) -> None:
+        """Stops the threaded reader of a source."""
+        reader = self.readers[source_id]
+        if reader is None:
+            return
+        reader.shutdown()
+        self.readers[source_id] = None
+        if source_id in self._active:
+            self._active.remove(source_id)
+        self.logger.info(f"Completed processing source {source_id}")
+        if reader.dropped_frames > 0:
+            self.logger.warning(
+                f"Dropped {reader.dropped_frames} frames of source {source_id} as "
+                f"the pipeline could not keep up with the input"
+            )
@@ -0,0 +1,146 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Bounded buffer of frames shared between a reading thread and the pipeline
+"""
+
+from collections import deque
+from threading import Condition
+from typing import Deque, Optional
+
+import numpy as np
+
+DROP_POLICIES = ["block", "drop_oldest", "latest", "drop_nth"]
+
+
+class FrameBuffer:  # pylint: disable=too-many-instance-attributes
+    """Fixed capacity buffer of frames. Frames are held by reference, without
+    being copied, and at most ``capacity`` of them are held, so memory usage
+    is bounded by ``capacity`` frames however far the consumer falls behind.
+    The producer must not modify a frame after putting it into the buffer.
+
+    The behavior when a frame is put into a full buffer is determined by
+    ``policy``:
+
+    - ``"block"``: waits until the consumer frees a slot. No frames are lost,
+      suited to video files.
+    - ``"drop_oldest"``: overwrites the oldest buffered frame.
+    - ``"latest"``: as ``"drop_oldest"``, and :py:meth:`get` returns the newest
+      frame, discarding older ones, suited to live sources where only the
+      current frame matters.
+    - ``"drop_nth"``: drops every ``drop_every``-th incoming frame and blocks
+      on the others while the buffer is full, thinning the stream evenly
+      under backpressure.
+
+    Args:
+        capacity (int): Maximum number of buffered frames.
+        policy (str): One of ``"block"``, ``"drop_oldest"``, ``"latest"`` or
+            ``"drop_nth"``.
+        drop_every (int): Interval of the frames dropped by the
+            ``"drop_nth"`` policy.
+
+    Raises:
+        ValueError: ``capacity`` is not positive, ``policy`` is not supported
+            or ``drop_every`` is less than 2.
+    """
+
+    def __init__(
+        self, capacity: int, policy: str = "block", drop_every: int = 2
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got: {capacity}")
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"policy must be one of {DROP_POLICIES}, got: {policy}")
+        if drop_every < 2:
+            raise ValueError(f"drop_every must be at least 2, got: {drop_every}")
+        self.capacity = capacity
+        self.policy = policy
+        self.drop_every = drop_every
+        self.dropped_frames = 0
+        self._frames: Deque[np.ndarray] = deque()
+        self._num_overflows = 0
+        self._is_closed = False
+        self._condition = Condition()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._frames)
+
+    def close(self) -> None:
+        """Wakes up a producer blocked in :py:meth:`put` and rejects further
+        frames. Frames already buffered can still be retrieved.
+        """
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+
+    def put(self, frame: np.ndarray) -> bool:
+        """Adds ``frame`` to the buffer, applying the drop policy if the buffer
+        is full.
+
+        Args:
+            frame (np.ndarray): The frame to buffer.
+
+        Returns:
+            (bool): ``False`` if ``frame`` was dropped.
+        """
+        with self._condition:
+            if len(self._frames) == self.capacity and not self._is_closed:
+                if self.policy in ("drop_oldest", "latest"):
+                    self._frames.popleft()
+                    self.dropped_frames += 1
+                else:
+                    if self.policy == "drop_nth":
+                        self._num_overflows += 1
+                        if self._num_overflows % self.drop_every == 0:
+                            self.dropped_frames += 1
+                            return False
+                    self._condition.wait_for(
+                        lambda: len(self._frames) < self.capacity or self._is_closed
+                    )
+            if self._is_closed:
+                return False
+            self._frames.append(frame)
+            self._condition.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Removes and returns the oldest buffered frame, or the newest one
+        with the ``"latest"`` policy.
+
+        Args:
+            timeout (float | None): Maximum time, in seconds, to wait for a
+                frame. Waits indefinitely if ``None``, and not at all if 0.
+
+        Returns:
+            (np.ndarray | None): The frame, or ``None`` if no frame
+            arrived within ``timeout`` or the buffer is closed and empty.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: len(self._frames) > 0 or self._is_closed, timeout
+            ):
+                return None
+            if not self._frames:
+                return None
+            if self.policy == "latest":
+                self.dropped_frames += len(self._frames) - 1
+                frame = self._frames.pop()
+                self._frames.clear()
+            else:
+                frame = self._frames.popleft()
+            self._condition.notify_all()
+            return frame
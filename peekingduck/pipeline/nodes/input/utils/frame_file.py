@@ -0,0 +1,140 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Memory-mapped files of decoded frames, which are read without any decoding
+"""
+
+from pathlib import Path
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+# Raw frame files hold the BGR pixels of the frames back to back, without any
+# header, so their frame size must be given separately
+RAW_EXTENSIONS = [".bgr", ".raw"]
+FRAME_FILE_EXTENSIONS = [".npy"] + RAW_EXTENSIONS
+
+
+def open_frame_file(
+    path: Path, width: int = 0, height: int = 0, read_only: bool = True
+) -> np.ndarray:
+    """Memory-maps a ``.npy`` or raw BGR frame file as an (N, H, W, 3)
+    ``uint8`` array. Frames are only read from disk, by the OS, when they
+    are accessed.
+
+    Args:
+        path (Path): Path of the frame file.
+        width (int): Frame width, required by raw frame files.
+        height (int): Frame height, required by raw frame files.
+        read_only (bool): If False, the frames can be modified in place,
+            e.g., by draw nodes. Modified pages are copied in memory and never
+            written back to the file.
+
+    Raises:
+        ValueError: The file extension is not supported, the frame size of a
+            raw frame file is missing or does not match the file size, or the
+            array does not hold BGR ``uint8`` frames.
+
+    Returns:
+        (np.ndarray): The memory-mapped frames.
+    """
+    mode = "r" if read_only else "c"
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        frames = np.load(path, mmap_mode=mode)
+    elif suffix in RAW_EXTENSIONS:
+        if width <= 0 or height <= 0:
+            raise ValueError(
+                f"The frame width and height of raw frame file {path} are required"
+            )
+        frame_bytes = height * width * 3
+        file_bytes = path.stat().st_size
+        if file_bytes == 0 or file_bytes % frame_bytes != 0:
+            raise ValueError(
+                f"Size of {path} ({file_bytes} bytes) is not a multiple of the "
+                f"size of a {width} by {height} BGR frame ({frame_bytes} bytes)"
+            )
+        frames = np.memmap(path, dtype=np.uint8, mode=mode).reshape(
+            -1, height, width, 3
+        )
+    else:
+        raise ValueError(
+            f"Frame file {path}: extension must be one of {FRAME_FILE_EXTENSIONS}"
+        )
+    if frames.ndim != 4 or frames.shape[3] != 3 or frames.dtype != np.uint8:
+        raise ValueError(
+            f"Frame file {path} must hold (N, H, W, 3) uint8 BGR frames, got: "
+            f"{frames.shape} {frames.dtype}"
+        )
+    return frames
+
+
+def convert_video(video_path: str, output_path: Path) -> Tuple[int, int, int]:
+    """Decodes every frame of a video once into a ``.npy`` or raw BGR frame
+    file, which :mod:`input.frame_file` replays without decoding.
+
+    Args:
+        video_path (str): Path or URL of the video.
+        output_path (Path): Path of the frame file to write. Its extension
+            selects the format.
+
+    Raises:
+        ValueError: The video cannot be opened or has no frames, or the output
+            file extension is not supported.
+
+    Returns:
+        (Tuple[int, int, int]): Number of frames, width, and height.
+    """
+    suffix = output_path.suffix.lower()
+    if suffix not in FRAME_FILE_EXTENSIONS:
+        raise ValueError(
+            f"Frame file {output_path}: extension must be one of "
+            f"{FRAME_FILE_EXTENSIONS}"
+        )
+    stream = cv2.VideoCapture(video_path)
+    if not stream.isOpened():
+        raise ValueError(f"Video input not detected: {video_path}")
+    # Counting the frames by grabbing them is exact, unlike the frame count
+    # stored in the container
+    num_frames = 0
+    while stream.grab():
+        num_frames += 1
+    width = int(stream.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(stream.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    stream.release()
+    if num_frames == 0:
+        raise ValueError(f"Video {video_path} has no frames")
+
+    shape = (num_frames, height, width, 3)
+    if suffix == ".npy":
+        frames = np.lib.format.open_memmap(
+            output_path, mode="w+", dtype=np.uint8, shape=shape
+        )
+    else:
+        frames = np.memmap(output_path, dtype=np.uint8, mode="w+", shape=shape)
+    stream = cv2.VideoCapture(video_path)
+    for idx in range(num_frames):
+        ret, frame = stream.read()
+        if not ret or frame.shape != shape[1:]:
+            stream.release()
+            raise ValueError(
+                f"Could only decode {idx} of the {num_frames} frames of {video_path}"
+            )
+        frames[idx] = frame
+    stream.release()
+    frames.flush()
+    return num_frames, width, height
@@ -0,0 +1,75 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Pool of reusable frame buffers for input nodes
+"""
+
+import sys
+from typing import List, Tuple
+
+import numpy as np
+
+# References to a free buffer: the pool's list and the argument of
+# sys.getrefcount()
+_FREE_REFCOUNT = 2
+
+
+class FramePool:
+    """Recycles up to ``max_size`` frame buffers so that decoding, mirroring
+    and resizing frames do not allocate a new array per frame.
+
+    A buffer is handed out again only once no other object refers to it, i.e.,
+    every node has released the frame, views of it included. Since the data
+    pool holds on to the last frame until the next one replaces it, at least 2
+    buffers are needed per frame size for buffers to be recycled. When every
+    buffer is in use, a new array which is not pooled is returned instead.
+
+    Args:
+        max_size (int): Maximum number of buffers held by the pool.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.num_allocations = 0
+        self._buffers: List[np.ndarray] = []
+
+    def acquire(self, shape: Tuple[int, ...], dtype: type = np.uint8) -> np.ndarray:
+        """Returns a free buffer of the specified shape and type, allocating
+        one if there is none. The contents of the buffer are undefined.
+
+        Args:
+            shape (Tuple[int, ...]): Shape of the buffer.
+            dtype (type): Data type of the buffer.
+
+        Returns:
+            (np.ndarray): The buffer.
+        """
+        for idx in range(len(self._buffers)):
+            if sys.getrefcount(self._buffers[idx]) > _FREE_REFCOUNT:
+                continue
+            buffer = self._buffers[idx]
+            if buffer.shape == shape and buffer.dtype == dtype:
+                return buffer
+            if len(self._buffers) == self.max_size:
+                # free buffer of another frame size, e.g., after the input
+                # changed, make room for the new size
+                del self._buffers[idx]
+                break
+        self.num_allocations += 1
+        buffer = np.empty(shape, dtype)
+        if len(self._buffers) < self.max_size:
+            self._buffers.append(buffer)
+        return buffer
@@ -30,7 +30,7 @@
 """
 Custom PNG reader to fix opencv 'PNG magic' problem on Windows platform
 """
-from typing import Any, Tuple
+from typing import Any, Tuple, Union
 import cv2
 import numpy as np
 
@@ -38,8 +38,12 @@ import numpy as np
 class PNGReader:
     """Custom PNG reader to fix opencv 'PNG magic' problem on Windows platform"""
 
-    def __init__(self, input_source: str) -> None:
-        self.img = cv2.imread(input_source)
+    def __init__(self, input_source: Union[str, np.ndarray]) -> None:
+        # input_source may also be an image which has already been decoded
+        if isinstance(input_source, np.ndarray):
+            self.img = input_source
+        else:
+            self.img = cv2.imread(input_source)
         self.height, self.width, _ = self.img.shape
         self.get_map = {
             cv2.CAP_PROP_FPS: 0,
@@ -70,6 +74,16 @@ class PNGReader:
         """
         return True
 
+    def grab(self) -> bool:
+        """To mimic opencv's video capture object grab()
+
+        Returns:
+            bool: True if the image had not been read yet
+        """
+        has_frames = self.has_frames
+        self.has_frames = False
+        return has_frames
+
     def read(self) -> Tuple[bool, np.ndarray]:
         """To mimic opencv's video capture object read()
 
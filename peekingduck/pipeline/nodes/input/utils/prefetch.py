@@ -0,0 +1,102 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background decoding of the upcoming image files of a directory or file list
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import cv2
+import numpy as np
+
+# Image formats decoded by cv2.imdecode, GIFs are left to cv2.VideoCapture
+DECODABLE_EXTENSIONS = [".jpeg", ".jpg", ".png"]
+
+
+def decode_image(path: Path) -> Optional[np.ndarray]:
+    """Reads the bytes of the image file at ``path`` in bulk and decodes them.
+
+    Args:
+        path (Path): Path of the image file.
+
+    Returns:
+        (np.ndarray | None): The decoded BGR image, or None if the file could
+        not be read or decoded.
+    """
+    try:
+        data = np.fromfile(path, dtype=np.uint8)
+    except OSError:
+        return None
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+
+class ImagePrefetcher:
+    """Decodes the next ``num_prefetch`` image files on a thread pool while
+    the current frame is being processed. At most ``num_prefetch`` decoded
+    images are held at any time. OpenCV releases the GIL while decoding, so
+    the decoding threads run in parallel.
+
+    Args:
+        num_prefetch (int): Number of upcoming files to decode ahead.
+    """
+
+    def __init__(self, num_prefetch: int) -> None:
+        self.num_prefetch = num_prefetch
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(num_prefetch, os.cpu_count() or 1),
+            thread_name_prefix="ImagePrefetcher",
+        )
+        self._pending: Dict[Path, "Future[Optional[np.ndarray]]"] = {}
+
+    def prefetch(self, paths: Sequence[Path]) -> None:
+        """Starts decoding the image files among the first ``num_prefetch``
+        of ``paths`` which are not being decoded yet.
+
+        Args:
+            paths (Sequence[Path]): The upcoming files, in order of use.
+        """
+        for path in paths[: self.num_prefetch]:
+            if len(self._pending) >= self.num_prefetch:
+                break
+            if (
+                path not in self._pending
+                and path.suffix.lower() in DECODABLE_EXTENSIONS
+            ):
+                self._pending[path] = self._executor.submit(decode_image, path)
+
+    def get(self, path: Path) -> Optional[np.ndarray]:
+        """Retrieves the image decoded from ``path``, waiting for the decoding
+        to finish if necessary.
+
+        Args:
+            path (Path): Path of the image file.
+
+        Returns:
+            (np.ndarray | None): The decoded image, or None if ``path`` was not
+            prefetched or could not be decoded.
+        """
+        future = self._pending.pop(path, None)
+        if future is None:
+            return None
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Discards the pending images and stops the decoding threads."""
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
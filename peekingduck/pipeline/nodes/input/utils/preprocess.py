@@ -32,7 +32,7 @@ Preprocessing functions for input nodes
 """
 
 import logging
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -48,12 +48,17 @@ def get_res(stream: Any) -> Tuple[int, int]:
     return width, height
 
 
-def mirror(frame: np.ndarray) -> np.ndarray:
-    """Mirrors a video frame."""
-    return cv2.flip(frame, 1)
+def mirror(frame: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """Mirrors a video frame, into `dst` if provided."""
+    return cv2.flip(frame, 1, dst=dst)
 
 
-def resize_image(frame: np.ndarray, desired_width: int, desired_height: int) -> Any:
+def resize_image(
+    frame: np.ndarray,
+    desired_width: int,
+    desired_height: int,
+    dst: Optional[np.ndarray] = None,
+) -> Any:
     """function that resizes the image input
     to the desired dimensions
 
@@ -61,9 +66,11 @@ def resize_image(frame: np.ndarray, desired_width: int, desired_height: int) ->
         frame (np.array): image
         desired_width: width of the resized image
         desired_height: height of the resized image
+        dst (np.array): optional preallocated array to write the resized
+            image into
 
     Returns:
         image (np.array): returns a scaled image depending on the
         desired wight and height
     """
-    return cv2.resize(frame, (desired_width, desired_height))
+    return cv2.resize(frame, (desired_width, desired_height), dst=dst)
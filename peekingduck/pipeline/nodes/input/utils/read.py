@@ -33,26 +33,47 @@ Reader functions for input nodes
 
 import logging
 import platform
-import queue
 from pathlib import Path
-from threading import Event, Thread
-from typing import Any, Tuple, Union
+from threading import Condition, Event, Thread
+from typing import Any, Optional, Tuple, Union
 
 import cv2
+import numpy as np
 
+from peekingduck.pipeline.nodes.input.utils.frame_buffer import FrameBuffer
+from peekingduck.pipeline.nodes.input.utils.frame_pool import FramePool
 from peekingduck.pipeline.nodes.input.utils.png_reader import PNGReader
 from peekingduck.pipeline.nodes.input.utils.preprocess import mirror
 
+# Skips of at least this many frames seek instead of grabbing every frame. The
+# decoder then only decodes from the keyframe preceding the target frame, which
+# is cheaper once the skip is longer than a typical keyframe interval, e.g.,
+# the x264 default of 250 frames.
+SEEK_MIN_FRAMES = 250
+
 
 class VideoThread:
     """
     Videos will be threaded to improve FPS by reducing I/O blocking latency.
+    If buffering, frames are held in a bounded :py:class:`FrameBuffer` of
+    ``buffer_size`` frames which applies ``drop_policy`` when it is full.
+    Otherwise, only the latest frame is kept, tagged with a sequence number so
+    that :py:meth:`read_frame` never returns the same frame twice.
+    If a ``frame_event`` is provided, it is set whenever a frame is read or
+    the input ends, so that a single event can wait on several readers.
     """
 
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(
-        self, input_source: Union[int, str], mirror_image: bool, buffering: bool
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        input_source: Union[int, str],
+        mirror_image: bool,
+        buffering: bool,
+        buffer_size: int = 16,
+        drop_policy: str = "block",
+        drop_every: int = 2,
+        frame_event: Optional[Event] = None,
     ) -> None:
         assert isinstance(input_source, (int, str))
         if isinstance(input_source, int):
@@ -72,12 +93,18 @@ class VideoThread:
         # events to coordinate threading
         self.is_done = Event()
         self.is_thread_start = Event()
+        self.frame_event = frame_event
         # frame storage and buffering
         self.frame_counter = 0
         self.frame = None
-        self.prev_frame = None
         self.buffer = buffering
-        self.queue: queue.Queue = queue.Queue()
+        # sequence numbers of the latest frame read from the stream and the
+        # latest frame returned by read_frame(), guarded by frame_condition
+        self.frame_condition = Condition()
+        self._frame_seq = 0
+        self._read_seq = 0
+        self._num_missed = 0
+        self.frame_buffer = FrameBuffer(buffer_size, drop_policy, drop_every)
         # start threading
         self.thread = Thread(target=self._reading_thread, args=(), daemon=True)
         self.thread.start()
@@ -97,9 +124,18 @@ class VideoThread:
         Cannot be merged into __del__ as threading code needs to run here.
         """
         self.logger.debug("VideoThread.shutdown")
-        self.is_done.set()
+        self._set_done()
         self.thread.join()
 
+    def _set_done(self) -> None:
+        """Signals the end of input and wakes up any waiting reader."""
+        self.is_done.set()
+        self.frame_buffer.close()
+        with self.frame_condition:
+            self.frame_condition.notify_all()
+        if self.frame_event is not None:
+            self.frame_event.set()
+
     def _reading_thread(self) -> None:
         """
         A thread that continuously polls the camera for frames.
@@ -112,37 +148,53 @@ class VideoThread:
                         f"_reading_thread: ret={ret}, "
                         f"#frames read={self.frame_counter}"
                     )
-                    self.is_done.set()
+                    self._set_done()
                 else:
                     if self.mirror:
                         frame = mirror(frame)
-                    self.frame = frame
-                    self.is_thread_start.set()  # thread really started
                     self.frame_counter += 1
                     if self.buffer:
-                        self.queue.put(self.frame)
+                        self.frame_buffer.put(frame)
+                    with self.frame_condition:
+                        self.frame = frame
+                        self._frame_seq += 1
+                        self.frame_condition.notify_all()
+                    if self.frame_event is not None:
+                        self.frame_event.set()
+                    self.is_thread_start.set()  # thread really started
 
-    def read_frame(self) -> Tuple[bool, Any]:
+    def read_frame(self, timeout: Optional[float] = None) -> Tuple[bool, Any]:
         """
-        Reads the frame.
+        Reads the next frame which has not been returned before, waiting up
+        to `timeout` seconds for it to arrive (indefinitely if None).
+        Returns (True, None) if no new frame arrived in time, and
+        (False, None) at the end of input.
         """
         # pylint: disable=no-else-return
         if self.buffer:
-            if self.queue.empty():
-                if self.is_done.is_set():
+            frame = self.frame_buffer.get(timeout)
+            if frame is None:
+                if self.is_done.is_set() and self.queue_size == 0:
                     # end of input
                     return False, None
                 else:
-                    # input slow, so duplicate frame
-                    return True, self.prev_frame
-            else:
-                self.prev_frame = self.queue.get()
-                return True, self.prev_frame
-        else:
-            if self.is_done.is_set():
+                    # input slow, no new frame yet
+                    return True, None
+            return True, frame
+        with self.frame_condition:
+            self.frame_condition.wait_for(
+                lambda: self._frame_seq > self._read_seq or self.is_done.is_set(),
+                timeout,
+            )
+            if self._frame_seq > self._read_seq:
+                # frames overwritten before they could be read
+                self._num_missed += self._frame_seq - self._read_seq - 1
+                self._read_seq = self._frame_seq
+                return True, self.frame
+            elif self.is_done.is_set():
                 return False, None
             else:
-                return True, self.frame
+                return True, None
 
     @property
     def fps(self) -> float:
@@ -171,7 +223,19 @@ class VideoThread:
         Returns:
             int: number of frames in buffer
         """
-        return self.queue.qsize()
+        return len(self.frame_buffer)
+
+    @property
+    def dropped_frames(self) -> int:
+        """Get number of frames dropped by the buffer, or overwritten before
+        being read if not buffering
+
+        Returns:
+            int: number of dropped frames
+        """
+        if self.buffer:
+            return self.frame_buffer.dropped_frames
+        return self._num_missed
 
     @property
     def resolution(self) -> Tuple[int, int]:
@@ -189,11 +253,21 @@ class VideoThread:
 class VideoNoThread:
     """
     No threading to deal with recorded videos and images.
+    If a `frame_pool` is provided, frames are decoded and mirrored into its
+    recycled buffers instead of newly allocated arrays.
     """
 
-    def __init__(self, input_source: Union[int, str], mirror_image: bool) -> None:
-        assert isinstance(input_source, (int, str))
-        if isinstance(input_source, int):
+    def __init__(
+        self,
+        input_source: Union[int, str, np.ndarray],
+        mirror_image: bool,
+        frame_pool: Optional[FramePool] = None,
+    ) -> None:
+        assert isinstance(input_source, (int, str, np.ndarray))
+        if isinstance(input_source, np.ndarray):
+            # image decoded in advance, e.g., by ImagePrefetcher
+            self.stream = PNGReader(input_source)
+        elif isinstance(input_source, int):
             if platform.system().startswith("Windows"):
                 # to eliminate opencv's "[WARN] terminating async callback" on Windows
                 self.stream = cv2.VideoCapture(input_source, cv2.CAP_DSHOW)
@@ -208,6 +282,14 @@ class VideoNoThread:
         self._frame_counter = 0
         self.logger = logging.getLogger(type(self).__name__)
         self.mirror = mirror_image
+        self.frame_pool = frame_pool
+        width, height = self.resolution
+        # decoding into a buffer requires a cv2.VideoCapture of known size
+        self._frame_shape = (
+            (height, width, 3)
+            if isinstance(self.stream, cv2.VideoCapture) and width > 0 and height > 0
+            else None
+        )
 
     def __del__(self) -> None:
         # Note: self.logger.debug below crashes on Nvidia Jetson Xavier Ubuntu 18.04 python 3.6
@@ -219,17 +301,48 @@ class VideoNoThread:
         """
         Reads the frame.
         """
-        ret, frame = self.stream.read()
+        if self.frame_pool is not None and self._frame_shape is not None:
+            ret, frame = self.stream.read(
+                image=self.frame_pool.acquire(self._frame_shape)
+            )
+        else:
+            ret, frame = self.stream.read()
         if not ret:
             self.logger.debug(
                 f"read_frame: ret={ret}, #frames read={self._frame_counter}"
             )
         else:
             if self.mirror:
-                frame = mirror(frame)
+                frame = mirror(
+                    frame,
+                    None
+                    if self.frame_pool is None
+                    else self.frame_pool.acquire(frame.shape, frame.dtype),
+                )
             self._frame_counter += 1
         return ret, frame
 
+    def seek(self, frame_index: int) -> None:
+        """
+        Moves to the specified frame so that it is the next frame read.
+        """
+        self.stream.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        self._frame_counter = frame_index
+
+    def skip(self, num_frames: int) -> None:
+        """
+        Skips the next `num_frames` frames without decoding them: frames are
+        only grabbed, or the stream seeks past them if there are at least
+        SEEK_MIN_FRAMES of them and the source is a file.
+        """
+        if num_frames >= SEEK_MIN_FRAMES and self.frame_count > 0:
+            self.seek(self._frame_counter + num_frames)
+            return
+        for _ in range(num_frames):
+            if not self.stream.grab():
+                break
+            self._frame_counter += 1
+
     # pylint: disable=R0201
     def shutdown(self) -> None:
         """
@@ -268,6 +381,15 @@ class VideoNoThread:
         """
         return 0
 
+    @property
+    def dropped_frames(self) -> int:
+        """Get number of frames dropped by the buffer
+
+        Returns:
+            int: number of dropped frames
+        """
+        return 0
+
     @property
     def resolution(self) -> Tuple[int, int]:
         """Get resolution of the file.
@@ -36,12 +36,19 @@ Reads inputs from multiple visual sources |br|
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.nodes.input.utils.frame_pool import FramePool
+from peekingduck.pipeline.nodes.input.utils.prefetch import ImagePrefetcher
 from peekingduck.pipeline.nodes.input.utils.preprocess import resize_image
 from peekingduck.pipeline.nodes.input.utils.read import VideoNoThread, VideoThread
 
+IMAGE_EXTENSIONS = ["gif", "jpeg", "jpg", "png"]
+VIDEO_EXTENSIONS = ["avi", "m4v", "mkv", "mov", "mp4"]
+
 
 class SourceType:  # pylint: disable=too-few-public-methods
     """Enumerated object to store input type"""
@@ -50,6 +57,7 @@ class SourceType:  # pylint: disable=too-few-public-methods
     FILE = 1
     URL = 2
     WEBCAM = 3
+    FILE_LIST = 4
 
 
 class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
@@ -79,11 +87,13 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         resize (:obj:`Dict[str, Any]`):
             **default = { do_resizing: False, width: 1280, height: 720 }** |br|
             Dimension of extracted image frame.
-        source (:obj:`Union[int, str]`):
+        source (:obj:`Union[int, str, List[str]]`):
             **default = https://storage.googleapis.com/peekingduck/videos/wave.mp4**. |br|
             Input source can be: |br|
             - filename : local image or video file |br|
             - directory name : all media files will be processed |br|
+            - list of filenames : the files will be processed in the given
+            order |br|
             - http URL for online cloud source : http[s]://... |br|
             - rtsp URL for CCTV : rtsp://... |br|
             - 0 for webcam live feed |br|
@@ -93,6 +103,22 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
 
         frames_log_freq (:obj:`int`): **default = 100**. [#]_ |br|
             Logs frequency of frames passed in CLI
+        frame_pool_size (:obj:`int`): **default = 0**. [1]_ |br|
+            Number of frame buffers which are recycled, once no Python object
+            refers to the frame held in them, to decode, mirror and resize
+            frames into instead of allocating new arrays for every frame.
+            Nodes which keep references to past frames hold on to their
+            buffers. Only enable this if no node holds on to the pixel memory
+            of a frame without a reference to the array, e.g., through a
+            buffer protocol export or a C extension, as the frame is then
+            overwritten. With ``mirror_image``, each frame takes 2 buffers.
+            Set to 0 to disable.
+        prefetch (:obj:`int`): **default = 4**. [1]_ |br|
+            If source is a directory or list of files, the number of upcoming
+            JPEG/PNG files which are read and decoded in the background while
+            the current frame is being processed. At most this many decoded
+            images are held in memory. Set to 0 to disable. Not used with
+            threading.
         saved_video_fps (:obj:`int`): **default = 10**. [1]_ |br|
             This is used by :mod:`output.media_writer` to set the FPS of the
             output file and its behavior is determined by the type of input
@@ -109,6 +135,27 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
             Flag to enable threading when reading frames from camera / live
             stream. The FPS can increase up to 30%. |br|
             There is no need to enable threading if reading from a video file.
+        start_frame (:obj:`int`): **default = 0**. [1]_ |br|
+            Index of the first frame to be read from each video file. The
+            video is seeked to this frame when opened.
+        end_frame (:obj:`int`): **default = -1**. [1]_ |br|
+            Index of the frame at which reading of each video file stops,
+            exclusive. A negative value reads until the end of the video.
+            Together with ``start_frame``, this allows a segment of a long
+            video to be processed, see ``peekingduck run --workers``. Neither
+            is supported with threading.
+        frame_stride (:obj:`int`): **default = 1**. [1]_ |br|
+            Only every ``frame_stride``-th frame of each video file is output.
+            The frames in between are skipped without being decoded, by
+            seeking if the stride is large. ``saved_video_fps`` is divided by
+            the stride so that :mod:`output.media_writer` writes the sampled
+            frames at the correct speed.
+        target_fps (:obj:`float`): **default = 0**. [1]_ |br|
+            If positive, overrides ``frame_stride`` with the stride which
+            samples each video file closest to this FPS, e.g., 6 for a 30 FPS
+            video and a ``target_fps`` of 5. Videos at or below this FPS, and
+            sources of unknown FPS, are not sampled. Neither ``frame_stride``
+            nor ``target_fps`` is supported with threading.
         buffering (:obj:`bool`): **default = False**. [1]_ |br|
             Boolean to indicate if threaded class should buffer image frames.
             If reading from a video file and threading is True, then buffering
@@ -117,6 +164,26 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
             One side effect of setting threading=True, buffering=True for a
             live stream/webcam is the onscreen video could appear to be playing
             in slow-mo.
+        buffer_size (:obj:`int`): **default = 16**. [1]_ |br|
+            Maximum number of frames held in the buffer when threading and
+            buffering are True.
+        drop_policy (:obj:`str`): **default = "block"**. [1]_ |br|
+            What happens when a frame is read while the buffer is full: |br|
+            - "block" : wait for the pipeline to take a frame, no frames are
+            lost, suited to video files |br|
+            - "drop_oldest" : discard the oldest buffered frame |br|
+            - "latest" : discard the oldest buffered frame, and always pass
+            the newest buffered frame to the pipeline, suited to live
+            streams/webcams |br|
+            - "drop_nth" : discard every ``drop_every``-th frame read, and wait
+            for the pipeline on the others
+        drop_every (:obj:`int`): **default = 2**. [1]_ |br|
+            Interval of the frames discarded by the "drop_nth" policy.
+        frame_timeout (:obj:`float`): **default = 1.0**. [1]_ |br|
+            Maximum time, in seconds, to wait for a new frame when threading
+            is True. A frame is never output twice: if no new frame arrives in
+            time, ``img`` is None and the rest of the pipeline is skipped for
+            the iteration.
 
     .. [#] advanced configuration
 
@@ -141,8 +208,9 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
     Ok : normal behavior |br|
     \+ : potentially faster FPS |br|
     ! : lost frames if source is faster than PeekingDuck |br|
-    !! : "slow-mo" video, potential out-of-memory error due to buffer overflow
-    if source is faster than PeekingDuck
+    !! : "slow-mo" video if source is faster than PeekingDuck, frames are
+    dropped according to ``drop_policy`` once ``buffer_size`` frames are
+    buffered
 
     Note: If threading=False, then the secondary parameter buffering is ignored
     regardless if it is set to True/False.
@@ -154,9 +222,10 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
     motion compared to the normal video on the left.
     This happens as both threading and buffering are set to True, and the
     threaded :mod:`input.visual` reads the webcam at almost 60 FPS.
-    Since the hardware is physically limited at 30 FPS, this means every frame
-    gets duplicated, resulting in each frame being processed and shown twice,
-    thus "stretching out" the video.
+    Since the hardware is physically limited at 30 FPS, this used to mean every
+    frame got duplicated, resulting in each frame being processed and shown
+    twice, thus "stretching out" the video. Threaded reads now wait up to
+    ``frame_timeout`` for a new frame instead of duplicating the previous one.
     """
 
     def __init__(
@@ -167,10 +236,11 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         **kwargs: Any,
     ) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
-        self._image_ext = ["gif", "jpeg", "jpg", "png"]
-        self._video_ext = ["avi", "m4v", "mkv", "mov", "mp4"]
+        self._image_ext = IMAGE_EXTENSIONS
+        self._video_ext = VIDEO_EXTENSIONS
         self._allowed_extensions = self._image_ext + self._video_ext
         self._fps: float = 0  # self._fps > 0 if file playback
+        self._frame_stride: int = 1  # stride of the current input
         self._file_name: str = ""
         self._filepaths: List[Path] = []
         self.do_resize: bool = self.resize["do_resizing"]
@@ -179,7 +249,25 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         self.has_multiple_inputs: bool = False
         self.progress: int = 0
         self.videocap: Optional[Union[VideoNoThread, VideoThread]] = None
+        self._prefetcher: Optional[ImagePrefetcher] = None
         self._determine_source_type()
+        self._frame_pool = (
+            FramePool(self.frame_pool_size) if self.frame_pool_size > 0 else None
+        )
+        if self.has_multiple_inputs and self.prefetch > 0 and not self.threading:
+            self._prefetcher = ImagePrefetcher(self.prefetch)
+        if self.threading and (self.start_frame > 0 or self.end_frame >= 0):
+            raise ValueError("start_frame and end_frame are not supported with threading")
+        if self.frame_stride < 1:
+            raise ValueError(
+                f"frame_stride must be a positive integer, got: {self.frame_stride}"
+            )
+        if self.target_fps < 0:
+            raise ValueError(f"target_fps must not be negative, got: {self.target_fps}")
+        if self.threading and (self.frame_stride > 1 or self.target_fps > 0):
+            raise ValueError(
+                "frame_stride and target_fps are not supported with threading"
+            )
         # error checking for user-defined output filename
         if not self._is_valid_file_type(Path(self.filename)):
             raise ValueError(
@@ -189,8 +277,26 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
 
     def release_resources(self) -> None:
         """Override base class method to free video resource"""
+        if self._prefetcher:
+            self._prefetcher.shutdown()
         if self.videocap:
             self.videocap.shutdown()
+            if self.videocap.dropped_frames > 0:
+                self.logger.warning(
+                    f"Dropped {self.videocap.dropped_frames} frames as the "
+                    f"pipeline could not keep up with the input"
+                )
+
+    @property
+    def frame_size(self) -> Optional[Tuple[int, int]]:
+        """(width, height) of the frames this node outputs, or None if no
+        input has been opened.
+        """
+        if self.do_resize:
+            return self.resize["width"], self.resize["height"]
+        if self.videocap is None:
+            return None
+        return self.videocap.resolution
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         outputs = self._get_next_frame()
@@ -208,6 +314,7 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         """
         Determine which one of the following types is self.source:
             - directory of files
+            - list of files
             - file
             - url : http / rtsp
             - webcam
@@ -217,6 +324,15 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         """
         if isinstance(self.source, int):
             self._source_type = SourceType.WEBCAM
+        elif isinstance(self.source, list):
+            self._source_type = SourceType.FILE_LIST
+            self._filepaths = [Path(file_path) for file_path in self.source]
+            for path in self._filepaths:
+                if not path.exists():
+                    raise FileNotFoundError(f"Path '{path}' does not exist")
+            self.has_multiple_inputs = True
+            self._num_files = len(self._filepaths)
+            self._curr_file_num = 0
         elif str(self.source).startswith(("http://", "https://", "rtsp://")):
             self._source_type = SourceType.URL
         else:
@@ -237,16 +353,26 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
         return {
+            "buffer_size": int,
             "buffering": bool,
+            "drop_every": int,
+            "drop_policy": str,
+            "end_frame": int,
             "filename": str,
+            "frame_pool_size": int,
+            "frame_stride": int,
+            "frame_timeout": float,
             "frames_log_freq": int,
             "mirror_image": bool,
+            "prefetch": int,
             "resize": Dict[str, Union[bool, int]],
             "resize.do_resizing": bool,
             "resize.height": int,
             "resize.width": int,
             "saved_video_fps": int,
-            "source": Union[int, str],
+            "source": Union[int, str, List[str]],
+            "start_frame": int,
+            "target_fps": Union[int, float],
             "threading": bool,
         }
 
@@ -277,12 +403,21 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
             if (0 < self._fps <= 200)
             else self.saved_video_fps,
         }
-        if self.videocap:
-            success, img = self.videocap.read_frame()
-            if success:
+        if self.videocap and not self._is_segment_end():
+            if isinstance(self.videocap, VideoThread):
+                success, img = self.videocap.read_frame(self.frame_timeout)
+            else:
+                if self.frame_counter > 0 and self._frame_stride > 1:
+                    self.videocap.skip(self._frame_stride - 1)
+                success, img = self.videocap.read_frame()
+            if success and img is None:
+                # no new frame from the threaded reader yet
+                self.file_end = False
+                outputs["pipeline_end"] = False
+            elif success:
                 self.file_end = False
                 if self.do_resize:
-                    img = resize_image(img, self.resize["width"], self.resize["height"])
+                    img = self._resize(img)
                 outputs["img"] = img
                 outputs["pipeline_end"] = False
                 self._show_progress()
@@ -312,11 +447,28 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
                                 - CCTV or webcam live feed
         """
         if self.threading:
-            self.videocap = VideoThread(self.source, self.mirror_image, self.buffering)
+            self.videocap = VideoThread(
+                input_source,
+                self.mirror_image,
+                self.buffering,
+                self.buffer_size,
+                self.drop_policy,
+                self.drop_every,
+            )
         else:
-            self.videocap = VideoNoThread(input_source, self.mirror_image)
-        self._fps = self.videocap.fps
+            self.videocap = VideoNoThread(
+                input_source, self.mirror_image, self._frame_pool
+            )
+            if self.start_frame > 0:
+                self.videocap.seek(self.start_frame)
+        self._frame_stride = self._get_frame_stride(self.videocap.fps)
+        self._fps = self.videocap.fps / self._frame_stride
         self.total_frame_count = max(0, self.videocap.frame_count)
+        if self.total_frame_count > 0 and self.end_frame >= 0:
+            self.total_frame_count = min(self.total_frame_count, self.end_frame)
+        self.total_frame_count = max(0, self.total_frame_count - self.start_frame)
+        # number of frames output after sampling, rounded up
+        self.total_frame_count = -(-self.total_frame_count // self._frame_stride)
         self.frame_counter = 0  # reset for newly opened input
         self._progress_tenth: int = 1  # each 10% progress
         # check resizing configuration
@@ -327,14 +479,47 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
                 f"Resizing of input set to {self.resize['width']} by {self.resize['height']}"
             )
 
+    def _get_frame_stride(self, fps: float) -> int:
+        """Returns the sampling stride of an input with the given FPS from
+        `frame_stride` and `target_fps`.
+        """
+        if self.threading:
+            return 1
+        if self.target_fps > 0:
+            if fps > self.target_fps:
+                return round(fps / self.target_fps)
+            return 1
+        return self.frame_stride
+
+    def _resize(self, img: np.ndarray) -> np.ndarray:
+        """Resizes `img` to the configured size, into a pooled buffer if
+        `frame_pool_size` is positive.
+        """
+        width, height = self.resize["width"], self.resize["height"]
+        dst = None
+        if self._frame_pool is not None:
+            dst = self._frame_pool.acquire((height, width) + img.shape[2:], img.dtype)
+        return resize_image(img, width, height, dst)
+
+    def _is_segment_end(self) -> bool:
+        """Checks if `end_frame` of the current input has been reached."""
+        return (
+            0
+            <= self.end_frame
+            <= self.start_frame + self.frame_counter * self._frame_stride
+        )
+
     def _open_next_file(self) -> None:
-        """Load next file in a directory of files"""
+        """Load next file in a directory or list of files"""
         while self._filepaths:
+            if self._prefetcher:
+                self._prefetcher.prefetch(self._filepaths)
             file_path = self._filepaths.pop(0)
             self._file_name = file_path.name
             self._curr_file_num += 1
             if self._is_valid_file_type(file_path):
-                self._open_input(str(file_path))
+                img = self._prefetcher.get(file_path) if self._prefetcher else None
+                self._open_input(str(file_path) if img is None else img)
                 break  # do not proceed to next file
             self.logger.warning(
                 f"Skipping '{file_path}' as it is not an accepted "
@@ -355,6 +540,7 @@ class Node(AbstractNode):  # pylint: disable=too-many-instance-attributes
         if self.frame_counter % self.frames_log_freq == 0 and self.videocap:
             buffer_info = (
                 f", buffer: {self.videocap.queue_size}"
+                f", dropped: {self.videocap.dropped_frames}"
                 if self.threading and self.buffering
                 else ""
             )
@@ -36,7 +36,6 @@ from typing import Any, Dict, Optional
 import cv2
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.csrnetv1 import csrnet_model
 
 
 class Node(AbstractNode):
@@ -86,6 +85,8 @@ class Node(AbstractNode):
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.csrnetv1 import csrnet_model
         self.model = csrnet_model.CSRNetModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -103,6 +104,10 @@ class Node(AbstractNode):
         outputs = {"density_map": density_map, "count": crowd_count}
         return outputs
 
+    def release_resources(self) -> None:
+        """Override base class method to release the shared model."""
+        self.model.release()
+
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
         return {"model_type": str, "weights_parent_dir": Optional[str], "width": int}
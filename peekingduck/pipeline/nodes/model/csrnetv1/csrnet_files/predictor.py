@@ -34,12 +34,14 @@ Crowd counting class using csrnet model to predict density map and crowd count
 import logging
 import math
 from pathlib import Path
-from typing import Callable, Dict, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 import cv2
 import numpy as np
 import tensorflow as tf
 
+from peekingduck.pipeline.nodes.model_registry import ModelKey, ModelRegistry
+
 
 class Predictor:  # pylint: disable=too-few-public-methods
     """Crowd counting class using csrnet model to predict density map and crowd count"""
@@ -53,6 +55,14 @@ class Predictor:  # pylint: disable=too-few-public-methods
         self.model_path = model_dir / model_file[self.model_type]
         self.width = width
 
+        self.registry_key: Optional[ModelKey] = ModelKey(
+            "csrnet",
+            self.model_type,
+            "tensorflow",
+            str(self.model_path),
+            "default",
+            "float",
+        )
         self.csrnet = self._create_csrnet_model()
 
     def _create_csrnet_model(self) -> Callable:
@@ -70,10 +80,20 @@ class Predictor:  # pylint: disable=too-few-public-methods
     def _load_csrnet_weights(self) -> Callable:
         # Have to create this member variable to keep the loaded weights in
         # memory
-        self.model = tf.saved_model.load(str(self.model_path))
+        self.model = ModelRegistry.acquire(
+            self.registry_key, lambda: tf.saved_model.load(str(self.model_path))
+        )
 
         return self.model.signatures["serving_default"]
 
+    def release(self) -> None:
+        """Releases the hold on the CSRNet model shared through the model
+        registry.
+        """
+        if self.registry_key is not None:
+            ModelRegistry.release(self.registry_key)
+            self.registry_key = None
+
     def predict_count_from_image(self, image: np.ndarray) -> Tuple[np.ndarray, int]:
         """Predicts density map and crowd count from image.
 
@@ -60,6 +60,10 @@ class CSRNetModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             self.config["width"],
         )
 
+    def release(self) -> None:
+        """Releases the hold on the model shared through the model registry."""
+        self.predictor.release()
+
     def predict(self, frame: np.ndarray) -> Tuple[np.ndarray, int]:
         """Predicts density map and crowd count from frame.
 
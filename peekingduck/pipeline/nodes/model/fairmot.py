@@ -36,7 +36,6 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.fairmotv1 import fairmot_model
 
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
@@ -61,10 +60,17 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         :mod:`model.fairmot` produces the ``ids`` attribute which contains the
         tracking IDs of the detections.
 
+        If the frames carry a :term:`source_id`, e.g., from
+        :mod:`input.multi_visual`, each source is tracked separately.
+
     Configs:
         weights_parent_dir (:obj:`Optional[str]`): **default = null**. |br|
             Change the parent directory where weights will be stored by
             replacing ``null`` with an absolute path to the desired directory.
+        mmap_weights (:obj:`bool`): **default = False**. |br|
+            Flag to determine if the weights should be memory-mapped instead
+            of being read into memory. Processes loading the same weights then
+            share their memory, and only the pages which are used are read.
         score_threshold (:obj:`float`): **default = 0.5**. |br|
             Object confidence score threshold.
         K (:obj:`int`): **default = 500**. |br|
@@ -93,7 +99,12 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         super().__init__(config, node_path=__name__, **kwargs)
         self._frame_rate = 30.0
 
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.fairmotv1 import fairmot_model
         self.model = fairmot_model.FairMOTModel(self.config, self._frame_rate)
+        # Tracks of the sources other than the current one, by source_id
+        self._source_id: Any = None
+        self._source_tracks: Dict[Any, Any] = {}
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Tracks objects from image.
@@ -124,6 +135,7 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         if frame_rate != self._frame_rate or reset_model:
             self._frame_rate = frame_rate
             self._reset_model()
+        self._switch_source(inputs.get("source_id"))
 
         bboxes, bbox_scores, track_ids = self.model.predict(inputs["img"])
         bbox_labels = np.array(["person"] * len(bboxes))
@@ -137,12 +149,21 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         }
         return outputs
 
+    def warm_up(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs the model on the synthetic inputs, then discards the tracks
+        created from them.
+        """
+        outputs = self.run(inputs)
+        self.model.tracker.reset_tracks()
+        return outputs
+
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
         return {
             "input_size": List[int],
             "K": int,
             "min_box_area": int,
+            "mmap_weights": bool,
             "score_threshold": float,
             "track_buffer": int,
             "weights_parent_dir": Optional[str],
@@ -155,4 +176,22 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         self.logger.info(
             f"Creating new model with frame rate: {self._frame_rate:.2f}..."
         )
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.fairmotv1 import fairmot_model
         self.model = fairmot_model.FairMOTModel(self.config, self._frame_rate)
+        self._source_tracks = {}
+
+    def _switch_source(self, source_id: Any) -> None:
+        """Swaps in the tracks of the input source `source_id`, so that
+        tracks are never matched across sources. The model is shared by all
+        sources.
+        """
+        if source_id == self._source_id:
+            return
+        tracker = self.model.tracker
+        self._source_tracks[self._source_id] = tracker.get_tracks()
+        if source_id in self._source_tracks:
+            tracker.set_tracks(self._source_tracks.pop(source_id))
+        else:
+            tracker.reset_tracks()
+        self._source_id = source_id
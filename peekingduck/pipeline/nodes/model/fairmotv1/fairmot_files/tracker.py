@@ -82,6 +82,7 @@ from peekingduck.pipeline.nodes.model.fairmotv1.fairmot_files.utils import (
     transpose_and_gather_feat,
 )
 from peekingduck.pipeline.utils.bbox.transforms import tlwh2xyxyn, xyxy2tlwh
+from peekingduck.pipeline.utils.torch_weights import load_checkpoint, load_state_dict
 
 
 class Tracker:  # pylint: disable=too-many-instance-attributes
@@ -111,6 +112,7 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
         min_box_area: int,
         track_buffer: int,
         score_threshold: float,
+        mmap_weights: bool = False,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -122,6 +124,7 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
         self.min_box_area = min_box_area
         self.track_buffer = track_buffer
         self.score_threshold = score_threshold
+        self.mmap_weights = mmap_weights
 
         self.model = self._create_model()
 
@@ -135,6 +138,35 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
         self.decoder = Decoder(self.max_per_image, self.down_ratio)
         self.kalman_filter = KalmanFilter()
 
+    def reset_tracks(self) -> None:
+        """Discards all tracks and restarts the frame count."""
+        self.tracked_stracks = []
+        self.lost_stracks = []
+        self.removed_stracks = []
+        self.frame_id = 0
+
+    def get_tracks(self) -> Tuple[List[STrack], List[STrack], List[STrack], int]:
+        """Returns the tracks and the frame count, e.g., to be restored by
+        `set_tracks()` when tracking several input sources in turn.
+        """
+        return (
+            self.tracked_stracks,
+            self.lost_stracks,
+            self.removed_stracks,
+            self.frame_id,
+        )
+
+    def set_tracks(
+        self, tracks: Tuple[List[STrack], List[STrack], List[STrack], int]
+    ) -> None:
+        """Restores the tracks and the frame count returned by `get_tracks()`."""
+        (
+            self.tracked_stracks,
+            self.lost_stracks,
+            self.removed_stracks,
+            self.frame_id,
+        ) = tracks
+
     @torch.no_grad()
     def predict(
         self, padded_image: torch.Tensor, image: np.ndarray
@@ -394,9 +426,9 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
                 f"Model file does not exist. Please check that {self.model_path} exists."
             )
 
-        ckpt = torch.load(str(self.model_path), map_location="cpu")
+        ckpt = load_checkpoint(self.model_path, self.mmap_weights)
         model = DLASeg(self.heads, self.down_ratio)
-        model.load_state_dict(ckpt["state_dict"], strict=False)
+        load_state_dict(model, ckpt["state_dict"], self.mmap_weights, strict=False)
         model.to(self.device).eval()
         return model
 
@@ -92,6 +92,7 @@ class FairMOTModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             self.config["min_box_area"],
             self.config["track_buffer"],
             self.config["score_threshold"],
+            self.config["mmap_weights"],
         )
 
     def predict(
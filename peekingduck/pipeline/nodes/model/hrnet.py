@@ -35,7 +35,6 @@ human pose estimation. Requires an object detector.
 from typing import Any, Dict, Optional
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.hrnetv1 import hrnet_model
 
 
 class Node(AbstractNode):
@@ -80,6 +79,8 @@ class Node(AbstractNode):
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.hrnetv1 import hrnet_model
         self.model = hrnet_model.HRNetModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
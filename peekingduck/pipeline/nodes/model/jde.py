@@ -34,7 +34,6 @@ from typing import Any, Dict, Optional
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.jdev1 import jde_model
 
 
 class Node(AbstractNode):
@@ -59,10 +58,17 @@ class Node(AbstractNode):
         :mod:`model.fairmot` produces the ``ids`` attribute which contains the
         tracking IDs of the detections.
 
+        If the frames carry a :term:`source_id`, e.g., from
+        :mod:`input.multi_visual`, each source is tracked separately.
+
     Configs:
         weights_parent_dir (:obj:`Optional[str]`): **default = null**. |br|
             Change the parent directory where weights will be stored by
             replacing ``null`` with an absolute path to the desired directory.
+        mmap_weights (:obj:`bool`): **default = False**. |br|
+            Flag to determine if the weights should be memory-mapped instead
+            of being read into memory. Processes loading the same weights then
+            share their memory, and only the pages which are used are read.
         iou_threshold (:obj:`float`): **default = 0.5**. |br|
             Threshold value for Intersecton-over-Union of detections.
         nms_threshold (:obj:`float`): **default = 0.4**. |br|
@@ -88,7 +94,12 @@ class Node(AbstractNode):
         super().__init__(config, node_path=__name__, **kwargs)
         self._frame_rate = 30.0
 
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.jdev1 import jde_model
         self.model = jde_model.JDEModel(self.config, self._frame_rate)
+        # Tracks of the sources other than the current one, by source_id
+        self._source_id: Any = None
+        self._source_tracks: Dict[Any, Any] = {}
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Tracks objects from image.
@@ -119,6 +130,7 @@ class Node(AbstractNode):
         if frame_rate != self._frame_rate or reset_model:
             self._frame_rate = frame_rate
             self._reset_model()
+        self._switch_source(inputs.get("source_id"))
 
         bboxes, bbox_scores, track_ids = self.model.predict(inputs["img"])
         bbox_labels = np.array(["person"] * len(bboxes))
@@ -131,11 +143,20 @@ class Node(AbstractNode):
             "obj_attrs": {"ids": track_ids},
         }
 
+    def warm_up(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs the model on the synthetic inputs, then discards the tracks
+        created from them.
+        """
+        outputs = self.run(inputs)
+        self.model.tracker.reset_tracks()
+        return outputs
+
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
         return {
             "iou_threshold": float,
             "min_box_area": int,
+            "mmap_weights": bool,
             "nms_threshold": float,
             "score_threshold": float,
             "track_buffer": int,
@@ -149,4 +170,22 @@ class Node(AbstractNode):
         self.logger.info(
             f"Creating new model with frame rate: {self._frame_rate:.2f}..."
         )
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.jdev1 import jde_model
         self.model = jde_model.JDEModel(self.config, self._frame_rate)
+        self._source_tracks = {}
+
+    def _switch_source(self, source_id: Any) -> None:
+        """Swaps in the tracks of the input source `source_id`, so that
+        tracks are never matched across sources. The model is shared by all
+        sources.
+        """
+        if source_id == self._source_id:
+            return
+        tracker = self.model.tracker
+        self._source_tracks[self._source_id] = tracker.get_tracks()
+        if source_id in self._source_tracks:
+            tracker.set_tracks(self._source_tracks.pop(source_id))
+        else:
+            tracker.reset_tracks()
+        self._source_id = source_id
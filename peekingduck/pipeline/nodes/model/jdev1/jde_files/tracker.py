@@ -73,6 +73,7 @@ from peekingduck.pipeline.nodes.model.jdev1.jde_files.utils import (
     scale_coords,
 )
 from peekingduck.pipeline.utils.bbox.transforms import tlwh2xyxyn, xyxy2tlwh
+from peekingduck.pipeline.utils.torch_weights import load_checkpoint, load_state_dict
 
 
 class Tracker:  # pylint: disable=too-many-instance-attributes
@@ -97,6 +98,7 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
         iou_threshold: float,
         nms_threshold: float,
         score_threshold: float,
+        mmap_weights: bool = False,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -115,6 +117,7 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
         self.iou_threshold = iou_threshold
         self.nms_threshold = nms_threshold
         self.score_threshold = score_threshold
+        self.mmap_weights = mmap_weights
 
         self.model = self._create_darknet_model()
 
@@ -127,6 +130,35 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
 
         self.kalman_filter = KalmanFilter()
 
+    def reset_tracks(self) -> None:
+        """Discards all tracks and restarts the frame count."""
+        self.tracked_stracks = []
+        self.lost_stracks = []
+        self.removed_stracks = []
+        self.frame_id = 0
+
+    def get_tracks(self) -> Tuple[List[STrack], List[STrack], List[STrack], int]:
+        """Returns the tracks and the frame count, e.g., to be restored by
+        `set_tracks()` when tracking several input sources in turn.
+        """
+        return (
+            self.tracked_stracks,
+            self.lost_stracks,
+            self.removed_stracks,
+            self.frame_id,
+        )
+
+    def set_tracks(
+        self, tracks: Tuple[List[STrack], List[STrack], List[STrack], int]
+    ) -> None:
+        """Restores the tracks and the frame count returned by `get_tracks()`."""
+        (
+            self.tracked_stracks,
+            self.lost_stracks,
+            self.removed_stracks,
+            self.frame_id,
+        ) = tracks
+
     def track_objects_from_image(
         self, image: np.ndarray
     ) -> Tuple[List[np.ndarray], List[int], List[float]]:
@@ -389,9 +421,9 @@ class Tracker:  # pylint: disable=too-many-instance-attributes
             raise ValueError(
                 f"Model file does not exist. Please check that {self.model_path} exists."
             )
-        ckpt = torch.load(str(self.model_path), map_location="cpu")
+        ckpt = load_checkpoint(self.model_path, self.mmap_weights)
         model = Darknet(self.model_settings, self.device, num_identities=14455)
-        model.load_state_dict(ckpt["model"], strict=False)
+        load_state_dict(model, ckpt["model"], self.mmap_weights, strict=False)
         model.to(self.device).eval()
         return model
 
@@ -95,6 +95,7 @@ class JDEModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             self.config["iou_threshold"],
             self.config["nms_threshold"],
             self.config["score_threshold"],
+            self.config["mmap_weights"],
         )
 
     def predict(
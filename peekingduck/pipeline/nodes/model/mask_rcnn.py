@@ -31,7 +31,6 @@
 
 from typing import Any, Dict
 
-from peekingduck.pipeline.nodes.model.mask_rcnnv1 import mask_rcnn_model
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 
 
@@ -62,6 +61,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         weights_parent_dir (:obj:`Optional[str]`): **default = null**. |br|
             Change the parent directory where weights will be stored by
             replacing ``null`` with an absolute path to the desired directory.
+        mmap_weights (:obj:`bool`): **default = False**. |br|
+            Flag to determine if the weights should be memory-mapped instead
+            of being read into memory. Processes loading the same weights then
+            share their memory, and only the pages which are used are read.
         min_size (:obj:`int`): **default = 800**. |br|
             Minimum size of the image to be rescaled before feeding it to the
             backbone.
@@ -96,6 +99,8 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.mask_rcnnv1 import mask_rcnn_model
         self.model = mask_rcnn_model.MaskRCNNModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -112,13 +117,16 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
             (Dict): Outputs dictionary with the keys `bboxes`, `bbox_labels`,
                 `bbox_scores` and `masks`.
         """
-        bboxes, labels, scores, masks = self.model.predict(inputs["img"])
+        # Skip predicting masks when no node in the pipeline consumes them
+        compute_masks = "masks" not in self.unused_outputs
+        bboxes, labels, scores, masks = self.model.predict(inputs["img"], compute_masks)
 
         outputs = {
             "bboxes": bboxes,
             "bbox_labels": labels,
             "bbox_scores": scores,
-            "masks": masks,
         }
+        if compute_masks:
+            outputs["masks"] = masks
 
         return outputs
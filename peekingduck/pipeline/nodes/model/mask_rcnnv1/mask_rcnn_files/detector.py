@@ -40,6 +40,7 @@ import torch
 from torch import Tensor
 import torchvision.transforms as T
 from peekingduck.pipeline.utils.bbox.transforms import xyxy2xyxyn
+from peekingduck.pipeline.utils.torch_weights import load_checkpoint, load_state_dict
 from peekingduck.pipeline.nodes.model.mask_rcnnv1.mask_rcnn_files.detection.backbone_utils import (
     resnet_fpn_backbone,
 )
@@ -73,6 +74,7 @@ class Detector:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         max_num_detections: int,
         score_threshold: float,
         mask_threshold: float,
+        mmap_weights: bool = False,
     ) -> None:
         self.logger = logging.getLogger(__name__)
 
@@ -90,17 +92,20 @@ class Detector:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         self.max_num_detections = max_num_detections
         self.score_threshold = score_threshold
         self.mask_threshold = mask_threshold
+        self.mmap_weights = mmap_weights
         self.mask_rcnn = self._create_mask_rcnn_model()
         self.filtered_output: Dict[str, Tensor] = {}
 
     @torch.no_grad()
     def predict_instance_mask_from_image(
-        self, image: np.ndarray
+        self, image: np.ndarray, compute_masks: bool = True
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Mask R-CNN masks and bboxes prediction function
 
         Args:
             image (np.ndarray): image in numpy array
+            compute_masks (bool): whether to run the mask branch. If False, an
+                empty array of masks is returned
 
         Returns:
             bboxes (np.ndarray): array of detected bboxes
@@ -110,8 +115,16 @@ class Detector:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         """
         img_shape = image.shape[:2]
         processed_images = self._preprocess(image)
-        # run network, assumes batch size of 1 for peekingduck inference
-        network_output = self.mask_rcnn(processed_images)[0]
+        roi_heads = self.mask_rcnn.roi_heads
+        mask_roi_pool = roi_heads.mask_roi_pool
+        if not compute_masks:
+            # RoIHeads skips the mask branch when it has no mask_roi_pool
+            roi_heads.mask_roi_pool = None
+        try:
+            # run network, assumes batch size of 1 for peekingduck inference
+            network_output = self.mask_rcnn(processed_images)[0]
+        finally:
+            roi_heads.mask_roi_pool = mask_roi_pool
         bboxes, labels, scores, masks = self._postprocess(network_output, img_shape)
 
         return bboxes, labels, scores, masks
@@ -166,9 +179,9 @@ class Detector:  # pylint: disable=too-few-public-methods,too-many-instance-attr
             (MaskRCNN): Mask-RCNN model loaded with weights
         """
         if self.model_path.is_file():
-            state_dict = torch.load(self.model_path, map_location=self.device)
+            state_dict = load_checkpoint(self.model_path, self.mmap_weights)
             model = self._get_model()
-            model.load_state_dict(state_dict)
+            load_state_dict(model, state_dict, self.mmap_weights)
             model.eval().to(self.device)
             return model
 
@@ -222,9 +235,10 @@ class Detector:  # pylint: disable=too-few-public-methods,too-many-instance-attr
 
                 scores = self.filtered_output["scores"].cpu().numpy()
 
-                # Binarize mask's pixel values by confidence score
-                masks = self.filtered_output["masks"] > self.mask_threshold
-                masks = masks.squeeze(1).cpu().numpy().astype(np.uint8)
+                if "masks" in network_output:
+                    # Binarize mask's pixel values by confidence score
+                    masks = self.filtered_output["masks"] > self.mask_threshold
+                    masks = masks.squeeze(1).cpu().numpy().astype(np.uint8)
 
         return bboxes, labels, scores, masks
 
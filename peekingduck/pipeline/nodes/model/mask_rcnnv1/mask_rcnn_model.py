@@ -78,6 +78,7 @@ class MaskRCNNModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             self.config["max_num_detections"],
             self.config["score_threshold"],
             self.config["mask_threshold"],
+            self.config["mmap_weights"],
         )
 
     @property
@@ -94,12 +95,14 @@ class MaskRCNNModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
         self._detect_ids = ids
 
     def predict(
-        self, image: np.ndarray
+        self, image: np.ndarray, compute_masks: bool = True
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Predicts bboxes and masks from image.
 
         Args:
             image (np.ndarray): Input image frame.
+            compute_masks (bool): Whether to predict masks. If False, an empty
+                array of masks is returned.
 
         Returns:
             (Tuple[np.ndarray, np.ndarray, np.ndarray]): Returned tuple
@@ -114,4 +117,4 @@ class MaskRCNNModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
         """
         if not isinstance(image, np.ndarray):
             raise TypeError("image must be a np.ndarray")
-        return self.detector.predict_instance_mask_from_image(image)
+        return self.detector.predict_instance_mask_from_image(image, compute_masks)
@@ -36,7 +36,6 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.mtcnnv1 import mtcnn_model
 
 
 class Node(AbstractNode):
@@ -94,6 +93,8 @@ class Node(AbstractNode):
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.mtcnnv1 import mtcnn_model
         self.model = mtcnn_model.MTCNNModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -20,7 +20,6 @@ from typing import Any, Dict, List, Optional, Union
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.rt_detrv1.rt_detr_model import RTDETRModel
 
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
@@ -76,6 +75,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
     """
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.rt_detrv1.rt_detr_model import (
+            RTDETRModel,
+        )
         self.model = RTDETRModel(self.config)
 
 
@@ -98,6 +101,32 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         return {"bboxes": bboxes, "bbox_labels": labels, "bbox_scores": scores}
 
 
+    def run_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Detects objects in the `img` of several frames in a single
+        batched forward pass.
+
+        Args:
+            inputs (List[Dict]): Inputs dictionary with the key `img` for each
+                frame.
+
+        Returns:
+            (List[Dict]): Outputs dictionary with the keys `bboxes`,
+                `bbox_labels`, and `bbox_scores` for each frame.
+        """
+        predictions = self.model.predict_batch([frame["img"] for frame in inputs])
+        return [
+            {
+                "bboxes": np.clip(bboxes, 0, 1),
+                "bbox_labels": labels,
+                "bbox_scores": scores,
+            }
+            for bboxes, labels, scores in predictions
+        ]
+
+    def release_resources(self) -> None:
+        """Override base class method to release the shared model."""
+        self.model.release()
+
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
         return {
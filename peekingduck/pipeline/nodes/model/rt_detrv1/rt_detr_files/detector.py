@@ -17,13 +17,14 @@
 
 import logging
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 import cv2
 from PIL import Image
 import numpy as np
 import torch
 from transformers import RTDetrForObjectDetection, RTDetrImageProcessor
 
+from peekingduck.pipeline.nodes.model_registry import ModelKey, ModelRegistry
 from peekingduck.pipeline.utils.bbox.transforms import xyxy2xyxyn
 
 
@@ -38,6 +39,8 @@ class Detector:  # pylint: disable=too-many-instance-attributes
             will be allocated.
         model (RTDetrForObjectDetection): The RT-DETR model for performing inference.
         image_processor (RTDetrImageProcessor): The RT-DETR image processor.
+        registry_key (Optional[ModelKey]): Key of the model and image
+            processor shared through the model registry.
     """
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -56,7 +59,17 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         self.input_size = (input_size, input_size)
         self.score_threshold = score_threshold
 
-        self.model, self.image_processor = self.create_rtdetr_model()
+        self.registry_key: Optional[ModelKey] = ModelKey(
+            "rt_detr",
+            Path(str(model_path)).name,
+            "huggingface",
+            str(model_path),
+            self.device.type,
+            "float",
+        )
+        self.model, self.image_processor = ModelRegistry.acquire(
+            self.registry_key, self.create_rtdetr_model
+        )
 
         self.id2label = self.model.config.id2label
         label2id = {v: k for k, v in self.id2label.items()}
@@ -101,6 +114,39 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         return bboxes, classes, scores
 
 
+    @torch.no_grad()
+    def predict_object_bboxes_from_images(
+        self, images: List[np.ndarray]
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Detects bounding boxes of selected object categories from several
+        images in a single forward pass.
+
+        Args:
+            images (List[np.ndarray]): Input images, which may be of different
+                sizes.
+
+        Returns:
+            (List[Tuple[np.ndarray, np.ndarray, np.ndarray]]): Detection
+            bboxes, human-friendly class names, and scores of each image.
+        """
+        image_shapes = [image.shape[:2] for image in images]
+
+        inputs = self.preprocess(images)
+
+        self.model = self.model.to(self.device)
+        predictions = self.model(**inputs)
+
+        results = self.image_processor.post_process_object_detection(
+            predictions,
+            target_sizes=torch.tensor(image_shapes),
+            threshold=self.score_threshold,
+        )
+        return [
+            self._filter_result(result, image_shape)
+            for result, image_shape in zip(results, image_shapes)
+        ]
+
+
     def create_rtdetr_model(self) -> Tuple[RTDetrForObjectDetection, RTDetrImageProcessor]:
         """Creates a RT-DETR model and loads its weights. Also loads the image
         processor required to preprocess and postprocess the inference results.
@@ -117,9 +163,21 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         )
 
 
+    def release(self) -> None:
+        """Releases the hold on the RT-DETR model shared through the model
+        registry.
+        """
+        if self.registry_key is not None:
+            ModelRegistry.release(self.registry_key)
+            self.registry_key = None
+
+
     def preprocess(self, image, return_tensors="pt"):
         # HuggingFace image processors take in PIL images typically...
-        image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        if isinstance(image, list):
+            image = [Image.fromarray(cv2.cvtColor(i, cv2.COLOR_BGR2RGB)) for i in image]
+        else:
+            image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
         inputs = self.image_processor(images=image, return_tensors=return_tensors)
         inputs = inputs.to(self.device)
         return inputs
@@ -131,7 +189,13 @@ class Detector:  # pylint: disable=too-many-instance-attributes
             target_sizes=torch.tensor([(image_shape[0], image_shape[1])]), 
             threshold=self.score_threshold,
         )[0]
+        return self._filter_result(result, image_shape)
 
+
+    def _filter_result(self, result, image_shape):
+        """Filters a single post-processed result by `detect_ids` and
+        normalizes the bboxes w.r.t. `image_shape`.
+        """
         bboxes = result["boxes"].detach().cpu().numpy()
         classes = result["labels"].detach().cpu().numpy()
         scores = result["scores"].detach().cpu().numpy()
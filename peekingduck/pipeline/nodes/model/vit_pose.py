@@ -18,7 +18,6 @@
 from typing import Any, Dict, Optional
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.vit_posev1.vit_pose_model import VITPoseModel
 
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
@@ -74,6 +73,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
     """
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.vit_posev1.vit_pose_model import (
+            VITPoseModel,
+        )
         self.model = VITPoseModel(self.config)
 
 
@@ -91,6 +94,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         }
 
 
+    def release_resources(self) -> None:
+        """Override base class method to release the shared model."""
+        self.model.release()
+
     def _get_config_types(self) -> Dict[str, Any]:
         """
         Returns dictionary mapping the node's config keys to respective types.
@@ -17,13 +17,14 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 import cv2
 from PIL import Image
 import numpy as np
 import torch
 from transformers import VitPoseForPoseEstimation, VitPoseImageProcessor
 
+from peekingduck.pipeline.nodes.model_registry import ModelKey, ModelRegistry
 from peekingduck.pipeline.utils.bbox.transforms import xyxyn2tlwh
 
 
@@ -51,6 +52,8 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         model (VitPoseForPoseEstimation): The VITPose model for performing 
             inference.
         image_processor (VitPoseImageProcessor): The VITPose image processor.
+        registry_key (Optional[ModelKey]): Key of the model and image
+            processor shared through the model registry.
     """
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -68,7 +71,17 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         
         self.keypoint_score_threshold = keypoint_score_threshold
 
-        self.model, self.image_processor = self.create_model()
+        self.registry_key: Optional[ModelKey] = ModelKey(
+            "vit_pose",
+            Path(str(model_path)).name,
+            "huggingface",
+            str(model_path),
+            self.device.type,
+            "float",
+        )
+        self.model, self.image_processor = ModelRegistry.acquire(
+            self.registry_key, self.create_model
+        )
 
         self.log()
 
@@ -88,6 +101,15 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         )
 
 
+    def release(self) -> None:
+        """Releases the hold on the VITPose model shared through the model
+        registry.
+        """
+        if self.registry_key is not None:
+            ModelRegistry.release(self.registry_key)
+            self.registry_key = None
+
+
     @torch.no_grad()
     def predict_keypoints_from_image(
         self, image: np.ndarray, bboxes: np.ndarray,
@@ -68,6 +68,10 @@ class VITPoseModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
         )
 
 
+    def release(self) -> None:
+        """Releases the hold on the model shared through the model registry."""
+        self.detector.release()
+
     def predict(
         self, 
         image: np.ndarray,
@@ -31,7 +31,6 @@
 
 from typing import Any, Dict
 
-from peekingduck.pipeline.nodes.model.yolact_edgev1 import yolact_edge_model
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 
 
@@ -60,6 +59,10 @@ class Node(AbstractNode):
         weights_parent_dir (:obj:`Optional[str]`): **default = null**. |br|
             Change the parent directory where weights will be stored by
             replacing ``null`` with an absolute path to the desired directory.
+        mmap_weights (:obj:`bool`): **default = False**. |br|
+            Flag to determine if the weights should be memory-mapped instead
+            of being read into memory. Processes loading the same weights then
+            share their memory, and only the pages which are used are read.
         input_size (:obj:`int`): **default = 550**. |br|
             Input image resolution of the YolactEdge model.
         detect (:obj:`List[Union[int, string]]`): **default=[0]**. |br|
@@ -85,6 +88,8 @@ class Node(AbstractNode):
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.yolact_edgev1 import yolact_edge_model
         self.model = yolact_edge_model.YolactEdgeModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -101,13 +106,16 @@ class Node(AbstractNode):
             (Dict): Outputs dictionary with the keys `bboxes`, `bbox_labels`,
                 `bbox_scores` and `masks`.
         """
-        bboxes, labels, scores, masks = self.model.predict(inputs["img"])
+        # Skip predicting masks when no node in the pipeline consumes them
+        compute_masks = "masks" not in self.unused_outputs
+        bboxes, labels, scores, masks = self.model.predict(inputs["img"], compute_masks)
 
         outputs = {
             "bboxes": bboxes,
             "bbox_labels": labels,
             "bbox_scores": scores,
-            "masks": masks,
         }
+        if compute_masks:
+            outputs["masks"] = masks
 
         return outputs
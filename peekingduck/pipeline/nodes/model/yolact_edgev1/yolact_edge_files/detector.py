@@ -75,6 +75,7 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         max_num_detections: int,
         score_threshold: float,
         iou_threshold: float,
+        mmap_weights: bool = False,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.device_is_cuda: bool = torch.cuda.is_available()
@@ -91,6 +92,7 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         self.max_num_detections = max_num_detections
         self.score_threshold = score_threshold
         self.iou_threshold = iou_threshold
+        self.mmap_weights = mmap_weights
 
         self.update_detect_ids(detect_ids)
         self.yolact_edge = self._create_yolact_edge_model()
@@ -98,12 +100,14 @@ class Detector:  # pylint: disable=too-many-instance-attributes
 
     @torch.no_grad()
     def predict_instance_mask_from_image(
-        self, image: np.ndarray
+        self, image: np.ndarray, compute_masks: bool = True
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """YolactEdge masks and bboxes prediction function
 
         Args:
             image (np.ndarray): image in numpy array.
+            compute_masks (bool): whether to assemble the masks from the
+                prototypes. If False, an empty array of masks is returned.
 
         Returns:
             bboxes (np.ndarray): array of detected bboxes
@@ -130,7 +134,9 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         preds = model(FastBaseTransform(self.input_size)(frame.unsqueeze(0)))[
             "pred_outs"
         ]
-        labels, scores, boxes, masks = self._postprocess(preds[0], img_shape)
+        labels, scores, boxes, masks = self._postprocess(
+            preds[0], img_shape, compute_masks
+        )
 
         return boxes, labels, scores, masks
 
@@ -185,7 +191,7 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         """
         if self.model_path.is_file():
             model = self._get_model()
-            model.load_weights(self.model_path)
+            model.load_weights(self.model_path, self.mmap_weights)
             model.eval()
             if self.device_is_cuda:
                 model = model.cuda()
@@ -199,6 +205,7 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         self,
         network_output: Dict[str, Tensor],
         img_shape: Tuple[int, ...],
+        compute_masks: bool = True,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Postprocessing of detected bboxes and masks for YolactEdge
 
@@ -207,6 +214,7 @@ class Detector:  # pylint: disable=too-many-instance-attributes
                 element of the YolactEdge output. The keys are "class", "box",
                 "score", "mask", and "proto"
             img_shape (Tuple[int, int]): height and width of original image
+            compute_masks (bool): whether to assemble the masks
 
         Returns:
             labels (ndarray): An array of human-friendly detection class names
@@ -232,30 +240,33 @@ class Detector:  # pylint: disable=too-many-instance-attributes
             classes = network_output["class"]
             box = network_output["box"]
             score = network_output["score"]
-            mask = network_output["mask"]
-            proto_data = network_output["proto"]
-
-            mask = proto_data @ mask.t()
-            mask = torch.sigmoid(mask)
-            mask = crop(mask, box)
-            mask = mask.permute(2, 0, 1).contiguous()
-            mask = (
-                F.interpolate(
-                    mask.unsqueeze(0),
-                    (img_shape[0], img_shape[1]),
-                    mode="bilinear",
-                    align_corners=False,
-                )
-                .squeeze(0)
-                .gt_(0.5)
-            )
 
             # Filters the detections to the IDs being detected as specified in the config
             labels = np.array([self.class_names[i] for i in classes[detect_filter]])
             boxes = np.array(box[detect_filter].cpu().numpy())
             boxes = np.clip(boxes, 0, 1)
             scores = np.array(score[detect_filter].cpu().numpy())
-            masks = np.array(mask[detect_filter].cpu().numpy()).astype(np.uint8)
+            masks = np.empty((0, 0, 0), dtype=np.uint8)
+
+            if compute_masks:
+                mask = network_output["mask"]
+                proto_data = network_output["proto"]
+
+                mask = proto_data @ mask.t()
+                mask = torch.sigmoid(mask)
+                mask = crop(mask, box)
+                mask = mask.permute(2, 0, 1).contiguous()
+                mask = (
+                    F.interpolate(
+                        mask.unsqueeze(0),
+                        (img_shape[0], img_shape[1]),
+                        mode="bilinear",
+                        align_corners=False,
+                    )
+                    .squeeze(0)
+                    .gt_(0.5)
+                )
+                masks = np.array(mask[detect_filter].cpu().numpy()).astype(np.uint8)
 
         except TypeError:
             return (
@@ -118,6 +118,7 @@ from peekingduck.pipeline.nodes.model.yolact_edgev1.yolact_edge_files.backbone i
     ResNetBackbone,
     MobileNetV2Backbone,
 )
+from peekingduck.pipeline.utils.torch_weights import load_checkpoint, load_state_dict
 
 if torch.cuda.is_available():
     torch.cuda.current_device()
@@ -268,16 +269,18 @@ class YolactEdge(nn.Module):  # pylint: disable=too-many-instance-attributes
         outs_wrapper["pred_outs"] = self.detect(pred_outs)
         return outs_wrapper
 
-    def load_weights(self, path: Path) -> None:
+    def load_weights(self, path: Path, mmap: bool = False) -> None:
         """Loads weights from a compressed save file.
 
         Args:
             path (Path): Path to the model weights file.
+            mmap (bool): Flag to determine if the weights should be
+                memory-mapped.
 
         Returns:
             YolactEdge model
         """
-        state_dict = torch.load(path, map_location="cpu")
+        state_dict = load_checkpoint(path, mmap)
         for key in list(state_dict.keys()):
             # For backward compatibility, the new variable is called layers.
             # This has been commented out because the ResNet and MobileNetV2
@@ -295,7 +298,7 @@ class YolactEdge(nn.Module):  # pylint: disable=too-many-instance-attributes
             elif key.startswith("fpn.") and key in state_dict:
                 state_dict[key.replace("fpn.", "fpn_phase_2.")] = state_dict[key]
                 del state_dict[key]
-        self.load_state_dict(state_dict)
+        load_state_dict(self, state_dict, mmap)
 
 
 class PredictionModule(nn.Module):  # pylint: disable=too-many-instance-attributes
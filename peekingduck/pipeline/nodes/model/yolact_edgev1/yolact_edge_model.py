@@ -68,6 +68,7 @@ class YolactEdgeModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             self.config["max_num_detections"],
             self.config["score_threshold"],
             self.config["iou_threshold"],
+            self.config["mmap_weights"],
         )
 
     @property
@@ -82,12 +83,14 @@ class YolactEdgeModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
         self._detect_ids = ids
 
     def predict(
-        self, image: np.ndarray
+        self, image: np.ndarray, compute_masks: bool = True
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Predicts bboxes and masks from image.
 
         Args:
             image (np.ndarray): Input image frame.
+            compute_masks (bool): Whether to predict masks. If False, an empty
+                array of masks is returned.
 
         Returns:
             (Tuple[np.ndarray, np.ndarray, np.ndarray]): Returned tuple
@@ -102,4 +105,4 @@ class YolactEdgeModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
         """
         if not isinstance(image, np.ndarray):
             raise TypeError("Image must be a np.ndarray")
-        return self.detector.predict_instance_mask_from_image(image)
+        return self.detector.predict_instance_mask_from_image(image, compute_masks)
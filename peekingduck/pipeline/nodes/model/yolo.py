@@ -35,7 +35,6 @@ import cv2
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.yolov4 import yolo_model
 
 
 class Node(AbstractNode):
@@ -93,6 +92,8 @@ class Node(AbstractNode):
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.yolov4 import yolo_model
         self.model = yolo_model.YOLOModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -37,7 +37,6 @@ import cv2
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.yolov4_face import yolo_face_model
 
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
@@ -91,6 +90,8 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.yolov4_face import yolo_face_model
         self.model = yolo_face_model.YOLOFaceModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
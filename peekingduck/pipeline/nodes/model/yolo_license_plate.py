@@ -35,9 +35,6 @@ import cv2
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.yolov4_license_plate import (
-    yolo_license_plate_model,
-)
 
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
@@ -84,6 +81,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.yolov4_license_plate import (
+            yolo_license_plate_model,
+        )
         self.model = yolo_license_plate_model.YOLOLicensePlateModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -34,7 +34,6 @@ from typing import Any, Dict, List, Optional, Union
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.nodes.model.yoloxv1 import yolox_model
 
 
 class Node(AbstractNode):  # pylint: disable=too-few-public-methods
@@ -66,6 +65,10 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
         weights_parent_dir (:obj:`Optional[str]`): **default = null**. |br|
             Change the parent directory where weights will be stored by
             replacing ``null`` with an absolute path to the desired directory.
+        mmap_weights (:obj:`bool`): **default = False**. |br|
+            Flag to determine if the weights should be memory-mapped instead
+            of being read into memory. Processes loading the same weights then
+            share their memory, and only the pages which are used are read.
         input_size (:obj:`int`): **default=416**. |br|
             Input image resolution of the YOLOX model.
         detect (:obj:`List[Union[int, str]]`): **default=[0]**. |br|
@@ -98,6 +101,8 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
         super().__init__(config, node_path=__name__, **kwargs)
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.pipeline.nodes.model.yoloxv1 import yolox_model
         self.model = yolox_model.YOLOXModel(self.config)
 
     def run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -121,6 +126,32 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
 
         return outputs
 
+    def run_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Detects objects in the `img` of several frames in a single
+        batched forward pass.
+
+        Args:
+            inputs (List[Dict]): Inputs dictionary with the key `img` for each
+                frame.
+
+        Returns:
+            (List[Dict]): Outputs dictionary with the keys `bboxes`,
+                `bbox_labels`, and `bbox_scores` for each frame.
+        """
+        predictions = self.model.predict_batch([frame["img"] for frame in inputs])
+        return [
+            {
+                "bboxes": np.clip(bboxes, 0, 1),
+                "bbox_labels": labels,
+                "bbox_scores": scores,
+            }
+            for bboxes, labels, scores in predictions
+        ]
+
+    def release_resources(self) -> None:
+        """Override base class method to release the shared model."""
+        self.model.release()
+
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
         return {
@@ -130,6 +161,7 @@ class Node(AbstractNode):  # pylint: disable=too-few-public-methods
             "half": bool,
             "input_size": int,
             "iou_threshold": float,
+            "mmap_weights": bool,
             "model_format": str,
             "model_type": str,
             "score_threshold": float,
@@ -31,7 +31,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -40,7 +40,9 @@ import torchvision
 
 from peekingduck.pipeline.nodes.model.yoloxv1.yolox_files.model import YOLOX
 from peekingduck.pipeline.nodes.model.yoloxv1.yolox_files.utils import fuse_model
+from peekingduck.pipeline.nodes.model_registry import ModelKey, ModelRegistry
 from peekingduck.pipeline.utils.bbox.transforms import xywh2xyxy, xyxy2xyxyn
+from peekingduck.pipeline.utils.torch_weights import load_checkpoint, load_state_dict
 
 NUM_CHANNELS = 3
 
@@ -55,6 +57,8 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         device (torch.device): Represents the device on which the torch.Tensor
             will be allocated.
         half (bool): Flag to determine if half-precision should be used.
+        registry_key (Optional[ModelKey]): Key of the PyTorch model shared
+            through the model registry, None if not shared.
         yolox (YOLOX): The YOLOX model for performing inference.
     """
 
@@ -74,6 +78,7 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         input_size: int,
         iou_threshold: float,
         score_threshold: float,
+        mmap_weights: bool = False,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -91,9 +96,21 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         self.input_size = (input_size, input_size)
         self.iou_threshold = iou_threshold
         self.score_threshold = score_threshold
+        self.mmap_weights = mmap_weights
 
         self.update_detect_ids(detect_ids)
 
+        # TensorRT engines hold per-instance buffers and are not shared
+        self.registry_key: Optional[ModelKey] = None
+        if self.model_format == "pytorch":
+            self.registry_key = ModelKey(
+                "yolox",
+                self.model_type,
+                self.model_format,
+                str(self.model_path),
+                self.device.type,
+                f"{'half' if self.half else 'float'}{'-fused' if self.fuse else ''}",
+            )
         self.yolox = self._create_yolox_model()
 
     @torch.no_grad()
@@ -142,6 +159,38 @@ class Detector:  # pylint: disable=too-many-instance-attributes
 
         return bboxes, classes, scores
 
+    @torch.no_grad()
+    def predict_object_bboxes_from_images(
+        self, images: List[np.ndarray]
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Detects bounding boxes of selected object categories from several
+        images in a single forward pass.
+
+        Only the PyTorch model supports batched inference, images are
+        processed one at a time for other model formats.
+
+        Args:
+            images (List[np.ndarray]): Input images, which may be of different
+                sizes.
+
+        Returns:
+            (List[Tuple[np.ndarray, np.ndarray, np.ndarray]]): Detection
+            bboxes, human-friendly class names, and scores of each image.
+        """
+        if self.model_format != "pytorch":
+            return [self.predict_object_bbox_from_image(image) for image in images]
+
+        image_sizes = [image.shape[:2] for image in images]
+        preprocessed, scales = zip(*[self._preprocess(image) for image in images])
+        batch = torch.from_numpy(np.stack(preprocessed)).to(self.device)
+        batch = batch.half() if self.half else batch.float()
+        predictions = self.yolox(batch)
+
+        return [
+            self._postprocess(prediction, scale, image_size, self.class_names)
+            for prediction, scale, image_size in zip(predictions, scales, image_sizes)
+        ]
+
     def update_detect_ids(self, ids: List[int]) -> None:
         """Updates list of selected object category IDs. When the list is
         empty, all available object category IDs are detected.
@@ -174,7 +223,17 @@ class Detector:  # pylint: disable=too-many-instance-attributes
             f"Half-precision floating-point: {self.half}\n\t"
             f"Fuse convolution and batch normalization layers: {self.fuse}"
         )
-        return self._load_yolox_weights()
+        if self.registry_key is None:
+            return self._load_yolox_weights()
+        return ModelRegistry.acquire(self.registry_key, self._load_yolox_weights)
+
+    def release(self) -> None:
+        """Releases the hold on the YOLOX model shared through the model
+        registry.
+        """
+        if self.registry_key is not None:
+            ModelRegistry.release(self.registry_key)
+            self.registry_key = None
 
     def _get_model(self, model_size: Dict[str, float]) -> YOLOX:
         """Constructs YOLOX model based on parsed configuration.
@@ -208,12 +267,13 @@ class Detector:  # pylint: disable=too-many-instance-attributes
         model_format = self.model_format
         if model_format == "pytorch":
             if self.model_path.is_file():
-                ckpt = torch.load(str(self.model_path), map_location="cpu")
-                model = self._get_model(self.model_size).to(self.device)
+                ckpt = load_checkpoint(self.model_path, self.mmap_weights)
+                model = self._get_model(self.model_size)
+                load_state_dict(model, ckpt["model"], self.mmap_weights)
+                model.to(self.device)
                 if self.half:
                     model.half()
                 model.eval()
-                model.load_state_dict(ckpt["model"])
 
                 if self.fuse:
                     model = fuse_model(model)
@@ -84,6 +84,7 @@ class YOLOXModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             self.config["input_size"],
             self.config["iou_threshold"],
             self.config["score_threshold"],
+            self.config["mmap_weights"],
         )
 
     @property
@@ -97,6 +98,10 @@ class YOLOXModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
             raise TypeError("detect_ids has to be a list")
         self._detect_ids = ids
 
+    def release(self) -> None:
+        """Releases the hold on the model shared through the model registry."""
+        self.detector.release()
+
     def predict(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Predicts bboxes from image.
 
@@ -116,3 +121,23 @@ class YOLOXModel(ThresholdCheckerMixin, WeightsDownloaderMixin):
         if not isinstance(image, np.ndarray):
             raise TypeError("image must be a np.ndarray")
         return self.detector.predict_object_bbox_from_image(image)
+
+    def predict_batch(
+        self, images: List[np.ndarray]
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Predicts bboxes from several images in a single batch.
+
+        Args:
+            images (List[np.ndarray]): Input image frames.
+
+        Returns:
+            (List[Tuple[np.ndarray, np.ndarray, np.ndarray]]): A tuple of
+            detection bboxes, human-friendly class names, and scores for each
+            image.
+
+        Raises:
+            TypeError: Any of the provided `images` is not a numpy array.
+        """
+        if not all(isinstance(image, np.ndarray) for image in images):
+            raise TypeError("image must be a np.ndarray")
+        return self.detector.predict_object_bboxes_from_images(images)
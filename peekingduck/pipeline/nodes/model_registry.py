@@ -0,0 +1,120 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""Process-wide registry of loaded models shared by model nodes."""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+
+class ModelKey(NamedTuple):
+    """Identifies a loaded model. Model nodes with equal keys share the same
+    model instance.
+
+    Attributes:
+        model (str): Name of the model, e.g., "yolox".
+        model_type (str): Model type, e.g., "yolox-tiny".
+        model_format (str): Weights format, e.g., "pytorch".
+        weights_path (str): Path to the weights file or directory.
+        device (str): Device the model is loaded on, e.g., "cpu".
+        precision (str): Precision of the model weights, e.g., "float".
+    """
+
+    model: str
+    model_type: str
+    model_format: str
+    weights_path: str
+    device: str
+    precision: str
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    """A registered model and the number of its holders."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.model: Optional[Any] = None
+        self.refcount = 0
+
+
+class ModelRegistry:
+    """Shares loaded models across model nodes, and pipelines, in the same
+    process.
+
+    A model is loaded by the first :py:meth:`acquire` of its key and kept in
+    the registry until every holder has called :py:meth:`release`. Holders
+    keep their own reference, so a released model stays usable by them while
+    later acquires load it again. Models are shared as-is, so only models
+    which are not modified after loading, e.g., by per-node settings, should
+    be registered.
+    """
+
+    _lock = threading.Lock()
+    _entries: Dict[ModelKey, _Entry] = {}
+
+    @classmethod
+    def acquire(cls, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        """Returns the model registered under ``key``, calling ``loader`` to
+        load it if it is not registered. Concurrent acquires of the same key
+        load the model once.
+
+        Args:
+            key (ModelKey): Key identifying the model.
+            loader (Callable[[], Any]): Loads the model.
+
+        Returns:
+            (Any): The shared model.
+        """
+        with cls._lock:
+            entry = cls._entries.setdefault(key, _Entry())
+            entry.refcount += 1
+        with entry.lock:
+            if entry.model is None:
+                try:
+                    entry.model = loader()
+                except BaseException:
+                    cls.release(key)
+                    raise
+            else:
+                logger.info(f"Reusing loaded {key.model} model: {key.model_type}")
+        return entry.model
+
+    @classmethod
+    def release(cls, key: ModelKey) -> None:
+        """Releases one hold on the model registered under ``key``. The model
+        is removed from the registry once it has no holders.
+
+        Args:
+            key (ModelKey): Key identifying the model.
+        """
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount <= 0:
+                del cls._entries[key]
+
+    @classmethod
+    def refcount(cls, key: ModelKey) -> int:
+        """Returns the number of holders of the model registered under
+        ``key``.
+        """
+        with cls._lock:
+            entry = cls._entries.get(key)
+            return 0 if entry is None else entry.refcount
@@ -113,6 +113,13 @@ class Node(AbstractNode):
         return {}
 
 
+    @property
+    def output_file_path(self) -> Path:
+        """Path of the CSV file written by this node, including the appended
+        timestamp."""
+        return self._file_path_datetime
+
+
     def _norm_to_pixel_coords(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Converts normalized [x, y] coordinates to pixel coordinates for
         `bboxes`, `keypoints` and `keypoint_conns`."""
@@ -33,12 +33,13 @@ Writes the output image/video to file.
 
 import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import cv2
 import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.nodes.output.utils.async_writer import AsyncWriter
 
 # role of this node is to be able to take in multiple frames, stitch them
 # together and output them.
@@ -63,9 +64,31 @@ class Node(AbstractNode):
     Outputs:
         |none_output_data|
 
+    If the frames carry a :term:`source_id`, e.g., from
+    :mod:`input.multi_visual`, the frames of each source are written to a
+    separate file.
+
     Configs:
         output_dir (:obj:`str`): **default = "PeekingDuck/data/output"**. |br|
             Output directory for files to be written locally.
+        write_queue_size (:obj:`int`): **default = 16**. [1]_ |br|
+            Maximum number of frames waiting to be encoded and written by
+            background threads, so that encoding does not add to the latency
+            of the pipeline. The queued frames are written before the files
+            are closed on ``pipeline_end``. Set to 0 to encode and write each
+            frame in the pipeline loop instead.
+        backpressure (:obj:`str`): **{"block", "drop"}, default = "block"**.
+            [1]_ |br|
+            What happens when a frame arrives while ``write_queue_size``
+            frames are waiting: |br|
+            - "block" : wait for a frame to be written, no frames are lost |br|
+            - "drop" : discard the new frame, so that the pipeline is never
+            slowed down by writing
+        num_encoders (:obj:`int`): **default = 2**. [1]_ |br|
+            Number of threads encoding JPEG/PNG image outputs in parallel.
+            Video frames are always encoded in order by a single thread.
+
+    .. [1] advanced configuration
     """
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs: Any) -> None:
@@ -76,6 +99,15 @@ class Node(AbstractNode):
         self._file_path_with_timestamp: Optional[str] = None
         self._image_type: Optional[str] = None
         self.writer = None
+        self._async_writer: Optional[AsyncWriter] = None
+        if self.write_queue_size > 0:
+            self._async_writer = AsyncWriter(
+                self.write_queue_size, self.backpressure, self.num_encoders
+            )
+        # File names, paths, types, and writers of the sources other than the
+        # current one, by source_id
+        self._source_id: Any = None
+        self._source_writers: Dict[Any, Tuple[Any, Any, Any, Any]] = {}
         self._prepare_directory(self.output_dir)
         self._fourcc = cv2.VideoWriter_fourcc(*"mp4v")
         self.logger.info(f"Output directory used is: {self.output_dir}")
@@ -84,9 +116,9 @@ class Node(AbstractNode):
         """Writes media information to filepath."""
         # reset and terminate when there are no more data
         if inputs["pipeline_end"]:
-            if self.writer:  # images automatically releases writer
-                self.writer.release()
+            self._release_writers()
             return {}
+        self._switch_source(inputs.get("source_id"))
         if not self._file_name:
             self._prepare_writer(
                 inputs["filename"], inputs["img"], inputs["saved_video_fps"]
@@ -99,12 +131,84 @@ class Node(AbstractNode):
 
         return {}
 
+    @property
+    def output_file_path(self) -> Optional[str]:
+        """Path of the file currently written by this node, including the
+        appended timestamp."""
+        return self._file_path_with_timestamp
+
+    def release_resources(self) -> None:
+        """Override base class method to write the queued frames and close
+        the files if the pipeline stopped before `pipeline_end`.
+        """
+        self._release_writers()
+        if self._async_writer:
+            self._async_writer.shutdown()
+            self._async_writer = None
+
     def _get_config_types(self) -> Dict[str, Any]:
         """Returns dictionary mapping the node's config keys to respective types."""
-        return {"output_dir": str}
+        return {
+            "backpressure": str,
+            "num_encoders": int,
+            "output_dir": str,
+            "write_queue_size": int,
+        }
+
+    def _release_writers(self) -> None:
+        """Closes the video files of every source, once their queued frames
+        are written.
+        """
+        self._switch_source(None)
+        writers = [writer for _, _, _, writer in self._source_writers.values()]
+        writers.append(self.writer)
+        self._source_writers = {}
+        self._file_name = None
+        self.writer = None
+        for writer in writers:
+            if writer:  # images automatically releases writer
+                self._release_writer(writer)
+        if self._async_writer:
+            self._async_writer.flush()
+            if self._async_writer.dropped_frames > 0:
+                self.logger.warning(
+                    f"Dropped {self._async_writer.dropped_frames} frames as "
+                    f"writing could not keep up with the pipeline"
+                )
+                self._async_writer.dropped_frames = 0
+
+    def _release_writer(self, writer: cv2.VideoWriter) -> None:
+        """Closes a video file, after its queued frames are written."""
+        if self._async_writer:
+            self._async_writer.release_video(writer)
+        else:
+            writer.release()
+
+    def _switch_source(self, source_id: Any) -> None:
+        """Swaps in the file and writer of the input source `source_id`."""
+        if source_id == self._source_id:
+            return
+        self._source_writers[self._source_id] = (
+            self._file_name,
+            self._file_path_with_timestamp,
+            self._image_type,
+            self.writer,
+        )
+        (
+            self._file_name,
+            self._file_path_with_timestamp,
+            self._image_type,
+            self.writer,
+        ) = self._source_writers.pop(source_id, (None, None, None, None))
+        self._source_id = source_id
 
     def _write(self, img: np.ndarray) -> None:
-        if self._image_type == "image":
+        if self._async_writer:
+            if self._image_type == "image":
+                self._async_writer.write_image(self._file_path_with_timestamp, img)
+            else:
+                self._async_writer.write_video(self.writer, img)
+        elif self._image_type == "image":
             cv2.imwrite(self._file_path_with_timestamp, img)
         else:
             self.writer.write(img)
@@ -113,6 +217,9 @@ class Node(AbstractNode):
         self, filename: str, img: np.ndarray, saved_video_fps: int
     ) -> None:
         self._file_path_with_timestamp = self._append_datetime_filename(filename)
+        if self.writer:  # close the video file of the previous input
+            self._release_writer(self.writer)
+            self.writer = None
 
         if filename.split(".")[-1] in ["jpg", "jpeg", "png"]:
             self._image_type = "image"
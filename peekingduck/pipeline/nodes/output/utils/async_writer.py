@@ -0,0 +1,173 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background encoding and writing of output media
+"""
+
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Condition, Thread
+from typing import Any, Callable, Optional
+
+import cv2
+import numpy as np
+
+BACKPRESSURE_POLICIES = ["block", "drop"]
+
+
+class AsyncWriter:  # pylint: disable=too-many-instance-attributes
+    """Encodes and writes frames in the background, so that encoding does not
+    add to the latency of the pipeline. Video frames are written in order by
+    a single writer thread, while image files are encoded in parallel by a
+    pool of encoder threads. OpenCV releases the GIL while encoding.
+
+    At most ``queue_size`` frames are queued or being written at any time.
+    Frames are written as they are when they are dequeued, and must not be
+    modified after being passed to this class.
+
+    Args:
+        queue_size (int): Maximum number of frames waiting to be written.
+        backpressure (str): What happens when a frame is passed while
+            ``queue_size`` frames are waiting: "block" waits for a frame to be
+            written, "drop" discards the new frame.
+        num_encoders (int): Number of threads encoding image files.
+
+    Raises:
+        ValueError: ``queue_size`` or ``num_encoders`` is not positive, or
+            ``backpressure`` is not one of BACKPRESSURE_POLICIES.
+    """
+
+    def __init__(
+        self, queue_size: int, backpressure: str = "block", num_encoders: int = 2
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError(
+                f"queue_size must be a positive integer, got: {queue_size}"
+            )
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"backpressure must be one of {BACKPRESSURE_POLICIES}, got: "
+                f"{backpressure}"
+            )
+        if num_encoders < 1:
+            raise ValueError(
+                f"num_encoders must be a positive integer, got: {num_encoders}"
+            )
+        self.queue_size = queue_size
+        self.backpressure = backpressure
+        self.dropped_frames = 0
+        # number of tasks queued or running, guarded by _condition
+        self._condition = Condition()
+        self._num_pending = 0
+        self._error: Optional[Exception] = None
+        self._tasks: "queue.Queue[Optional[Callable[[], Any]]]" = queue.Queue()
+        self._encoders = ThreadPoolExecutor(
+            max_workers=min(num_encoders, os.cpu_count() or 1),
+            thread_name_prefix="ImageEncoder",
+        )
+        self._thread = Thread(target=self._writing_thread, daemon=True)
+        self._thread.start()
+
+    def write_video(self, writer: cv2.VideoWriter, frame: np.ndarray) -> bool:
+        """Queues a frame to be written to a video, after the frames queued
+        before it.
+
+        Returns:
+            (bool): False if the frame was dropped.
+        """
+        if not self._reserve(bounded=True):
+            return False
+        self._tasks.put(partial(writer.write, frame))
+        return True
+
+    def write_image(self, path: str, frame: np.ndarray) -> bool:
+        """Queues a frame to be encoded and written to an image file.
+
+        Returns:
+            (bool): False if the frame was dropped.
+        """
+        if not self._reserve(bounded=True):
+            return False
+        self._encoders.submit(self._run, partial(cv2.imwrite, path, frame))
+        return True
+
+    def release_video(self, writer: cv2.VideoWriter) -> None:
+        """Queues the release of a video writer, after the frames queued before
+        it are written. Never blocks or drops.
+        """
+        self._reserve(bounded=False)
+        self._tasks.put(writer.release)
+
+    def flush(self) -> None:
+        """Waits for every queued frame to be written.
+
+        Raises:
+            Exception: The first error raised while writing, if any.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._num_pending == 0)
+        self._raise_error()
+
+    def shutdown(self) -> None:
+        """Writes the queued frames, then stops the writer and encoder
+        threads.
+        """
+        self.flush()
+        self._tasks.put(None)
+        self._thread.join()
+        self._encoders.shutdown()
+
+    def _reserve(self, bounded: bool) -> bool:
+        """Reserves a place for a task, waiting for or dropping the task as
+        per `backpressure` if the queue is full and `bounded` is True.
+        """
+        self._raise_error()
+        with self._condition:
+            if bounded and self._num_pending >= self.queue_size:
+                if self.backpressure == "drop":
+                    self.dropped_frames += 1
+                    return False
+                self._condition.wait_for(lambda: self._num_pending < self.queue_size)
+            self._num_pending += 1
+        return True
+
+    def _run(self, task: Callable[[], Any]) -> None:
+        """Runs a task, keeping the first error for the pipeline thread."""
+        try:
+            task()
+        except Exception as error:  # pylint: disable=broad-except
+            if self._error is None:
+                self._error = error
+        finally:
+            with self._condition:
+                self._num_pending -= 1
+                self._condition.notify_all()
+
+    def _raise_error(self) -> None:
+        """Re-raises an error from a writing thread in the calling thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _writing_thread(self) -> None:
+        """Writes the video tasks in order, until None is dequeued."""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+            self._run(task)
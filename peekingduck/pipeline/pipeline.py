@@ -32,10 +32,82 @@ Pipeline class that stores nodes and manages the data information used during
 inference.
 """
 
+import collections.abc
+import copy
 import textwrap
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.scheduler import FrameScheduler
+
+# Values of these types cannot be modified in-place and are shared as-is
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None), frozenset)
+
+
+class DataPoolView(collections.abc.MutableMapping):
+    """A copy-on-write view of the pipeline's data pool, handed to nodes
+    which declare ``all`` as an input in place of a deep copy.
+
+    Numpy arrays are returned as read-only views which share memory with the
+    data pool, so modifying them in-place raises a ``ValueError`` instead of
+    corrupting the data seen by other nodes. Nodes which need to modify an
+    array should work on a copy, e.g., ``inputs["img"].copy()``. Other mutable
+    values (lists, dictionaries, etc.) are deep-copied on first access.
+    Assigning or deleting keys only affects the view, never the data pool.
+
+    Args:
+        data (:obj:`Dict[str, Any]`): The data pool to be viewed.
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+        self._local: Dict[str, Any] = {}
+        self._deleted: Set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._local:
+            return self._local[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        value = self._data[key]
+        if isinstance(value, np.ndarray):
+            value = value.view()
+            value.flags.writeable = False
+        elif not isinstance(value, _IMMUTABLE_TYPES):
+            value = copy.deepcopy(value)
+        self._local[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._local[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._data:
+            if key not in self._deleted:
+                yield key
+        for key in self._local:
+            if key not in self._data:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._deleted:
+            return False
+        return key in self._local or key in self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)})"
 
 
 class Pipeline:  # pylint: disable=too-few-public-methods
@@ -45,11 +117,30 @@ class Pipeline:  # pylint: disable=too-few-public-methods
     Args:
         nodes (:obj:`List[AbstractNode]`): List of initialized nodes for the
             pipeline to run through.
+        release_outputs (:obj:`bool`): If ``True``, every key is dropped from
+            the data pool by :py:meth:`release_data` once its last consumer
+            has run, and each node's ``unused_outputs`` is set to the outputs
+            which no node consumes so the node can skip computing them. The
+            data pool then no longer holds every result at the end of an
+            iteration. **Default: False**.
+
+    Attributes:
+        dependencies (:obj:`List[Set[int]]`): Indices of the nodes which have
+            to finish running before each node can run. Nodes which do not
+            depend on each other, directly or indirectly, can run
+            concurrently.
     """
 
-    def __init__(self, nodes: List[AbstractNode]) -> None:
+    def __init__(self, nodes: List[AbstractNode], release_outputs: bool = False) -> None:
         self.nodes = nodes
         self._check_pipe(nodes)
+        self._add_propagated_outputs(nodes)
+        self.dependencies = self._build_dependencies(nodes)
+        self.release_outputs = release_outputs
+        self._released_keys, unused_outputs = self._find_unneeded_outputs(nodes)
+        if release_outputs:
+            for node, node_unused_outputs in zip(nodes, unused_outputs):
+                node.unused_outputs = node_unused_outputs
         self.data = {}  # type: ignore
         self.terminate = False
 
@@ -62,6 +153,85 @@ class Pipeline:  # pylint: disable=too-few-public-methods
         """
         return self.data
 
+    def get_node_inputs(
+        self, node: AbstractNode, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Collects the inputs required by ``node`` from the data pool.
+
+        Nodes which declare ``all`` as an input receive a copy-on-write
+        :py:class:`DataPoolView` of the entire data pool. Optional inputs are
+        only included if they are found upstream.
+
+        Args:
+            node (:obj:`AbstractNode`): The node to collect inputs for.
+            data (:obj:`Dict[str, Any]` | :obj:`None`): The data pool to
+                collect inputs from. Defaults to the pipeline's own data pool.
+
+        Returns:
+            (:obj:`Dict[str, Any]`): The inputs to be passed to ``node.run()``.
+        """
+        if data is None:
+            data = self.data
+        inputs: Dict[str, Any]
+        if "all" in node.inputs:
+            inputs = DataPoolView(data)  # type: ignore
+        else:
+            inputs = {key: data[key] for key in node.inputs if key in data}
+        if hasattr(node, "optional_inputs"):
+            for key in node.optional_inputs:
+                # The nodes will not receive inputs with the optional key if
+                # it's not found upstream
+                if key in data:
+                    inputs[key] = data[key]
+        return inputs
+
+    @staticmethod
+    def is_empty_frame(outputs: Dict[str, Any]) -> bool:
+        """Checks if the source node's ``outputs`` signal that no new frame
+        is available yet, i.e., ``img`` is ``None`` without ``pipeline_end``.
+        The rest of the pipeline should then be skipped for this iteration
+        rather than run on the previous frame again.
+
+        Args:
+            outputs (:obj:`Dict[str, Any]`): Outputs of the source node.
+
+        Returns:
+            (:obj:`bool`): ``True`` if there is no new frame to process.
+        """
+        return (
+            "img" in outputs
+            and outputs["img"] is None
+            and not outputs.get("pipeline_end", False)
+        )
+
+    def release_data(self, idx: int, data: Optional[Dict[str, Any]] = None) -> None:
+        """Drops the keys which are no longer needed after the node at
+        ``idx`` has run from the data pool. Does nothing unless the pipeline
+        was created with ``release_outputs=True``.
+
+        Args:
+            idx (:obj:`int`): Index of the node which has just run.
+            data (:obj:`Dict[str, Any]` | :obj:`None`): The data pool to
+                release keys from. Defaults to the pipeline's own data pool.
+        """
+        if not self.release_outputs:
+            return
+        if data is None:
+            data = self.data
+        for key in self._released_keys[idx]:
+            data.pop(key, None)
+
+    def keep_data(self, keys: Set[str]) -> None:
+        """Stops :py:meth:`release_data` from dropping ``keys``, e.g., the
+        outputs of nodes which may be skipped on some frames and have to be
+        carried over from earlier frames.
+
+        Args:
+            keys (:obj:`Set[str]`): Data pool keys to be kept.
+        """
+        for released_keys in self._released_keys:
+            released_keys.difference_update(keys)
+
     @staticmethod
     def _check_pipe(nodes: List[AbstractNode]) -> None:
         # 1. Check the initial node is a source node
@@ -85,3 +255,120 @@ class Pipeline:  # pylint: disable=too-few-public-methods
                     """
                 )
                 raise ValueError(msg)
+
+    @staticmethod
+    def _add_propagated_outputs(nodes: List[AbstractNode]) -> None:
+        """Adds each node's ``propagated_outputs`` to its outputs if any of
+        its inputs is produced by a node which may be skipped on some frames
+        (see :py:class:`FrameScheduler`). Such nodes, e.g.,
+        ``dabble.tracking``, only replace these keys on the frames where their
+        inputs are stale, so they are not treated as producers of the keys
+        otherwise.
+        """
+        skippable_outputs: Set[str] = set()
+        for node in nodes[1:]:
+            propagated_outputs = getattr(node, "propagated_outputs", [])
+            if propagated_outputs and skippable_outputs.intersection(node.inputs):
+                node.output = node.outputs + [
+                    key for key in propagated_outputs if key not in node.outputs
+                ]
+            if FrameScheduler.is_skippable(node):
+                skippable_outputs.update(node.outputs)
+
+    @staticmethod
+    def _build_dependencies(nodes: List[AbstractNode]) -> List[Set[int]]:
+        """Builds the data dependency graph of the pipeline from the declared
+        inputs and outputs of the nodes.
+
+        A node depends on:
+        1. The source node.
+        2. The last node before it which produces each of its (optional)
+           inputs, including ``pipeline_end`` which every node checks.
+        3. The nodes before it which read the previous value of each of its
+           outputs, as the previous value may be modified in-place.
+        4. All nodes before it if it reads ``all`` inputs or produces no
+           outputs. Nodes which produce no outputs, e.g., ``draw.bbox``, act
+           through side effects, so all nodes after them depend on them too.
+
+        Returns:
+            (:obj:`List[Set[int]]`): The indices of the nodes each node
+            depends on.
+        """
+        dependencies: List[Set[int]] = []
+        last_writers: Dict[str, int] = {}
+        # Nodes which read the latest value of each key
+        readers: Dict[str, Set[int]] = {}
+        all_readers: Set[int] = set()
+        barrier = 0
+        for idx, node in enumerate(nodes):
+            reads = set(node.inputs) | set(getattr(node, "optional_inputs", []))
+            reads = (reads | {"pipeline_end"}) - {"none"}
+            writes = set(node.outputs) - {"none"}
+            if "all" in reads or not writes:
+                node_dependencies = set(range(idx))
+            else:
+                node_dependencies = {barrier}
+                node_dependencies.update(
+                    last_writers[key] for key in reads if key in last_writers
+                )
+            for key in writes:
+                node_dependencies.update(readers.get(key, set()))
+            if writes:
+                node_dependencies.update(all_readers)
+            node_dependencies.discard(idx)
+            dependencies.append(node_dependencies)
+
+            if not writes:
+                barrier = idx
+            if "all" in reads:
+                all_readers.add(idx)
+            for key in reads:
+                readers.setdefault(key, set()).add(idx)
+            for key in writes:
+                last_writers[key] = idx
+                readers[key] = set()
+        return dependencies
+
+    @staticmethod
+    def _find_unneeded_outputs(
+        nodes: List[AbstractNode],
+    ) -> Tuple[List[Set[str]], List[Set[str]]]:
+        """Finds the last consumer of every key in the data pool.
+
+        Keys which are read by a node before (or by) their first producer
+        carry over to the next iteration and are never released, so is
+        ``pipeline_end``. Nodes which read ``all`` inputs consume every key.
+
+        Returns:
+            (:obj:`Tuple[List[Set[str]], List[Set[str]]]`): For each node, the
+            keys which are no longer needed after it has run, and its outputs
+            which are not consumed by any node.
+        """
+        producers: Dict[str, List[int]] = {}
+        consumers: Dict[str, List[int]] = {}
+        all_readers: List[int] = []
+        for idx, node in enumerate(nodes):
+            inputs = set(node.inputs) | set(getattr(node, "optional_inputs", []))
+            if "all" in inputs:
+                all_readers.append(idx)
+            for key in inputs - {"all", "none"}:
+                consumers.setdefault(key, []).append(idx)
+            for key in set(node.outputs) - {"none"}:
+                producers.setdefault(key, []).append(idx)
+
+        released_keys: List[Set[str]] = [set() for _ in nodes]
+        unused_outputs: List[Set[str]] = [set() for _ in nodes]
+        for key, key_producers in producers.items():
+            key_consumers = sorted(consumers.get(key, []) + all_readers)
+            if key == "pipeline_end" or (
+                key_consumers and key_consumers[0] <= key_producers[0]
+            ):
+                continue
+            released_keys[max(key_consumers + key_producers)].add(key)
+            # A producer's value is read by the consumers up to, and
+            # including, the next producer of the same key
+            next_producers = key_producers[1:] + [len(nodes)]
+            for producer, next_producer in zip(key_producers, next_producers):
+                if not any(producer < idx <= next_producer for idx in key_consumers):
+                    unused_outputs[producer].add(key)
+        return released_keys, unused_outputs
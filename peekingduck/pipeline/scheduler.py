@@ -0,0 +1,150 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Adaptive frame skipping for heavy nodes, e.g., object detectors, whose results
+can be propagated by a downstream tracker on the skipped frames.
+"""
+
+from typing import List, Set
+
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+
+# Maximum number of consecutive frames a node is skipped for because the
+# pipeline is behind its latency budget
+MAX_SKIPPED_FRAMES = 30
+
+
+class FrameScheduler:
+    """Decides which nodes are skipped on each frame from their ``run_every``
+    and ``latency_budget`` configs, which are accepted by every node.
+
+    * ``run_every`` (:obj:`int`): The node only runs on every ``run_every``-th
+      frame, starting from the first frame. **Default: 1**.
+    * ``latency_budget`` (:obj:`float` | :obj:`None`): Target processing time,
+      in seconds, of each frame. Whenever the pipeline has fallen behind this
+      budget, the node is skipped until the pipeline has caught up, but for
+      no more than ``MAX_SKIPPED_FRAMES`` consecutive frames.
+      **Default: null**.
+
+    The source node always runs. A skipped node's outputs from the last frame
+    it ran on remain in the data pool and its output keys are listed in the
+    ``stale_outputs`` data pool entry, so that trackers, e.g.,
+    ``dabble.tracking``, can propagate the stale ``bboxes`` instead.
+
+    Args:
+        nodes (:obj:`List[AbstractNode]`): The nodes of the pipeline.
+
+    Raises:
+        ValueError: ``run_every`` is not a positive integer.
+        ValueError: ``latency_budget`` is not positive.
+    """
+
+    def __init__(self, nodes: List[AbstractNode]) -> None:
+        for node in nodes:
+            if not isinstance(node.run_every, int) or node.run_every < 1:
+                raise ValueError(
+                    f"{node.name}: run_every must be a positive integer, "
+                    f"got: {node.run_every}"
+                )
+            if node.latency_budget is not None and node.latency_budget <= 0:
+                raise ValueError(
+                    f"{node.name}: latency_budget must be positive, "
+                    f"got: {node.latency_budget}"
+                )
+        self.nodes = nodes
+        self.enabled = any(self.is_skippable(node) for node in nodes[1:])
+        # Nodes are due to run on the first frame
+        self._num_skipped = [node.run_every for node in nodes]
+        # Time, in seconds, by which the pipeline is behind each node's budget
+        self._lag = [0.0 for _ in nodes]
+
+    @property
+    def skippable_outputs(self) -> Set[str]:
+        """Data pool keys produced by the nodes which may be skipped."""
+        return self.get_stale_outputs(
+            {
+                idx
+                for idx, node in enumerate(self.nodes[1:], 1)
+                if self.is_skippable(node)
+            }
+        )
+
+    @staticmethod
+    def is_skippable(node: AbstractNode) -> bool:
+        """Checks if ``node`` may be skipped on some frames.
+
+        Args:
+            node (:obj:`AbstractNode`): The node to be checked.
+
+        Returns:
+            (:obj:`bool`): ``True`` if ``node`` sets ``run_every`` or
+            ``latency_budget``.
+        """
+        return node.run_every > 1 or node.latency_budget is not None
+
+    def plan_frame(self) -> Set[int]:
+        """Decides which nodes to skip on the next frame.
+
+        Returns:
+            (:obj:`Set[int]`): Indices of the nodes to be skipped.
+        """
+        skipped = set()
+        for idx, node in enumerate(self.nodes[1:], 1):
+            if self._should_skip(idx, node):
+                skipped.add(idx)
+                self._num_skipped[idx] += 1
+            else:
+                self._num_skipped[idx] = 0
+        return skipped
+
+    def get_stale_outputs(self, skipped: Set[int]) -> Set[str]:
+        """Lists the data pool keys which are not updated on a frame because
+        their producers are skipped.
+
+        Args:
+            skipped (:obj:`Set[int]`): Indices of the skipped nodes.
+
+        Returns:
+            (:obj:`Set[str]`): The stale data pool keys.
+        """
+        stale_outputs: Set[str] = set()
+        for idx in skipped:
+            stale_outputs.update(self.nodes[idx].outputs)
+        stale_outputs.discard("none")
+        return stale_outputs
+
+    def end_frame(self, frame_time: float) -> None:
+        """Updates how far the pipeline is behind each node's latency budget.
+
+        Args:
+            frame_time (:obj:`float`): Time, in seconds, taken to process the
+                frame.
+        """
+        for idx, node in enumerate(self.nodes):
+            if node.latency_budget is not None:
+                self._lag[idx] = max(
+                    0.0, self._lag[idx] + frame_time - node.latency_budget
+                )
+
+    def _should_skip(self, idx: int, node: AbstractNode) -> bool:
+        """Checks if the node at ``idx`` should be skipped on the next frame."""
+        if self._num_skipped[idx] < node.run_every - 1:
+            return True
+        return (
+            node.latency_budget is not None
+            and self._lag[idx] > 0
+            and self._num_skipped[idx] < MAX_SKIPPED_FRAMES
+        )
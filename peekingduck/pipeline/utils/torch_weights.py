@@ -0,0 +1,107 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""Loads PyTorch checkpoints, optionally memory-mapped."""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import torch
+from torch import nn
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+# Suffix of the copy of a legacy checkpoint converted for memory-mapping
+MMAP_SUFFIX = ".mmap"
+
+
+def load_checkpoint(path: Union[Path, str], mmap: bool = False) -> Any:
+    """Loads a PyTorch checkpoint onto the CPU.
+
+    With ``mmap``, the tensors are memory-mapped from the file instead of
+    being read into memory. Processes loading the same weights then share the
+    same page cache pages, and only the pages which are used are read.
+    Checkpoints saved in the legacy serialization format cannot be
+    memory-mapped and are converted once to a copy saved next to them.
+
+    Args:
+        path (Union[Path, str]): Path to the checkpoint.
+        mmap (bool): Flag to determine if the checkpoint should be
+            memory-mapped.
+
+    Returns:
+        (Any): The loaded checkpoint.
+    """
+    if not mmap:
+        return torch.load(str(path), map_location="cpu")
+    path = Path(path)
+    try:
+        return torch.load(str(path), map_location="cpu", mmap=True)
+    except RuntimeError as error:
+        if "mmap" not in str(error):
+            raise
+    mmap_path = _get_mmap_copy(path)
+    if mmap_path is None:
+        return torch.load(str(path), map_location="cpu")
+    return torch.load(str(mmap_path), map_location="cpu", mmap=True)
+
+
+def load_state_dict(
+    model: nn.Module, state_dict: Any, mmap: bool = False, strict: bool = True
+) -> Any:
+    """Loads ``state_dict`` into ``model``.
+
+    With ``mmap``, the parameters of ``model`` are replaced by the
+    memory-mapped tensors instead of copying them. The model should only be
+    moved or converted, e.g., with ``to()`` or ``half()``, after its weights
+    are loaded.
+
+    Args:
+        model (nn.Module): The model to load the weights into.
+        state_dict (Any): The weights, e.g., from :func:`load_checkpoint`.
+        mmap (bool): Flag to determine if the parameters should use the
+            memory-mapped tensors of ``state_dict``.
+        strict (bool): Flag to determine if the keys of ``state_dict`` must
+            match the keys of the model.
+
+    Returns:
+        (Any): The missing and unexpected keys.
+    """
+    return model.load_state_dict(state_dict, strict=strict, assign=mmap)
+
+
+def _get_mmap_copy(path: Path) -> Optional[Path]:
+    """Returns the copy of the legacy checkpoint at ``path`` in a format which
+    can be memory-mapped, creating it if it is missing or out-of-date. Returns
+    None if the copy cannot be created.
+    """
+    mmap_path = path.with_name(f"{path.stem}{MMAP_SUFFIX}{path.suffix}")
+    if mmap_path.exists() and mmap_path.stat().st_mtime >= path.stat().st_mtime:
+        return mmap_path
+    logger.info(f"Converting {path} to a memory-mappable copy: {mmap_path}")
+    try:
+        checkpoint = torch.load(str(path), map_location="cpu")
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, delete=False, suffix=".tmp"
+        ) as outfile:
+            torch.save(checkpoint, outfile)
+        os.replace(outfile.name, mmap_path)
+    except OSError as error:
+        logger.warning(f"Unable to memory-map {path}: {error}")
+        return None
+    return mmap_path
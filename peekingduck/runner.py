@@ -31,18 +31,25 @@
 Main engine for PeekingDuck processes.
 """
 
-import copy
 import logging
 import sys
 from pathlib import Path
 from time import perf_counter
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Union
+
+import numpy as np
 
 from peekingduck.declarative_loader import DeclarativeLoader, NodeList
+from peekingduck.pipeline.executors import ConcurrentExecutor, PipelinedExecutor
+from peekingduck.pipeline.metrics import MetricsRecorder
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
 from peekingduck.pipeline.pipeline import Pipeline
+from peekingduck.pipeline.scheduler import FrameScheduler
 from peekingduck.utils.requirement_checker import RequirementChecker
 
+RUN_MODES = ["sequential", "pipelined", "concurrent"]
+WARMUP_FRAME_SIZE = (1280, 720)
+
 
 class Runner:
     """The runner class for creation of pipeline using declared/given nodes.
@@ -68,33 +75,105 @@ class Runner:
         num_iter (int): Stop pipeline after running this number of iterations
         nodes (:obj:`List[AbstractNode]` | :obj:`None`): If a list of nodes is
             provided, initialize by the node stack directly.
+        mode (:obj:`str`): Execution mode of the pipeline, one of
+            ``"sequential"``, ``"pipelined"``, or ``"concurrent"``. In
+            ``"pipelined"`` mode, each node runs in its own worker thread with
+            bounded queues between them so that consecutive frames are
+            processed by different nodes concurrently. Frame order is
+            preserved. In ``"concurrent"`` mode, frames are processed one at a
+            time but nodes which do not depend on each other's outputs, e.g.,
+            two models both reading ``img``, run concurrently.
+            **Default: "sequential"**.
+        queue_size (:obj:`int`): Maximum number of frames buffered between two
+            nodes in ``"pipelined"`` mode. **Default: 4**.
+        metrics_path (:obj:`pathlib.Path` | :obj:`str` | :obj:`None`): If
+            provided, the per-node statistics returned by :py:meth:`metrics`
+            are periodically written to this file.
+        metrics_format (:obj:`str`): Format of the statistics file, either
+            ``"json"`` or ``"prometheus"``. **Default: "json"**.
+        metrics_interval (:obj:`float`): Interval, in seconds, between writes
+            of the statistics file. **Default: 10.0**.
+        batch_size (:obj:`int`): Maximum number of consecutive frames passed
+            to nodes which support batched inference through
+            ``run_batch()``. Values greater than 1 require ``"pipelined"``
+            mode. **Default: 1**.
+        batch_timeout (:obj:`float`): Maximum time, in seconds, a batching
+            node waits for its batch to fill up before processing the frames
+            received so far. **Default: 0.1**.
+        release_outputs (:obj:`bool`): If ``True``, every output is dropped
+            from the data pool as soon as its last consumer has run, and nodes
+            may skip computing outputs which no node consumes. This lowers
+            peak memory usage, but :py:meth:`get_pipeline_results
+            <peekingduck.pipeline.pipeline.Pipeline.get_pipeline_results>`
+            no longer holds every result. **Default: False**.
+        init_workers (:obj:`int`): Maximum number of nodes initialized
+            concurrently by the
+            :py:class:`DeclarativeLoader <peekingduck.declarative_loader.DeclarativeLoader>`.
+            **Default: 4**.
+        warmup (:obj:`bool`): If ``True``, every model node is run once on a
+            blank frame before the pipeline starts running, so that lazy
+            initialization such as CUDA context creation and kernel selection
+            does not inflate the latency of the first frames. The source is
+            already open during the warm-up, so sources read in a background
+            thread, e.g., ``input.visual`` with ``threading: True``, keep
+            capturing meanwhile and buffer or drop frames according to their
+            configs. The time taken is reported separately in
+            ``warmup_times``, keyed like :py:meth:`metrics`, and is excluded
+            from :py:meth:`metrics`. **Default: False**.
     """
 
-    def __init__(  # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         pipeline_path: Path = None,
         config_updates_cli: str = None,
         custom_nodes_parent_subdir: str = None,
         num_iter: int = None,
         nodes: List[AbstractNode] = None,
+        mode: str = "sequential",
+        queue_size: int = 4,
+        metrics_path: Union[Path, str] = None,
+        metrics_format: str = "json",
+        metrics_interval: float = 10.0,
+        batch_size: int = 1,
+        batch_timeout: float = 0.1,
+        release_outputs: bool = False,
+        init_workers: int = 4,
+        warmup: bool = False,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         try:
+            if mode not in RUN_MODES:
+                raise ValueError(f"mode must be one of {RUN_MODES}, got: {mode}")
+            if batch_size < 1:
+                raise ValueError(
+                    f"batch_size must be a positive integer, got: {batch_size}"
+                )
+            if batch_size > 1 and mode != "pipelined":
+                raise ValueError("batch_size > 1 requires 'pipelined' mode.")
             if nodes:
                 # instantiated_nodes is created differently when given nodes
-                self.pipeline = Pipeline(nodes)
+                self.pipeline = Pipeline(nodes, release_outputs)
             elif pipeline_path and config_updates_cli and custom_nodes_parent_subdir:
                 # create Graph to run
                 self.node_loader = DeclarativeLoader(
-                    pipeline_path, config_updates_cli, custom_nodes_parent_subdir
+                    pipeline_path,
+                    config_updates_cli,
+                    custom_nodes_parent_subdir,
+                    init_workers=init_workers,
                 )
-                self.pipeline = self.node_loader.get_pipeline()
+                self.pipeline = self.node_loader.get_pipeline(release_outputs)
             else:
                 raise ValueError(
                     "Arguments error! Pass in either nodes to load directly via "
                     "Pipeline or pipeline_path, config_updates_cli, and "
                     "custom_nodes_parent_subdir to load via DeclarativeLoader."
                 )
+            self._metrics = MetricsRecorder(
+                self.pipeline.nodes,
+                export_path=metrics_path,
+                export_format=metrics_format,
+                export_interval=metrics_interval,
+            )
         except ValueError as error:
             self.logger.error(str(error))
             sys.exit(1)
@@ -105,17 +184,67 @@ class Runner:
                 "Please rerun for the updates to take effect."
             )
             sys.exit(3)
+        try:
+            self._scheduler = FrameScheduler(self.pipeline.nodes)
+        except ValueError as error:
+            self.logger.error(str(error))
+            sys.exit(1)
+        if self._scheduler.enabled:
+            self.pipeline.keep_data(self._scheduler.skippable_outputs)
         if num_iter is None or num_iter <= 0:
             self.num_iter = 0
         else:
             self.num_iter = num_iter
             self.logger.info(f"Run pipeline for {num_iter} iterations")
+        self.mode = mode
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.warmup_times: Dict[str, float] = {}
+        if warmup:
+            self._warm_up()
 
-    def run(self) -> None:  # pylint: disable=too-many-branches
+    def run(self) -> None:
         """execute single or continuous inference"""
+        try:
+            if self.mode == "pipelined":
+                self.logger.info("Running pipeline in pipelined mode")
+                PipelinedExecutor(
+                    self.pipeline,
+                    self.num_iter,
+                    self.queue_size,
+                    self._metrics,
+                    self.batch_size,
+                    self.batch_timeout,
+                    self._scheduler,
+                ).run()
+            elif self.mode == "concurrent":
+                self.logger.info("Running pipeline in concurrent mode")
+                ConcurrentExecutor(
+                    self.pipeline, self.num_iter, self._metrics, self._scheduler
+                ).run()
+            else:
+                self._run_sequential()
+        finally:
+            self._metrics.export()
+            # clean up nodes with threads and release shared models
+            for node in self.pipeline.nodes:
+                node.release_resources()
+
+    def _run_sequential(self) -> None:
+        """Runs all nodes one after another for each frame."""
         num_iter = 0
+        skipped: Optional[Set[int]] = None
         while not self.pipeline.terminate:
-            for node in self.pipeline.nodes:
+            frame_start_time = perf_counter()
+            if skipped is None:  # plan is kept when there was no new frame
+                skipped = self._scheduler.plan_frame()
+            if self._scheduler.enabled:
+                self.pipeline.data["stale_outputs"] = (
+                    self._scheduler.get_stale_outputs(skipped)
+                )
+            has_frame = True
+            for idx, node in enumerate(self.pipeline.nodes):
                 if num_iter == 0:  # report node setup times at first iteration
                     self.logger.debug(f"First iteration: setup {node.name}...")
                     node_start_time = perf_counter()
@@ -123,38 +252,83 @@ class Runner:
                     self.pipeline.terminate = True
                     if "pipeline_end" not in node.inputs:
                         continue
+                if idx in skipped:
+                    continue
 
-                if "all" in node.inputs:
-                    inputs = copy.deepcopy(self.pipeline.data)
-                else:
-                    inputs = {
-                        key: self.pipeline.data[key]
-                        for key in node.inputs
-                        if key in self.pipeline.data
-                    }
-                if hasattr(node, "optional_inputs"):
-                    for key in node.optional_inputs:
-                        # The nodes will not receive inputs with the optional
-                        # key if it's not found upstream
-                        if key in self.pipeline.data:
-                            inputs[key] = self.pipeline.data[key]
-
-                outputs = node.run(inputs)
+                inputs = self.pipeline.get_node_inputs(node)
+                outputs = self._metrics.run_node(node, inputs)
+                if idx == 0 and self.pipeline.is_empty_frame(outputs):
+                    # no new frame from the source, skip the rest of the pipeline
+                    has_frame = False
+                    break
                 self.pipeline.data.update(outputs)
+                self.pipeline.release_data(idx)
                 if num_iter == 0:
                     node_end_time = perf_counter()
                     self.logger.debug(
                         f"{node.name} setup time = {node_end_time - node_start_time:.2f} sec"
                     )
+            if not has_frame:
+                continue
+            self._scheduler.end_frame(perf_counter() - frame_start_time)
+            skipped = None
             num_iter += 1
             if self.num_iter > 0 and num_iter >= self.num_iter:
                 self.logger.info(f"Stopping pipeline after {num_iter} iterations")
                 break
 
-        # clean up nodes with threads
+    def _warm_up(self) -> None:
+        """Runs every model node once on a blank frame with the resolution of
+        the input source. Outputs are passed on to downstream model nodes so
+        that they too receive inputs of realistic shapes. Nodes whose inputs
+        are not produced by an upstream model node are skipped. Threaded
+        sources keep capturing frames during the warm-up.
+        """
+        width, height = WARMUP_FRAME_SIZE
         for node in self.pipeline.nodes:
-            if node.name.endswith(".visual"):
-                node.release_resources()
+            frame_size = getattr(node, "frame_size", None)
+            if frame_size:
+                width, height = frame_size
+                break
+        data: Dict[str, Any] = {
+            "img": np.zeros((height, width, 3), dtype=np.uint8),
+            "filename": "warmup.png",
+            "saved_video_fps": 0,
+            "pipeline_end": False,
+        }
+        start_time = perf_counter()
+        for node in self.pipeline.nodes:
+            if not node.node_name.startswith("model."):
+                continue
+            if not all(key in data for key in node.inputs):
+                self.logger.debug(f"Skipping warm-up of {node.node_name}")
+                continue
+            label = self._metrics.labels[id(node)]
+            node_start_time = perf_counter()
+            try:
+                data.update(node.warm_up(self.pipeline.get_node_inputs(node, data)))
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.warning(f"Failed to warm up {label}: {error}")
+                continue
+            self.warmup_times[label] = perf_counter() - node_start_time
+            self.logger.debug(
+                f"{label} warm-up time = {self.warmup_times[label]:.2f} sec"
+            )
+        self.logger.info(f"Warm-up time = {perf_counter() - start_time:.2f} sec")
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Retrieves the statistics of every node collected during
+        :py:meth:`run`.
+
+        Returns:
+            (:obj:`Dict[str, Dict[str, Any]]`): Statistics keyed by node name,
+            in pipeline order. Each entry contains the number of calls
+            ``count``, and summaries of ``wall_time`` and ``cpu_time`` (in
+            seconds) and ``output_bytes``. Each summary contains the ``total``,
+            ``mean``, ``max``, and rolling ``p50``, ``p95``, and ``p99``
+            values.
+        """
+        return self._metrics.summary()
 
     def get_pipeline(self) -> NodeList:
         """Retrieves run configuration.
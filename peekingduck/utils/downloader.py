@@ -0,0 +1,406 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""Resumable file downloads over parallel HTTP range requests."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import requests
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+CHUNK_SIZE = 32768
+# Files larger than this are split into ranges of this size which are fetched
+# over parallel connections. A partial download resumes from the ranges which
+# have completed.
+RANGE_SIZE = 4 * 1024 * 1024
+# Environment variable overriding the default number of parallel connections
+NUM_CONNECTIONS_ENV = "PEEKINGDUCK_DOWNLOAD_CONNECTIONS"
+TIMEOUT = 30
+
+
+class Downloader:
+    """Downloads files over parallel HTTP range requests when the server
+    supports them, falling back to a single resumable stream otherwise. Local
+    paths and ``file://`` URLs, e.g., a local mirror of the weights, are
+    copied instead.
+
+    Downloads are written to ``<destination>.part`` and only renamed to
+    ``destination`` once complete. A partial download is only resumed if the
+    file's ETag, or Last-Modified date, is unchanged, and the ranges are
+    requested with ``If-Range`` so a file which is replaced meanwhile is not
+    joined to the partial download. The SHA256 checksum is computed while the
+    file is being downloaded.
+
+    Args:
+        num_connections (Optional[int]): Maximum number of parallel
+            connections per file. Defaults to the value of
+            `PEEKINGDUCK_DOWNLOAD_CONNECTIONS`, or 4 if unset.
+        range_size (int): Size of each HTTP range request in bytes.
+    """
+
+    def __init__(
+        self, num_connections: Optional[int] = None, range_size: int = RANGE_SIZE
+    ) -> None:
+        if num_connections is None:
+            num_connections = _default_num_connections()
+        self.num_connections = max(1, num_connections)
+        self.range_size = range_size
+
+    def download(
+        self, url: str, destination: Path, expected_sha256: Optional[str] = None
+    ) -> str:
+        """Downloads ``url`` to ``destination``.
+
+        Args:
+            url (str): URL or local path of the file.
+            destination (Path): Path to save the file to.
+            expected_sha256 (Optional[str]): Expected SHA256 checksum of the
+                file. Not verified if None.
+
+        Returns:
+            (str): The SHA256 checksum of the downloaded file.
+
+        Raises:
+            ValueError: When the checksum of the downloaded file does not match
+                ``expected_sha256``.
+        """
+        part_path = destination.with_name(f"{destination.name}.part")
+        if is_local(url):
+            digest = _copy(to_local_path(url), part_path)
+        else:
+            size, validator = self._probe(url)
+            if size is not None and size > self.range_size:
+                digest = self._download_ranges(url, part_path, size, validator)
+            else:
+                digest = self._download_stream(url, part_path, size, validator)
+        if expected_sha256 is not None and digest != expected_sha256:
+            os.remove(part_path)
+            raise ValueError(
+                f"Checksum mismatch for {url}: expected {expected_sha256}, "
+                f"got {digest}"
+            )
+        os.replace(part_path, destination)
+        return digest
+
+    @staticmethod
+    def _probe(url: str) -> Tuple[Optional[int], Optional[str]]:
+        """Returns the size of the file at ``url`` if the server accepts range
+        requests, otherwise None, along with the file's strong ETag, or its
+        Last-Modified date, if the server provides one.
+        """
+        try:
+            response = requests.head(url, allow_redirects=True, timeout=TIMEOUT)
+        except requests.RequestException:
+            return None, None
+        if (
+            not response.ok
+            or response.headers.get("Accept-Ranges") != "bytes"
+            or "Content-Length" not in response.headers
+        ):
+            return None, None
+        validator = response.headers.get("ETag")
+        if validator is None or validator.startswith("W/"):
+            # weak ETags cannot be used with If-Range
+            validator = response.headers.get("Last-Modified")
+        return int(response.headers["Content-Length"]), validator
+
+    @staticmethod
+    def _download_stream(
+        url: str, part_path: Path, size: Optional[int], validator: Optional[str]
+    ) -> str:
+        """Downloads ``url`` over a single connection. Resumes from the end of
+        ``part_path`` if the server accepts range requests, i.e., ``size`` is
+        not None, and the file is unchanged since ``part_path`` was written.
+        """
+        state_path = _state_path(part_path)
+        state = _load_state(state_path)
+        offset = 0
+        if (
+            size is not None
+            and validator is not None
+            and state == {"url": url, "validator": validator}
+            and part_path.exists()
+            and part_path.stat().st_size <= size
+        ):
+            offset = part_path.stat().st_size
+        if size is not None and validator is not None:
+            _save_state(state_path, {"url": url, "validator": validator})
+        else:
+            state_path.unlink(missing_ok=True)
+
+        headers = {}
+        if offset > 0:
+            headers = {"Range": f"bytes={offset}-", "If-Range": str(validator)}
+        with requests.get(
+            url, headers=headers, stream=True, timeout=TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            hash_func = hashlib.sha256()
+            if offset > 0:
+                logger.info(f"Resuming download of {url} from byte {offset}.")
+                _update_hash(hash_func, part_path, 0, offset)
+            with open(part_path, "ab" if offset > 0 else "wb") as outfile:
+                for chunk in tqdm(response.iter_content(chunk_size=CHUNK_SIZE)):
+                    if chunk:  # filter out keep-alive new chunks
+                        outfile.write(chunk)
+                        hash_func.update(chunk)
+                num_bytes = outfile.tell()
+        if size is not None and num_bytes != size:
+            raise ConnectionError(
+                f"Incomplete download of {url}: received {num_bytes} of {size} bytes"
+            )
+        state_path.unlink(missing_ok=True)
+        return hash_func.hexdigest()
+
+    def _download_ranges(
+        self, url: str, part_path: Path, size: int, validator: Optional[str]
+    ) -> str:
+        """Downloads ``url`` as ranges over parallel connections into the
+        preallocated ``part_path``. Completed ranges are recorded, along with
+        ``validator``, so an interrupted download can be resumed as long as
+        the file is unchanged. Completed ranges are hashed in order while the
+        rest are still downloading.
+        """
+        ranges = [
+            (start, min(start + self.range_size, size))
+            for start in range(0, size, self.range_size)
+        ]
+        state_path = _state_path(part_path)
+        state = _load_state(state_path)
+        if (
+            state.get("url") == url
+            and state.get("size") == size
+            and validator is not None
+            and state.get("validator") == validator
+            and part_path.exists()
+            and part_path.stat().st_size == size
+        ):
+            done = set(state["done"])
+            logger.info(
+                f"Resuming download of {url}: {len(done)}/{len(ranges)} "
+                "ranges completed."
+            )
+        else:
+            done = set()
+            with open(part_path, "wb") as outfile:
+                outfile.truncate(size)
+        pending = [byte_range for byte_range in ranges if byte_range[0] not in done]
+
+        hash_func = hashlib.sha256()
+        num_hashed = 0
+        num_pending_bytes = sum(end - start for start, end in pending)
+        with tqdm(
+            total=size, initial=size - num_pending_bytes, unit="B", unit_scale=True
+        ) as progress, ThreadPoolExecutor(
+            max_workers=min(self.num_connections, max(1, len(pending)))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _download_range, url, part_path, start, end, validator
+                )
+                for start, end in pending
+            }
+            try:
+                while futures:
+                    finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        start, end = future.result()
+                        done.add(start)
+                        progress.update(end - start)
+                    _save_state(
+                        state_path,
+                        {
+                            "url": url,
+                            "size": size,
+                            "validator": validator,
+                            "done": sorted(done),
+                        },
+                    )
+                    while num_hashed < len(ranges) and ranges[num_hashed][0] in done:
+                        _update_hash(hash_func, part_path, *ranges[num_hashed])
+                        num_hashed += 1
+            except BaseException:
+                # Completed ranges are kept for resuming the download
+                for future in futures:
+                    future.cancel()
+                raise
+        state_path.unlink(missing_ok=True)
+        return hash_func.hexdigest()
+
+
+def extract_zip(
+    zip_path: Path, destination_dir: Path, num_workers: Optional[int] = None
+) -> None:
+    """Extracts the members of the zip file at ``zip_path`` to
+    ``destination_dir`` in parallel.
+
+    Args:
+        zip_path (Path): Path to the zip file.
+        destination_dir (Path): Destination directory for extraction.
+        num_workers (Optional[int]): Number of threads extracting members.
+            Defaults to the number of download connections.
+    """
+    if num_workers is None:
+        num_workers = _default_num_connections()
+    with zipfile.ZipFile(zip_path, "r") as infile:
+        file_list = infile.namelist()
+    # Create the directories upfront so the workers do not race to create them
+    for file in file_list:
+        path = destination_dir / file
+        (path if file.endswith("/") else path.parent).mkdir(
+            parents=True, exist_ok=True
+        )
+    members = [file for file in file_list if not file.endswith("/")]
+
+    # ZipFile objects are not shared across threads
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    lock = threading.Lock()
+
+    def _extract(member: str) -> None:
+        if not hasattr(local, "infile"):
+            local.infile = zipfile.ZipFile(zip_path, "r")
+            with lock:
+                handles.append(local.infile)
+        local.infile.extract(member=member, path=destination_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, num_workers)) as executor:
+            for _ in tqdm(
+                executor.map(_extract, members), file=sys.stdout, total=len(members)
+            ):
+                pass
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def is_local(url: str) -> bool:
+    """Checks if ``url`` is a local path or a ``file://`` URL."""
+    return urlparse(url).scheme in {"", "file"} or Path(url).exists()
+
+
+def read_json(url: str) -> Any:
+    """Reads the JSON file at ``url``, which may be a local path or a
+    ``file://`` URL.
+    """
+    if is_local(url):
+        with open(to_local_path(url)) as infile:
+            return json.load(infile)
+    with requests.get(url, timeout=TIMEOUT) as response:
+        return response.json()
+
+
+def to_local_path(url: str) -> Path:
+    """Converts a local path or ``file://`` URL to a Path."""
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        return Path(unquote(parsed.path))
+    return Path(url)
+
+
+def _copy(source: Path, destination: Path) -> str:
+    """Copies ``source`` to ``destination`` and returns its SHA256 checksum."""
+    hash_func = hashlib.sha256()
+    with open(source, "rb") as infile, open(destination, "wb") as outfile:
+        for chunk in iter(lambda: infile.read(CHUNK_SIZE * 32), b""):
+            outfile.write(chunk)
+            hash_func.update(chunk)
+    shutil.copystat(source, destination)
+    return hash_func.hexdigest()
+
+
+def _default_num_connections() -> int:
+    return int(os.getenv(NUM_CONNECTIONS_ENV, "4"))
+
+
+def _download_range(
+    url: str, part_path: Path, start: int, end: int, validator: Optional[str]
+) -> Tuple[int, int]:
+    """Downloads bytes [start, end) of ``url`` into the same position in
+    ``part_path``. The range is only served if the file still matches
+    ``validator``.
+    """
+    headers = {"Range": f"bytes={start}-{end - 1}"}
+    if validator is not None:
+        headers["If-Range"] = validator
+    with requests.get(
+        url, headers=headers, stream=True, timeout=TIMEOUT
+    ) as response, open(part_path, "r+b") as outfile:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise ConnectionError(
+                f"Server ignored range request for {url}, or the file changed "
+                "during the download"
+            )
+        outfile.seek(start)
+        num_bytes = 0
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            outfile.write(chunk)
+            num_bytes += len(chunk)
+    if num_bytes != end - start:
+        raise ConnectionError(
+            f"Incomplete range {start}-{end - 1} of {url}: received {num_bytes} bytes"
+        )
+    return start, end
+
+
+def _load_state(state_path: Path) -> Dict[str, Any]:
+    try:
+        with open(state_path) as infile:
+            return json.load(infile)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state_path: Path, state: Dict[str, Any]) -> None:
+    with tempfile.NamedTemporaryFile(
+        "w", dir=state_path.parent, delete=False, suffix=".tmp"
+    ) as outfile:
+        json.dump(state, outfile)
+    os.replace(outfile.name, state_path)
+
+
+def _state_path(part_path: Path) -> Path:
+    return part_path.with_name(f"{part_path.name}.json")
+
+
+def _update_hash(hash_func: "hashlib._Hash", path: Path, start: int, end: int) -> None:
+    """Updates ``hash_func`` with bytes [start, end) of ``path``."""
+    with open(path, "rb") as infile:
+        infile.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = infile.read(min(CHUNK_SIZE * 32, remaining))
+            if not chunk:
+                break
+            hash_func.update(chunk)
+            remaining -= len(chunk)
@@ -30,12 +30,19 @@
 """Python package requirements checker."""
 
 import collections
+import functools
+import hashlib
 import importlib
+import json
 import logging
+import os
+import site
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Iterator, TextIO, Tuple, Union
+from typing import Any, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
 from importlib.metadata import version, PackageNotFoundError
 from packaging.specifiers import SpecifierSet
@@ -47,6 +54,11 @@ PKD_NODE_PREFIX = "peekingduck.pipeline.nodes."
 PKD_REQ_TYPE_LEN = 6  # string length of either PYTHON or SYSTEM
 PKD_REQ_TYPE_PYTHON = "PYTHON"  # type specifier for Python packages
 ROOT = Path(__file__).resolve().parents[1]
+# set to "1" to skip the checks, e.g., when running offline
+PKD_SKIP_REQ_CHECK_ENV = "PEEKINGDUCK_SKIP_REQ_CHECK"
+STAMP_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "peekingduck"
+)
 
 OptionalRequirement = collections.namedtuple("OptionalRequirement", "name type")
 
@@ -59,22 +71,101 @@ class RequirementChecker(importlib.abc.MetaPathFinder):
     """
 
     n_update = 0
+    _stamp: Optional["RequirementStamp"] = None
+    # nodes may be imported concurrently, e.g., by the DeclarativeLoader
+    _lock = threading.RLock()
 
     @staticmethod
     def find_spec(fullname: str, *_: Any) -> None:
         """Checks if the peekingduck.pipeline.nodes module being imported
         contains optional requirements. Attempt to install if it does.
 
+        Modules whose requirements were satisfied before in the same
+        environment are not checked again. No checks are done if the
+        ``PEEKINGDUCK_SKIP_REQ_CHECK`` environment variable is set to "1".
+
         Args:
             fullname (:obj:`str`): Name of the module being imported.
         """
-        if fullname.startswith(PKD_NODE_PREFIX):
+        if not fullname.startswith(PKD_NODE_PREFIX):
+            return
+        if os.environ.get(PKD_SKIP_REQ_CHECK_ENV) == "1":
+            return
+        identifier = fullname[len(PKD_NODE_PREFIX) :]
+        with RequirementChecker._lock:
+            if RequirementChecker._stamp is None:
+                RequirementChecker._stamp = RequirementStamp()
+            if identifier in RequirementChecker._stamp:
+                return
             try:
-                RequirementChecker.n_update += check_requirements(
-                    fullname[len(PKD_NODE_PREFIX) :]
-                )
+                n_update = check_requirements(identifier)
             except subprocess.CalledProcessError:
                 sys.exit(1)
+            RequirementChecker.n_update += n_update
+            # system packages cannot be checked, so their warning is kept
+            if n_update == 0 and not has_system_requirements(identifier):
+                RequirementChecker._stamp.add(identifier)
+
+
+class RequirementStamp:
+    """Records the identifiers whose optional requirements are satisfied in
+    the current environment.
+
+    The records are saved in a stamp file for each Python interpreter. They
+    are discarded when the fingerprint of the environment changes, i.e., when
+    the interpreter version, a site-packages directory, or the requirements
+    file is modified.
+
+    Args:
+        stamp_dir (Path): Directory of the stamp files.
+        requirements_path (Path): Path to the requirements file.
+    """
+
+    def __init__(
+        self,
+        stamp_dir: Path = STAMP_DIR,
+        requirements_path: Path = ROOT / "optional_requirements.txt",
+    ) -> None:
+        interpreter_hash = hashlib.sha256(sys.executable.encode()).hexdigest()
+        self.stamp_path = stamp_dir / f"requirements_{interpreter_hash[:16]}.json"
+        self.fingerprint = _get_environment_fingerprint(requirements_path)
+        self._identifiers = self._load()
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._identifiers
+
+    def add(self, identifier: str) -> None:
+        """Records that the requirements of ``identifier`` are satisfied and
+        saves the stamp file.
+        """
+        self._identifiers.add(identifier)
+        content = {
+            "fingerprint": self.fingerprint,
+            "identifiers": sorted(self._identifiers),
+        }
+        try:
+            self.stamp_path.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first, other processes may be reading
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.stamp_path.parent, delete=False, suffix=".tmp"
+            ) as outfile:
+                json.dump(content, outfile)
+            os.replace(outfile.name, self.stamp_path)
+        except OSError as error:
+            logger.debug(f"Unable to write {self.stamp_path}: {error}")
+
+    def _load(self) -> Set[str]:
+        """Loads the recorded identifiers if the stamp file was written in
+        the same environment.
+        """
+        try:
+            with open(self.stamp_path) as infile:
+                content = json.load(infile)
+        except (OSError, ValueError):
+            return set()
+        if content.get("fingerprint") != self.fingerprint:
+            return set()
+        return set(content.get("identifiers", []))
 
 
 def check_requirements(
@@ -92,8 +183,9 @@ def check_requirements(
     Returns:
         (:obj:`int`): The number of packages updated.
     """
-    with open(requirements_path) as infile:
-        requirements = list(_parse_requirements(infile, identifier))
+    requirements = list(
+        _parse_requirements(_read_requirements(requirements_path), identifier)
+    )
 
     n_update = 0
     for req in requirements:
@@ -125,14 +217,78 @@ def check_requirements(
     return n_update
 
 
-def _parse_requirements(file: TextIO, identifier: str) -> Iterator[OptionalRequirement]:
+def has_system_requirements(
+    identifier: str, requirements_path: Path = ROOT / "optional_requirements.txt"
+) -> bool:
+    """Checks if the ``identifier`` requires system packages, which cannot be
+    checked automatically.
+
+    Args:
+        identifier (:obj:`str`): A unique identifier, typically a pipeline node
+            name.
+        requirements_path (Path): Path to the requirements file
+
+    Returns:
+        (:obj:`bool`): True if any of the requirements is a system package.
+    """
+    return any(
+        req.type != PKD_REQ_TYPE_PYTHON
+        for req in _parse_requirements(
+            _read_requirements(requirements_path), identifier
+        )
+    )
+
+
+def _get_environment_fingerprint(requirements_path: Path) -> str:
+    """Hashes the interpreter version and the modification times of the
+    site-packages directories and the requirements file. Installing or
+    removing packages modifies the site-packages directory.
+    """
+    site_dirs: List[str] = []
+    # getsitepackages is unavailable in some virtualenv versions
+    if hasattr(site, "getsitepackages"):
+        site_dirs.extend(site.getsitepackages())
+    site_dirs.append(site.getusersitepackages())
+    stats = [sys.executable, sys.version]
+    for path in [*site_dirs, str(requirements_path)]:
+        try:
+            stat = os.stat(path)
+            stats.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            stats.append(f"{path}:missing")
+    return hashlib.sha256("\n".join(stats).encode()).hexdigest()
+
+
+def _read_requirements(requirements_path: Path) -> str:
+    """Reads the requirements file. The content is cached until the file is
+    modified.
+    """
+    stat = os.stat(requirements_path)
+    return _read_requirements_cached(
+        str(requirements_path), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_requirements_cached(requirements_path: str, *_: int) -> str:
+    """Reads the requirements file, the file's modification time and size are
+    part of the cache key.
+    """
+    with open(requirements_path) as infile:
+        return infile.read()
+
+
+def _parse_requirements(
+    file: Union[TextIO, str], identifier: str
+) -> Iterator[OptionalRequirement]:
     """Yield ``OptionalRequirement`` objects for each specification in
     ``strings``.
 
     ``strings`` must be a string, or a (possibly-nested) iterable thereof.
 
     Arg:
-        file (TextIO): The file object containing optional requirements.
+        file (Union[TextIO, str]): The file object, or the content of the
+            file, containing optional requirements.
         identifier (str): A unique identifier, typically a pipeline node name,
             used to specify which packages to check for.
 
@@ -43,7 +43,6 @@ import tkinter as tk
 from tkinter import filedialog
 from tkinter.messagebox import askyesno, showerror
 import threading
-import copy
 import cv2
 import numpy as np
 from PIL import Image, ImageTk
@@ -536,34 +535,26 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         """Run one pipeline iteration"""
         self.is_pipeline_running = True
         err_runtime = False
+        has_frame = True
         exc_msg = ""
         err_stream = StringIO()
         # technote: Detect runtime exception with flag as exception object holds ref to
         # error stack frame, preventing further objects from being freed.
         with redirect_stderr(err_stream):
             try:
-                for node in self._pipeline.nodes:
+                for idx, node in enumerate(self._pipeline.nodes):
                     if self._pipeline.data.get("pipeline_end", False):
                         self._pipeline.terminate = True
                         if "pipeline_end" not in node.inputs:
                             continue
-                    if "all" in node.inputs:
-                        inputs = copy.deepcopy(self._pipeline.data)
-                    else:
-                        inputs = {
-                            key: self._pipeline.data[key]
-                            for key in node.inputs
-                            if key in self._pipeline.data
-                        }
-                    if hasattr(node, "optional_inputs"):
-                        # Nodes won't receive inputs with optional key if not found upstream
-                        for key in node.optional_inputs:
-                            if key in self._pipeline.data:
-                                inputs[key] = self._pipeline.data[key]
+                    inputs = self._pipeline.get_node_inputs(node)
                     if node.name.endswith("output.screen"):
                         pass  # disable duplicate video from output.screen
                     else:
                         outputs = node.run(inputs)
+                        if idx == 0 and self._pipeline.is_empty_frame(outputs):
+                            has_frame = False  # no new frame from the source yet
+                            break
                         self._pipeline.data.update(outputs)
                     # check for FPS on first iteration
                     if self._frame_idx == 0 and node.name.endswith("input.visual"):
@@ -580,6 +571,8 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         if err_runtime:
             self.pipeline_error(exc_msg, err_stream)
             return
+        if not has_frame:
+            return
 
         # render img into screen output to Tkinter
         img = self._pipeline.data["img"]
@@ -610,6 +603,9 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         err_runtime = False
         exc_msg = ""
         err_stream = StringIO()
+        # The models of the previous run are released only after the new
+        # pipeline is created so that it can reuse them
+        prev_pipeline = getattr(self, "_pipeline", None)
         with redirect_stderr(err_stream):
             try:
                 self._node_loader = DeclarativeLoader(
@@ -622,6 +618,10 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             except Exception:  # pylint: disable=broad-except
                 err_runtime = True
                 exc_msg = traceback.format_exc()
+        if prev_pipeline is not None and not err_runtime:
+            for node in prev_pipeline.nodes:
+                if not node.name.endswith("input.visual"):
+                    node.release_resources()
 
         # handle pipeline runtime error
         if err_runtime:
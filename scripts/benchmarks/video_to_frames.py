@@ -0,0 +1,49 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+"""Converts a video, once, into a memory-mapped frame file for input.frame_file,
+so that benchmarks measure the pipeline without the cost of video decoding.
+
+Usage, from the repository root:
+    python scripts/benchmarks/video_to_frames.py \
+        data/benchmark/single/single_person.mp4 data/benchmark/single_person.npy
+"""
+
+import argparse
+from pathlib import Path
+
+from peekingduck.pipeline.nodes.input.utils.frame_file import convert_video
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Converts a video into a frame file for input.frame_file."
+    )
+    parser.add_argument("video", help="path or URL of the video to convert")
+    parser.add_argument(
+        "output",
+        type=Path,
+        help="frame file to write, .npy, or .bgr/.raw for raw BGR frames",
+    )
+    args = parser.parse_args()
+
+    num_frames, width, height = convert_video(args.video, args.output)
+    print(f"{args.video} -> {args.output}: {num_frames} frames of {width} by {height}")
+    if args.output.suffix.lower() != ".npy":
+        print(f"input.frame_file configs: frame_width: {width}, frame_height: {height}")
+
+
+if __name__ == "__main__":
+    main()
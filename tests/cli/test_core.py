@@ -271,6 +271,22 @@ class TestCliCore:
             assert_msg_in_logs(f"Run pipeline for {n} iterations", captured.records)
             assert result.exit_code == 0
 
+    def test_run_profile_startup(self):
+        setup()
+        with TestCase.assertLogs("peekingduck.cli.logger") as captured:
+            result = CliRunner().invoke(cli, ["run", "--profile-startup"])
+            assert_msg_in_logs("Startup profile:", captured.records)
+            assert_msg_in_logs(f"  {PKD_NODE}: import = ", captured.records)
+            assert_msg_in_logs("(wall-clock), other = ", captured.records)
+            assert result.exit_code == 0
+
+    @pytest.mark.parametrize("flag", [["--viewer"], ["--workers", "2"]])
+    def test_run_profile_startup_unsupported(self, flag):
+        setup()
+        result = CliRunner().invoke(cli, ["run", "--profile-startup", *flag])
+        assert result.exit_code == 2
+        assert "--profile-startup cannot be used with" in result.output
+
     @mock.patch("peekingduck.commands.core.Runner", MockRunner)
     def test_verify_install(self):
         """Checks that verify install runs the basic object detection
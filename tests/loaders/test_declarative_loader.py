@@ -30,10 +30,13 @@
 import importlib
 import random
 import string
+import subprocess
 import sys
 import textwrap
+import threading
+import time
 from pathlib import Path
-from unittest import mock
+from unittest import TestCase, mock
 
 import pytest
 import yaml
@@ -203,6 +206,70 @@ class TestDeclarativeLoader:
                 for idx, output in enumerate(node):
                     assert output == ground_truth[node_num][idx]
 
+    def test_instantiate_nodes_concurrently_in_declared_order(
+        self, declarativeloader
+    ):
+        # Each node waits until all 3 have started, so initialization only
+        # completes if the nodes are initialized concurrently
+        barrier = threading.Barrier(3, timeout=10)
+
+        def slow_init_node(path_to_node, node_name, config_loader, config_updates):
+            barrier.wait()
+            if node_name == PKD_NODE and config_updates is None:
+                time.sleep(0.05)  # the first node finishes last
+            return [path_to_node, node_name, config_loader, config_updates]
+
+        with mock.patch(
+            "peekingduck.declarative_loader.DeclarativeLoader._init_node",
+            wraps=slow_init_node,
+        ):
+            instantiated_nodes = declarativeloader._instantiate_nodes()
+
+        assert [node[1] for node in instantiated_nodes] == [
+            PKD_NODE,
+            PKD_NODE,
+            CUSTOM_NODE,
+        ]
+        assert instantiated_nodes[0][3] is None
+        assert instantiated_nodes[1][3] == [{"setting": True}]
+
+    def test_instantiate_nodes_reports_every_error(self, declarativeloader):
+        def failing_init_node(path_to_node, node_name, config_loader, config_updates):
+            if node_name == CUSTOM_NODE:
+                raise FileNotFoundError("custom weights not found")
+            if config_updates is not None:
+                raise ValueError("invalid setting")
+            return node_name
+
+        with mock.patch(
+            "peekingduck.declarative_loader.DeclarativeLoader._init_node",
+            wraps=failing_init_node,
+        ), TestCase.assertLogs("peekingduck.declarative_loader") as captured:
+            with pytest.raises(ValueError) as excinfo:
+                declarativeloader._instantiate_nodes()
+
+        assert str(excinfo.value) == "invalid setting"
+        messages = [record.getMessage() for record in captured.records]
+        assert f"Failed to initialize {PKD_NODE} node: invalid setting" in messages
+        assert (
+            f"Failed to initialize {CUSTOM_NODE_NAME}.{CUSTOM_NODE} node: "
+            "custom weights not found"
+        ) in messages
+
+    def test_instantiate_nodes_sequentially(self, declarativeloader):
+        declarativeloader.init_workers = 1
+        with mock.patch(
+            "peekingduck.declarative_loader.DeclarativeLoader._init_node",
+            wraps=replace_init_node,
+        ):
+            instantiated_nodes = declarativeloader._instantiate_nodes()
+
+        assert [node[1] for node in instantiated_nodes] == [
+            PKD_NODE,
+            PKD_NODE,
+            CUSTOM_NODE,
+        ]
+
     def test_init_node_pkd(self, declarativeloader):
         path_to_node = ""
         node_name = PKD_NODE
@@ -217,6 +284,42 @@ class TestDeclarativeLoader:
         assert init_node.inputs == ["source"]
         assert init_node.outputs == ["end"]
 
+    def test_init_node_records_startup_times(self, declarativeloader):
+        config_loader = declarativeloader.config_loader
+        declarativeloader._init_node("", PKD_NODE, config_loader, None)
+        declarativeloader._init_node("", PKD_NODE, config_loader, None)
+
+        assert [entry["node"] for entry in declarativeloader.startup_times] == [
+            PKD_NODE,
+            PKD_NODE,
+        ]
+        assert all(
+            entry["import_time"] >= 0 and entry["init_time"] >= 0
+            for entry in declarativeloader.startup_times
+        )
+
+    def test_model_nodes_defer_framework_imports(self):
+        model_nodes = ["mask_rcnn", "movenet", "rt_detr", "yolo", "yolox"]
+        code = textwrap.dedent(
+            f"""\
+            import importlib
+            import sys
+
+            for node in {model_nodes}:
+                importlib.import_module(f"peekingduck.pipeline.nodes.model.{{node}}")
+            print(sorted({{"tensorflow", "torch", "transformers"}} & set(sys.modules)))
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+            text=True,
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
     # TODO
     @pytest.mark.skip("Custom nodes are not supported currently.")
     def test_init_node_custom(self, declarativeloader):
@@ -28,6 +28,7 @@
 # limitations under the License.
 
 import hashlib
+import json
 import logging
 import tempfile
 from pathlib import Path
@@ -38,6 +39,7 @@ import yaml
 
 from peekingduck.pipeline.nodes.base import (
     PEEKINGDUCK_WEIGHTS_SUBDIR,
+    WEIGHTS_CHECKSUMS_FILENAME,
     WeightsDownloaderMixin,
 )
 from tests.conftest import PKD_DIR, do_nothing
@@ -68,6 +70,21 @@ class WeightsModel(WeightsDownloaderMixin):
         self.logger = logging.getLogger("test_weights_downloader_mixin.WeightsModel")
 
 
+def _write_checksums(weights_model, weights_root, weights_path):
+    """Writes a local checksum manifest containing the checksum of
+    `weights_path`.
+    """
+    checksum = WeightsDownloaderMixin.sha256sum(weights_path).hexdigest()
+    checksums = {
+        weights_model.model_subdir: {
+            weights_model.config["model_format"]: {
+                str(weights_model.config["model_type"]): checksum
+            }
+        }
+    }
+    (weights_root / WEIGHTS_CHECKSUMS_FILENAME).write_text(json.dumps(checksums))
+
+
 class TestWeightsDownloaderMixin:
     def test_parent_dir_not_exist(self, weights_model):
         invalid_dir = "invalid_dir"
@@ -171,6 +188,113 @@ class TestWeightsDownloaderMixin:
 
             assert weights_type_model._has_weights(model_dir)
 
+    def test_verified_weights_are_not_rehashed(self, weights_type_model):
+        """Checks that weights are only hashed again after they are modified
+        and that the local checksum manifest is used instead of the network.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch(
+            "requests.get", side_effect=ConnectionError
+        ), mock.patch.object(
+            WeightsDownloaderMixin,
+            "sha256sum",
+            wraps=WeightsDownloaderMixin.sha256sum,
+        ) as mock_sha256sum:
+            weights_type_model.config["weights_parent_dir"] = tmp_dir
+            model_dir = weights_type_model._find_paths()
+            model_dir.mkdir(parents=True, exist_ok=True)
+            weights_path = model_dir / weights_type_model.model_filename
+            weights_path.write_text("weights")
+            _write_checksums(weights_type_model, model_dir.parents[1], weights_path)
+
+            assert weights_type_model._has_weights(model_dir)
+            num_calls = mock_sha256sum.call_count
+            assert num_calls > 0
+            assert weights_type_model._has_weights(model_dir)
+            assert mock_sha256sum.call_count == num_calls
+
+            weights_path.write_text("corrupted weights")
+            assert not weights_type_model._has_weights(model_dir)
+            assert mock_sha256sum.call_count > num_calls
+
+    def test_verified_weights_are_checked_against_new_checksums(
+        self, weights_type_model
+    ):
+        """Checks that verified weights are reported as out-of-date once the
+        checksum manifest lists a different checksum.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch(
+            "requests.get", side_effect=ConnectionError
+        ), mock.patch(
+            "peekingduck.pipeline.nodes.base.WEIGHTS_CHECKSUMS_PATH", None
+        ):
+            weights_type_model.config["weights_parent_dir"] = tmp_dir
+            model_dir = weights_type_model._find_paths()
+            model_dir.mkdir(parents=True, exist_ok=True)
+            weights_root = model_dir.parents[1]
+            weights_path = model_dir / weights_type_model.model_filename
+            weights_path.write_text("old weights")
+            _write_checksums(weights_type_model, weights_root, weights_path)
+            assert weights_type_model._has_weights(model_dir)
+
+            new_weights_path = model_dir / "new_weights"
+            new_weights_path.write_text("new weights")
+            _write_checksums(weights_type_model, weights_root, new_weights_path)
+            assert not weights_type_model._has_weights(model_dir)
+
+    def test_stale_cached_checksums_are_refreshed(self, weights_type_model):
+        """Checks that the saved checksum manifest is fetched again when it
+        does not match the weights, and is kept when the fetch fails.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch(
+            "peekingduck.pipeline.nodes.base.WEIGHTS_CHECKSUMS_PATH", None
+        ):
+            weights_type_model.config["weights_parent_dir"] = tmp_dir
+            model_dir = weights_type_model._find_paths()
+            model_dir.mkdir(parents=True, exist_ok=True)
+            weights_root = model_dir.parents[1]
+            weights_path = model_dir / weights_type_model.model_filename
+            weights_path.write_text("old weights")
+            _write_checksums(weights_type_model, weights_root, weights_path)
+            old_checksums = (weights_root / WEIGHTS_CHECKSUMS_FILENAME).read_text()
+
+            weights_path.write_text("updated weights")
+            with mock.patch(
+                "peekingduck.pipeline.nodes.base.read_json",
+                side_effect=ConnectionError,
+            ):
+                assert not weights_type_model._has_weights(model_dir)
+            cached_path = weights_root / WEIGHTS_CHECKSUMS_FILENAME
+            assert cached_path.read_text() == old_checksums
+
+            _write_checksums(weights_type_model, weights_root, weights_path)
+            new_checksums = json.loads(cached_path.read_text())
+            cached_path.write_text(old_checksums)
+            with mock.patch(
+                "peekingduck.pipeline.nodes.base.read_json",
+                return_value=new_checksums,
+            ) as mock_read_json:
+                assert weights_type_model._has_weights(model_dir)
+            mock_read_json.assert_called_once()
+            assert json.loads(cached_path.read_text()) == new_checksums
+
+    @mock.patch.object(WeightsDownloaderMixin, "_download_to", wraps=do_nothing)
+    @mock.patch.object(WeightsDownloaderMixin, "_extract_file", wraps=do_nothing)
+    def test_downloaded_weights_are_verified(
+        self, mock_extract_file, mock_download_to, weights_type_model
+    ):
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.object(
+            WeightsDownloaderMixin, "_has_weights", return_value=False
+        ) as mock_has_weights:
+            weights_type_model.config["weights_parent_dir"] = tmp_dir
+
+            with pytest.raises(ValueError) as excinfo:
+                weights_type_model.download_weights()
+
+            assert "do not match their checksum" in str(excinfo.value)
+            assert mock_download_to.called
+            assert mock_extract_file.called
+            assert mock_has_weights.call_count == 2
+
     def test_sha256sum_ignores_macos_files(self):
         """Checks that extra files created on Mac OS is ignored by the
         sha256sum() method.
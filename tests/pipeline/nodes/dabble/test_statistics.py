@@ -357,3 +357,16 @@ class TestStatisticsCalcs:
         assert result["cum_avg"] == 5.0
         assert result["cum_max"] == 9.0
         assert result["cum_min"] == 1.0
+
+    def test_sources_are_calculated_separately(self, stats_config):
+        stats_config["identity"] = "count"
+        node = Node(stats_config)
+        sequence = [(0, 2), (1, 10), (0, 4), (1, 20), (0, 6)]
+
+        results = {}
+        for source_id, curr_result in sequence:
+            inputs = {"count": curr_result, "source_id": source_id}
+            results[source_id] = node.run(inputs)
+
+        assert results[0] == {"cum_avg": 4.0, "cum_min": 2, "cum_max": 6}
+        assert results[1] == {"cum_avg": 15.0, "cum_min": 10, "cum_max": 20}
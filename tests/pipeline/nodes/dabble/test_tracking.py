@@ -105,6 +105,41 @@ class TestTracking:
 
         assert not outputs["obj_attrs"]["ids"]
 
+    def test_propagate_tracks_when_bboxes_are_stale(self, create_image, tracker):
+        img = create_image(SIZE)
+        bboxes = np.array([[0.1, 0.2, 0.3, 0.4], [0.5, 0.5, 0.6, 0.7]])
+        inputs = {
+            "img": img,
+            "bboxes": bboxes,
+            "bbox_labels": np.array(["person", "car"]),
+            "bbox_scores": np.array([0.9, 0.8]),
+        }
+        ids = tracker.run(inputs)["obj_attrs"]["ids"]
+
+        outputs = tracker.run(
+            {"img": img, "bboxes": np.empty((0, 4)), "stale_outputs": {"bboxes"}}
+        )
+
+        assert outputs["obj_attrs"]["ids"] == ids
+        np.testing.assert_almost_equal(outputs["bboxes"], bboxes)
+        assert outputs["bbox_labels"].tolist() == ["person", "car"]
+        assert outputs["bbox_scores"].tolist() == [0.9, 0.8]
+        # Propagated frames do not count towards max_lost
+        assert tracker.run(inputs)["obj_attrs"]["ids"] == ids
+
+    def test_propagated_attrs_are_aligned_with_bboxes(self, create_image, tracker):
+        img = create_image(SIZE)
+        bboxes = np.array([[0.1, 0.2, 0.3, 0.4], [0.5, 0.5, 0.6, 0.7]])
+        tracker.run({"img": img, "bboxes": bboxes})
+
+        outputs = tracker.run(
+            {"img": img, "bboxes": np.empty((0, 4)), "stale_outputs": {"bboxes"}}
+        )
+
+        assert len(outputs["bbox_labels"]) == len(outputs["bboxes"]) == 2
+        assert outputs["bbox_labels"].tolist() == ["", ""]
+        assert outputs["bbox_scores"].tolist() == [0.0, 0.0]
+
     def test_tracking_ids_should_be_consistent_across_frames(
         self, tracker, human_video_sequence
     ):
@@ -120,6 +155,20 @@ class TestTracking:
                 assert outputs["obj_attrs"]["ids"] == prev_tags
             prev_tags = outputs["obj_attrs"]["ids"]
 
+    def test_sources_are_tracked_separately(self, tracker, human_video_sequence):
+        # skip for mosse due to inconsistent results on Intel MacOS
+        if tracker.tracking_type == "mosse" and platform.system() == "Darwin":
+            pytest.skip()
+        _, detections = human_video_sequence
+        prev_tags = {}
+        for inputs in detections:
+            for source_id in [0, 1]:
+                outputs = tracker.run({**inputs, "source_id": source_id})
+                tags = outputs["obj_attrs"]["ids"]
+                assert tags == prev_tags.setdefault(source_id, tags)
+        # each source starts its own tracks from the first track ID
+        assert prev_tags[0] == prev_tags[1]
+
     def test_should_track_new_detection(self, tracker, human_video_sequence):
         # skip for mosse due to inconsistent results on Intel MacOS
         if tracker.tracking_type == "mosse" and platform.system() == "Darwin":
@@ -35,6 +35,7 @@ import numpy as np
 import pytest
 
 from peekingduck.pipeline.nodes.draw.legend import Node
+from peekingduck.pipeline.pipeline import DataPoolView
 
 
 @pytest.fixture
@@ -104,6 +105,21 @@ class TestLegend:
             AssertionError, np.testing.assert_equal, original_img, results_top["img"]
         )
 
+    def test_draw_legend_read_only_data_pool(self, draw_legend_bottom, create_image):
+        original_img = create_image((640, 480, 3))
+        data_pool = {
+            "img": original_img.copy(),
+            "fps": 50.5,
+            "count": 2,
+            "zone_count": [1, 1],
+        }
+        results = draw_legend_bottom.run(DataPoolView(data_pool))
+
+        np.testing.assert_equal(original_img, data_pool["img"])
+        np.testing.assert_raises(
+            AssertionError, np.testing.assert_equal, original_img, results["img"]
+        )
+
     def test_selected_data_type_not_in_data_pool(self, draw_legend_top, create_image):
         original_img = create_image((640, 480, 3))
         output_img = original_img.copy()
@@ -0,0 +1,116 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.input.utils.frame_buffer import FrameBuffer
+
+
+def _frame(value, shape=(4, 6, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def _drain(frame_buffer):
+    values = []
+    while (frame := frame_buffer.get(timeout=0)) is not None:
+        values.append(int(frame[0, 0, 0]))
+    return values
+
+
+class TestFrameBuffer:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"capacity": 0},
+            {"capacity": 2, "policy": "newest"},
+            {"capacity": 2, "drop_every": 1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            FrameBuffer(**kwargs)
+
+    def test_frames_are_held_by_reference(self):
+        frame_buffer = FrameBuffer(2)
+        frames = [_frame(1), _frame(2, shape=(8, 8, 3))]
+        for frame in frames:
+            frame_buffer.put(frame)
+
+        assert frame_buffer.get() is frames[0]
+        assert frame_buffer.get() is frames[1]
+
+    def test_drop_oldest(self):
+        frame_buffer = FrameBuffer(3, "drop_oldest")
+        for value in range(5):
+            assert frame_buffer.put(_frame(value))
+
+        assert len(frame_buffer) == 3
+        assert frame_buffer.dropped_frames == 2
+        assert _drain(frame_buffer) == [2, 3, 4]
+
+    def test_latest(self):
+        frame_buffer = FrameBuffer(3, "latest")
+        for value in range(5):
+            frame_buffer.put(_frame(value))
+
+        assert _drain(frame_buffer) == [4]
+        assert frame_buffer.dropped_frames == 4
+
+    def test_block_waits_for_consumer(self):
+        frame_buffer = FrameBuffer(2)
+        producer = threading.Thread(
+            target=lambda: [frame_buffer.put(_frame(value)) for value in range(6)]
+        )
+        producer.start()
+        values = [int(frame_buffer.get(timeout=5)[0, 0, 0]) for _ in range(6)]
+        producer.join()
+
+        assert values == list(range(6))
+        assert frame_buffer.dropped_frames == 0
+
+    def test_drop_nth(self):
+        frame_buffer = FrameBuffer(1, "drop_nth", drop_every=2)
+        frame_buffer.put(_frame(0))
+        producer = threading.Thread(target=frame_buffer.put, args=(_frame(1),))
+        producer.start()  # 1st overflow blocks
+        while frame_buffer._num_overflows == 0:
+            time.sleep(0.001)
+
+        assert not frame_buffer.put(_frame(2))  # 2nd overflow is dropped
+        assert int(frame_buffer.get(timeout=5)[0, 0, 0]) == 0
+        producer.join(timeout=5)
+        assert frame_buffer.dropped_frames == 1
+        assert _drain(frame_buffer) == [1]
+
+    def test_close_wakes_blocked_producer(self):
+        frame_buffer = FrameBuffer(1)
+        frame_buffer.put(_frame(0))
+        results = []
+        producer = threading.Thread(
+            target=lambda: results.append(frame_buffer.put(_frame(1)))
+        )
+        producer.start()
+        frame_buffer.close()
+        producer.join(timeout=5)
+
+        assert results == [False]
+
+    def test_get_times_out(self):
+        assert FrameBuffer(1).get(timeout=0.01) is None
+
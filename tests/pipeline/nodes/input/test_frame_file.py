@@ -0,0 +1,100 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.input.frame_file import Node
+from peekingduck.pipeline.nodes.input.utils.frame_file import (
+    convert_video,
+    open_frame_file,
+)
+
+
+def create_reader(source, frame_width=0, frame_height=0, read_only=True):
+    return Node(
+        {
+            "input": ["none"],
+            "output": ["img", "filename", "pipeline_end", "saved_video_fps"],
+            "source": source,
+            "frame_width": frame_width,
+            "frame_height": frame_height,
+            "read_only": read_only,
+            "filename": "video.mp4",
+            "saved_video_fps": 10,
+            "frames_log_freq": 100,
+        }
+    )
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestFrameFile:
+    @pytest.mark.parametrize("output_path", ["frames.npy", "frames.bgr"])
+    def test_convert_video(self, create_input_video, output_path):
+        video = create_input_video("video.avi", fps=10, size=(30, 40, 3), num_frames=5)
+
+        assert convert_video("video.avi", Path(output_path)) == (5, 40, 30)
+        frames = open_frame_file(Path(output_path), 40, 30)
+        assert np.array_equal(frames, video)
+
+    def test_convert_video_rejects_invalid_paths(self, create_input_video):
+        create_input_video("video.avi", fps=10, size=(30, 40, 3), num_frames=1)
+        with pytest.raises(ValueError):
+            convert_video("video.avi", Path("frames.mp4"))
+        with pytest.raises(ValueError):
+            convert_video("missing.avi", Path("frames.npy"))
+
+    def test_open_raw_frame_file_requires_matching_size(self):
+        np.zeros((2, 30, 40, 3), dtype=np.uint8).tofile("frames.raw")
+
+        assert open_frame_file(Path("frames.raw"), 40, 30).shape == (2, 30, 40, 3)
+        with pytest.raises(ValueError):
+            open_frame_file(Path("frames.raw"))
+        with pytest.raises(ValueError):
+            open_frame_file(Path("frames.raw"), 41, 30)
+
+    def test_open_frame_file_rejects_non_frames(self):
+        np.save("frames.npy", np.zeros((2, 30, 40), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            open_frame_file(Path("frames.npy"))
+
+    def test_reader_outputs_views_of_every_frame(self):
+        frames = np.random.randint(0, 255, (3, 30, 40, 3), dtype=np.uint8)
+        np.save("frames.npy", frames)
+        reader = create_reader("frames.npy")
+        outputs = [reader.run({}) for _ in range(3)]
+
+        assert reader.frame_size == (40, 30)
+        for frame, output in zip(frames, outputs):
+            assert np.array_equal(output["img"], frame)
+            assert np.shares_memory(output["img"], reader.frames)
+            assert not output["img"].flags.writeable
+            assert not output["pipeline_end"]
+        assert reader.run({})["pipeline_end"]
+
+    def test_writable_frames_do_not_modify_file(self):
+        frames = np.ones((1, 30, 40, 3), dtype=np.uint8)
+        frames.tofile("frames.bgr")
+        reader = create_reader("frames.bgr", 40, 30, read_only=False)
+        reader.run({})["img"][:] = 0
+        reader.release_resources()
+
+        assert np.array_equal(np.fromfile("frames.bgr", dtype=np.uint8), frames.ravel())
+
+    def test_reader_throws_error_on_wrong_file_path(self):
+        with pytest.raises(FileNotFoundError):
+            create_reader("path_that_does_not_exist.npy")
@@ -0,0 +1,101 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import cv2
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.input.utils.frame_pool import FramePool
+from peekingduck.pipeline.nodes.input.utils.read import VideoNoThread
+from peekingduck.pipeline.nodes.input.visual import Node
+
+
+class TestFramePool:
+    def test_buffer_is_reused_once_released(self):
+        frame_pool = FramePool(2)
+        frame = frame_pool.acquire((4, 6, 3))
+        buffer_id = id(frame)
+        del frame
+
+        assert id(frame_pool.acquire((4, 6, 3))) == buffer_id
+        assert frame_pool.num_allocations == 1
+
+    def test_buffer_in_use_is_not_reused(self):
+        frame_pool = FramePool(2)
+        frame = frame_pool.acquire((4, 6, 3))
+        view = frame_pool.acquire((4, 6, 3))[:2]
+
+        assert frame_pool.acquire((4, 6, 3)) is not frame
+        assert frame_pool.acquire((4, 6, 3)).base is not view.base
+        assert frame_pool.num_allocations == 4
+        assert len(frame_pool._buffers) == 2
+
+    def test_free_buffer_of_other_size_is_replaced(self):
+        frame_pool = FramePool(1)
+        frame_pool.acquire((4, 6, 3))
+        frame = frame_pool.acquire((8, 8, 3))
+
+        assert frame_pool._buffers == [frame]
+        assert frame_pool.acquire((8, 8, 3), np.float32).dtype == np.float32
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestPooledReading:
+    @pytest.mark.parametrize("mirror_image", [False, True])
+    def test_video_frames_are_decoded_into_pool(
+        self, create_input_video, mirror_image
+    ):
+        video = create_input_video(
+            "video.avi", fps=10, size=(60, 80, 3), num_frames=10
+        )
+        frame_pool = FramePool(4)
+        reader = VideoNoThread("video.avi", mirror_image, frame_pool)
+        for expected in video:
+            ret, frame = reader.read_frame()
+            assert ret
+            assert np.array_equal(
+                frame, cv2.flip(expected, 1) if mirror_image else expected
+            )
+            del frame
+
+        assert frame_pool.num_allocations <= 2
+
+    def test_visual_resizes_into_pool(self, create_input_video):
+        video = create_input_video(
+            "video.avi", fps=10, size=(60, 80, 3), num_frames=10
+        )
+        reader = Node(
+            {
+                "input": "source",
+                "output": "img",
+                "resize": {"do_resizing": True, "width": 40, "height": 30},
+                "filename": "video.mp4",
+                "frames_log_freq": 100,
+                "mirror_image": False,
+                "saved_video_fps": 0,
+                "threading": False,
+                "source": "video.avi",
+                "start_frame": 0,
+                "end_frame": -1,
+                "frame_pool_size": 4,
+                "frame_stride": 1,
+                "target_fps": 0,
+            }
+        )
+        for expected in video:
+            img = reader.run({})["img"]
+            assert np.array_equal(img, cv2.resize(expected, (40, 30)))
+
+        assert reader._frame_pool.num_allocations <= 3
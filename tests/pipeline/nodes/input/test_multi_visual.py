@@ -0,0 +1,142 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import queue
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.input.multi_visual import Node
+
+
+class QueueStream:
+    """Mock of cv2.VideoCapture, with frames which arrive when they are put
+    in `frames`. None signals the end of the stream.
+    """
+
+    def __init__(self):
+        self.frames = queue.Queue()
+
+    def get(self, _):
+        return 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        frame = self.frames.get()
+        return frame is not None, frame
+
+    def release(self):
+        pass
+
+
+def create_reader(sources, frame_timeout=5.0):
+    return Node(
+        {
+            "input": ["none"],
+            "output": ["img", "filename", "pipeline_end", "saved_video_fps"],
+            "sources": sources,
+            "filename": "video.mp4",
+            "frames_log_freq": 100,
+            "mirror_image": False,
+            "resize": {"do_resizing": False, "width": 1280, "height": 720},
+            "saved_video_fps": 10,
+            "buffering": True,
+            "buffer_size": 16,
+            "drop_policy": "block",
+            "drop_every": 2,
+            "frame_timeout": frame_timeout,
+        }
+    )
+
+
+def _read_all(reader):
+    outputs = []
+    while True:
+        output = reader.run({})
+        if output["pipeline_end"]:
+            return outputs
+        if output["img"] is not None:
+            outputs.append(output)
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestMultiVisual:
+    def test_reads_every_frame_of_every_source(self, create_input_video):
+        video1 = create_input_video(
+            "video1.avi", fps=10, size=(60, 80, 3), num_frames=12
+        )
+        video2 = create_input_video("video2.avi", fps=5, size=(40, 50, 3), num_frames=7)
+        reader = create_reader(["video1.avi", "video2.avi"])
+        outputs = _read_all(reader)
+        reader.release_resources()
+
+        for source_id, video in enumerate([video1, video2]):
+            frames = [out["img"] for out in outputs if out["source_id"] == source_id]
+            assert np.array_equal(frames, video)
+        assert {(out["source_id"], out["filename"]) for out in outputs} == {
+            (0, "video1_0.avi"),
+            (1, "video2_1.avi"),
+        }
+        assert {out["saved_video_fps"] for out in outputs} == {10, 5}
+
+    def test_serves_sources_in_turn(self, create_input_video):
+        create_input_video("video1.avi", fps=10, size=(60, 80, 3), num_frames=4)
+        create_input_video("video2.avi", fps=10, size=(60, 80, 3), num_frames=4)
+        reader = create_reader(["video1.avi", "video2.avi", "video1.avi"])
+        # wait for every buffer to fill up
+        for video_thread in reader.readers:
+            while video_thread.queue_size < 4:
+                video_thread.frame_event.wait(0.01)
+        source_ids = [out["source_id"] for out in _read_all(reader)]
+        reader.release_resources()
+
+        assert source_ids == [0, 1, 2] * 4
+
+    def test_no_new_frame_is_empty_frame(self):
+        stream = QueueStream()
+        stream.frames.put(np.ones((4, 6, 3), dtype=np.uint8))
+        with mock.patch(
+            "peekingduck.pipeline.nodes.input.utils.read.cv2.VideoCapture",
+            return_value=stream,
+        ):
+            reader = create_reader(["rtsp://camera"], frame_timeout=0.01)
+        output = reader.run({})
+        assert output["img"] is not None and output["source_id"] == 0
+        assert output["filename"] == "video_0.mp4"
+
+        output = reader.run({})
+        assert output["img"] is None and not output["pipeline_end"]
+        reader.frame_timeout = 5.0
+
+        stream.frames.put(None)
+        assert reader.run({})["pipeline_end"]
+        reader.release_resources()
+
+    def test_frame_size(self, create_input_video):
+        create_input_video("video1.avi", fps=10, size=(60, 80, 3), num_frames=2)
+        reader = create_reader(["video1.avi"])
+        assert reader.frame_size == (80, 60)
+        reader.release_resources()
+
+    def test_rejects_invalid_sources(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            create_reader(["path_that_does_not_exist.mp4"])
+        with pytest.raises(ValueError):
+            create_reader([str(tmp_path)])
+        with pytest.raises(ValueError):
+            create_reader([])
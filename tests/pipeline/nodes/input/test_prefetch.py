@@ -0,0 +1,57 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.input.utils.prefetch import (
+    ImagePrefetcher,
+    decode_image,
+)
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestImagePrefetcher:
+    def test_decode_image(self, create_input_image):
+        image = create_input_image("image.png", (30, 40, 3))
+
+        assert np.array_equal(decode_image(Path("image.png")), image)
+        assert decode_image(Path("missing.png")) is None
+        Path("corrupt.png").write_bytes(b"not an image")
+        assert decode_image(Path("corrupt.png")) is None
+
+    def test_prefetch_is_bounded(self, create_input_image):
+        paths = [Path(f"image{idx}.png") for idx in range(6)]
+        images = [create_input_image(str(path), (30, 40, 3)) for path in paths]
+        prefetcher = ImagePrefetcher(2)
+        prefetcher.prefetch(paths)
+
+        assert list(prefetcher._pending) == paths[:2]
+        assert np.array_equal(prefetcher.get(paths[0]), images[0])
+        prefetcher.prefetch(paths[1:])
+        assert list(prefetcher._pending) == paths[1:3]
+        assert prefetcher.get(paths[5]) is None  # not prefetched
+        prefetcher.shutdown()
+
+    def test_only_images_are_prefetched(self, create_input_image, create_input_video):
+        create_input_image("image.png", (30, 40, 3))
+        create_input_video("video.avi", fps=10, size=(30, 40, 3), num_frames=2)
+        prefetcher = ImagePrefetcher(4)
+        prefetcher.prefetch([Path("video.avi"), Path("image.png")])
+
+        assert list(prefetcher._pending) == [Path("image.png")]
+        prefetcher.shutdown()
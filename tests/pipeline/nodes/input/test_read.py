@@ -0,0 +1,117 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import queue
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.input.utils.read import VideoThread
+
+
+class QueueStream:
+    """Stands in for cv2.VideoCapture, returning the frames put into it and
+    ending the input on None.
+    """
+
+    def __init__(self):
+        self.frames = queue.Queue()
+
+    def get(self, _):
+        return 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        frame = self.frames.get()
+        return frame is not None, frame
+
+    def release(self):
+        pass
+
+
+def _frame(value):
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+@pytest.fixture
+def stream():
+    queue_stream = QueueStream()
+    queue_stream.frames.put(_frame(1))
+    with mock.patch(
+        "peekingduck.pipeline.nodes.input.utils.read.cv2.VideoCapture",
+        return_value=queue_stream,
+    ):
+        yield queue_stream
+
+
+class TestVideoThread:
+    @pytest.mark.parametrize("buffering", [False, True])
+    def test_read_frame_never_repeats_frames(self, stream, buffering):
+        video_thread = VideoThread(0, False, buffering)
+
+        ret, frame = video_thread.read_frame(timeout=5)
+        assert ret and frame[0, 0, 0] == 1
+        assert video_thread.read_frame(timeout=0.01) == (True, None)
+
+        stream.frames.put(_frame(2))
+        ret, frame = video_thread.read_frame(timeout=5)
+        assert ret and frame[0, 0, 0] == 2
+
+        stream.frames.put(None)
+        assert video_thread.read_frame(timeout=5) == (False, None)
+        video_thread.shutdown()
+
+    def test_unbuffered_counts_missed_frames(self, stream):
+        video_thread = VideoThread(0, False, False)
+        for value in range(2, 5):
+            stream.frames.put(_frame(value))
+        stream.frames.put(None)
+        video_thread.thread.join(timeout=5)
+
+        ret, frame = video_thread.read_frame(timeout=5)
+        assert ret and frame[0, 0, 0] == 4
+        assert video_thread.dropped_frames == 3
+        assert video_thread.read_frame() == (False, None)
+        video_thread.shutdown()
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestVideoThreadBuffer:
+    @pytest.mark.parametrize("drop_policy", ["block", "latest"])
+    def test_buffered_reads_bounded(self, create_input_video, drop_policy):
+        num_frames = 20
+        video = create_input_video(
+            "video.avi", fps=10, size=(60, 80, 3), num_frames=num_frames
+        )
+        video_thread = VideoThread(
+            "video.avi", False, True, buffer_size=4, drop_policy=drop_policy
+        )
+        frames = []
+        while True:
+            ret, frame = video_thread.read_frame(timeout=5)
+            if not ret:
+                break
+            frames.append(frame)
+            assert video_thread.queue_size <= 4
+        video_thread.shutdown()
+
+        if drop_policy == "block":
+            assert np.array_equal(frames, video)
+            assert video_thread.dropped_frames == 0
+        else:
+            assert len(frames) + video_thread.dropped_frames == num_frames
@@ -28,7 +28,9 @@
 # limitations under the License.
 
 from contextlib import contextmanager
+from unittest import mock
 
+import cv2
 import numpy as np
 import pytest
 from unittest import TestCase
@@ -44,7 +46,9 @@ def not_raises(exception):
         raise pytest.fail(f"DID RAISE EXCEPTION: {exception}")
 
 
-def create_reader(source=None):
+def create_reader(
+    source=None, start_frame=0, end_frame=-1, prefetch=2, frame_stride=1, target_fps=0
+):
     media_reader = Node(
         {
             "input": "source",
@@ -54,9 +58,15 @@ def create_reader(source=None):
             "frames_log_freq": 100,
             "mirror_image": False,
             "pipeline_end": False,
+            "prefetch": prefetch,
             "saved_video_fps": 0,
             "threading": False,
             "source": source if source else ".",
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "frame_pool_size": 4,
+            "frame_stride": frame_stride,
+            "target_fps": target_fps,
         }
     )
     return media_reader
@@ -112,6 +122,39 @@ class TestMediaReader:
         assert np.array_equal(output2["img"], image2)
         assert np.array_equal(output3["img"], image3)
 
+    @pytest.mark.parametrize("prefetch", [1, 4])
+    def test_reader_reads_multi_images_prefetch(self, create_input_image, prefetch):
+        filenames = [f"image{idx}.jpg" for idx in range(5)]
+        for filename in filenames:
+            create_input_image(filename, (90, 80, 3))
+        images = [cv2.imread(filename) for filename in filenames]  # lossy format
+        reader = create_reader(prefetch=prefetch)
+        outputs = [reader.run({}) for _ in range(5)]
+        reader.release_resources()
+
+        for image, output in zip(images, outputs):
+            assert np.array_equal(output["img"], image)
+        assert [output["filename"] for output in outputs] == filenames
+
+    def test_reader_reads_list_of_images(self, create_input_image):
+        image1 = create_input_image("image1.png", (900, 800, 3))
+        image2 = create_input_image("image2.png", (900, 800, 3))
+        create_input_image("image3.png", (900, 800, 3))
+        reader = create_reader(source=["image2.png", "image1.png"])
+        output1 = reader.run({})
+        output2 = reader.run({})
+        output3 = reader.run({})
+
+        assert np.array_equal(output1["img"], image2)
+        assert output1["filename"] == "image2.png"
+        assert np.array_equal(output2["img"], image1)
+        assert output3["pipeline_end"]
+
+    def test_reader_throws_error_on_missing_file_in_list(self, create_input_image):
+        create_input_image("image1.png", (900, 800, 3))
+        with pytest.raises(FileNotFoundError):
+            create_reader(source=["image1.png", "image2.png"])
+
     def test_reader_reads_one_video(self, create_input_video):
         num_frames = 30
         size = (600, 800, 3)
@@ -123,6 +166,56 @@ class TestMediaReader:
         read_video1 = _get_video_file(reader, num_frames)
         assert np.array_equal(read_video1, video1)
 
+    def test_reader_reads_video_segment(self, create_input_video):
+        num_frames = 30
+        size = (600, 800, 3)
+        video1 = create_input_video(
+            "video1.avi", fps=10, size=size, num_frames=num_frames
+        )
+        reader = create_reader(source="video1.avi", start_frame=10, end_frame=15)
+
+        assert reader.total_frame_count == 5
+        read_video1 = _get_video_file(reader, 5)
+        assert np.array_equal(read_video1, video1[10:15])
+        assert reader.run({})["pipeline_end"]
+
+    @pytest.mark.parametrize("seek_min_frames", [2, 250])
+    def test_reader_samples_video(self, create_input_video, seek_min_frames):
+        video = create_input_video(
+            "video1.avi", fps=10, size=(60, 80, 3), num_frames=20
+        )
+        with mock.patch(
+            "peekingduck.pipeline.nodes.input.utils.read.SEEK_MIN_FRAMES",
+            seek_min_frames,
+        ):
+            reader = create_reader(source="video1.avi", frame_stride=3)
+            assert reader.total_frame_count == 7
+            outputs = [reader.run({}) for _ in range(7)]
+
+            assert np.array_equal([output["img"] for output in outputs], video[::3])
+            assert outputs[0]["saved_video_fps"] == pytest.approx(10 / 3)
+            assert reader.run({})["pipeline_end"]
+
+    def test_reader_samples_video_segment_to_target_fps(self, create_input_video):
+        video = create_input_video(
+            "video1.avi", fps=10, size=(60, 80, 3), num_frames=20
+        )
+        reader = create_reader(
+            source="video1.avi", start_frame=5, end_frame=15, target_fps=5
+        )
+
+        assert reader.total_frame_count == 5
+        read_video = _get_video_file(reader, 5)
+        assert np.array_equal(read_video, video[5:15:2])
+        assert reader.run({})["pipeline_end"]
+
+    def test_reader_rejects_sampling_with_threading(self, create_input_video):
+        create_input_video("video1.avi", fps=10, size=(60, 80, 3), num_frames=2)
+        config = create_reader(source="video1.avi").config
+        config.update(threading=True, target_fps=5)
+        with pytest.raises(ValueError):
+            Node(config)
+
     def test_reader_reads_multiple_videos(self, create_input_video):
         num_frames = 20
         size = (600, 800, 3)
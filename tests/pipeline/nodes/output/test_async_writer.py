@@ -0,0 +1,102 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+from threading import Event
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.nodes.output.utils.async_writer import AsyncWriter
+
+
+class BlockingVideoWriter:
+    """Mock of cv2.VideoWriter which records the frames written, and blocks
+    until `can_write` is set.
+    """
+
+    def __init__(self):
+        self.can_write = Event()
+        self.frames = []
+        self.is_released = False
+
+    def write(self, frame):
+        self.can_write.wait()
+        if self.is_released:
+            raise RuntimeError("write after release")
+        self.frames.append(frame)
+
+    def release(self):
+        self.is_released = True
+
+
+def _frame(value):
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+class TestAsyncWriter:
+    @pytest.mark.parametrize(
+        "queue_size, backpressure, num_encoders",
+        [(0, "block", 1), (4, "oldest", 1), (4, "block", 0)],
+    )
+    def test_rejects_invalid_configs(self, queue_size, backpressure, num_encoders):
+        with pytest.raises(ValueError):
+            AsyncWriter(queue_size, backpressure, num_encoders)
+
+    def test_video_frames_are_written_in_order_before_release(self):
+        video_writer = BlockingVideoWriter()
+        video_writer.can_write.set()
+        async_writer = AsyncWriter(2, "block")
+        for value in range(10):
+            assert async_writer.write_video(video_writer, _frame(value))
+        async_writer.release_video(video_writer)
+        async_writer.flush()
+
+        assert [frame[0, 0, 0] for frame in video_writer.frames] == list(range(10))
+        assert video_writer.is_released
+        async_writer.shutdown()
+
+    def test_drop_discards_frames_when_full(self):
+        video_writer = BlockingVideoWriter()
+        async_writer = AsyncWriter(2, "drop")
+        results = [async_writer.write_video(video_writer, _frame(v)) for v in range(5)]
+
+        assert results == [True, True, False, False, False]
+        assert async_writer.dropped_frames == 3
+        video_writer.can_write.set()
+        async_writer.shutdown()
+        assert len(video_writer.frames) == 2
+
+    def test_images_are_encoded_by_encoder_pool(self, tmp_path):
+        async_writer = AsyncWriter(4, "block", num_encoders=2)
+        images = [_frame(value) for value in range(6)]
+        for idx, image in enumerate(images):
+            async_writer.write_image(str(tmp_path / f"image{idx}.png"), image)
+        async_writer.flush()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            f"image{idx}.png" for idx in range(6)
+        ]
+        async_writer.shutdown()
+
+    def test_errors_are_raised_in_calling_thread(self):
+        video_writer = BlockingVideoWriter()
+        video_writer.can_write.set()
+        video_writer.release()
+        async_writer = AsyncWriter(4, "block")
+        async_writer.write_video(video_writer, _frame(0))
+
+        with pytest.raises(RuntimeError):
+            async_writer.flush()
+        async_writer.shutdown()
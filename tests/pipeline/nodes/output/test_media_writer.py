@@ -30,6 +30,7 @@
 import re
 from pathlib import Path
 
+import cv2
 import pytest
 
 from peekingduck.pipeline.nodes.output.media_writer import Node
@@ -46,12 +47,20 @@ def directory_contents():
     return list(set(OUTPUT_PATH.iterdir()))
 
 
-@pytest.fixture
-def writer():
+@pytest.fixture(params=[0, 16])
+def writer(request):
     media_writer = Node(
-        {"output_dir": str(OUTPUT_PATH), "input": "img", "output": "none"}
+        {
+            "output_dir": str(OUTPUT_PATH),
+            "input": "img",
+            "output": "none",
+            "write_queue_size": request.param,
+            "backpressure": "block",
+            "num_encoders": 2,
+        }
     )
-    return media_writer
+    yield media_writer
+    media_writer.release_resources()
 
 
 @pytest.mark.usefixtures("tmp_dir")
@@ -182,3 +191,49 @@ class TestMediaWriter:
         for filename in directory_contents():
             assert filename.suffix == ".mp4"
             assert re.search(FILENAME_PATTERN, str(filename))
+
+    def test_writer_writes_video_of_each_source(self, writer, create_video):
+        videos = [create_video(SIZE, num_frames=10) for _ in range(2)]
+        for frames in zip(*videos):
+            for source_id, frame in enumerate(frames):
+                writer.run(
+                    {
+                        "filename": f"video_{source_id}.mp4",
+                        "img": frame,
+                        "saved_video_fps": 10,
+                        "pipeline_end": False,
+                        "source_id": source_id,
+                    }
+                )
+        writer.run(
+            {
+                "filename": "video.mp4",
+                "img": None,
+                "saved_video_fps": 10,
+                "pipeline_end": True,
+            }
+        )
+        assert len(directory_contents()) == 2
+
+        for filename in directory_contents():
+            assert filename.name.startswith(("video_0_", "video_1_"))
+            capture = cv2.VideoCapture(str(filename))
+            assert capture.get(cv2.CAP_PROP_FRAME_COUNT) == 10
+            capture.release()
+
+    def test_release_resources_writes_queued_frames(self, writer, create_video):
+        video = create_video(SIZE, num_frames=20)
+        for frame in video:
+            writer.run(
+                {
+                    "filename": "test.mp4",
+                    "img": frame,
+                    "saved_video_fps": 10,
+                    "pipeline_end": False,
+                }
+            )
+        writer.release_resources()
+
+        capture = cv2.VideoCapture(writer.output_file_path)
+        assert capture.get(cv2.CAP_PROP_FRAME_COUNT) == 20
+        capture.release()
@@ -0,0 +1,104 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+
+import pytest
+
+from peekingduck.pipeline.nodes.model_registry import ModelKey, ModelRegistry
+
+KEY = ModelKey("model", "model-tiny", "pytorch", "/weights/model.pth", "cpu", "float")
+
+
+class Loader:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.num_calls = 0
+
+    def __call__(self):
+        self.num_calls += 1
+        time.sleep(self.delay)
+        return object()
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    yield
+    while ModelRegistry.refcount(KEY) > 0:
+        ModelRegistry.release(KEY)
+
+
+class TestModelRegistry:
+    def test_shares_model_with_same_key(self):
+        loader = Loader()
+        model_1 = ModelRegistry.acquire(KEY, loader)
+        model_2 = ModelRegistry.acquire(KEY, loader)
+
+        assert model_1 is model_2
+        assert loader.num_calls == 1
+        assert ModelRegistry.refcount(KEY) == 2
+
+    def test_loads_model_per_key(self):
+        loader = Loader()
+        half_key = KEY._replace(precision="half")
+        model_1 = ModelRegistry.acquire(KEY, loader)
+        model_2 = ModelRegistry.acquire(half_key, loader)
+        ModelRegistry.release(half_key)
+
+        assert model_1 is not model_2
+        assert loader.num_calls == 2
+
+    def test_release_removes_model_without_holders(self):
+        loader = Loader()
+        model_1 = ModelRegistry.acquire(KEY, loader)
+        ModelRegistry.acquire(KEY, loader)
+        ModelRegistry.release(KEY)
+        assert ModelRegistry.refcount(KEY) == 1
+        ModelRegistry.release(KEY)
+        assert ModelRegistry.refcount(KEY) == 0
+
+        model_2 = ModelRegistry.acquire(KEY, loader)
+        assert model_1 is not model_2
+        assert loader.num_calls == 2
+
+    def test_concurrent_acquires_load_once(self):
+        loader = Loader(delay=0.05)
+        models = []
+
+        def acquire():
+            models.append(ModelRegistry.acquire(KEY, loader))
+
+        threads = [threading.Thread(target=acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loader.num_calls == 1
+        assert all(model is models[0] for model in models)
+        assert ModelRegistry.refcount(KEY) == 4
+
+    def test_failed_load_is_not_registered(self):
+        def failing_loader():
+            raise FileNotFoundError("weights not found")
+
+        with pytest.raises(FileNotFoundError):
+            ModelRegistry.acquire(KEY, failing_loader)
+        assert ModelRegistry.refcount(KEY) == 0
+
+        loader = Loader()
+        ModelRegistry.acquire(KEY, loader)
+        assert loader.num_calls == 1
@@ -118,6 +118,11 @@ class TestNode:
         results = c_node.outputs
         assert results == ["int"]
 
+    def test_node_default_run_batch(self, c_node):
+        outputs = c_node.run_batch([{}, {}])
+        assert outputs == [{"data1": 1, "data2": 42}, {"data1": 1, "data2": 42}]
+        assert not c_node.supports_batching
+
     def test_node_no_concrete_run_raises_error(self):
         with pytest.raises(TypeError):
             IncorrectNode({})
@@ -0,0 +1,218 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+import pytest
+
+from peekingduck.pipeline.executors import ConcurrentExecutor, PipelinedExecutor
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.pipeline import Pipeline
+
+NUM_FRAMES = 10
+
+
+class SourceNode(AbstractNode):
+    def __init__(self, num_frames=NUM_FRAMES):
+        super().__init__(
+            {"input": ["none"], "output": ["frame_id", "pipeline_end"]},
+            node_path="input.source",
+        )
+        self.num_frames = num_frames
+        self.count = 0
+
+    def run(self, inputs):
+        self.count += 1
+        if self.count > self.num_frames:
+            return {"frame_id": None, "pipeline_end": True}
+        return {"frame_id": self.count, "pipeline_end": False}
+
+
+class SlowNode(AbstractNode):
+    def __init__(self, delay=0.0, output="result", factor=2):
+        super().__init__(
+            {"input": ["frame_id"], "output": [output]}, node_path="model.slow"
+        )
+        self.delay = delay
+        self.factor = factor
+        self.seen = []
+
+    def run(self, inputs):
+        time.sleep(self.delay)
+        self.seen.append(inputs["frame_id"])
+        return {self.outputs[0]: inputs["frame_id"] * self.factor}
+
+
+class SinkNode(AbstractNode):
+    def __init__(self):
+        super().__init__(
+            {"input": ["result", "pipeline_end"], "output": ["none"]},
+            node_path="output.sink",
+        )
+        self.results = []
+        self.ended = False
+
+    def run(self, inputs):
+        if inputs["pipeline_end"]:
+            self.ended = True
+            return {}
+        self.results.append(inputs["result"])
+        return {}
+
+
+class FailingNode(SlowNode):
+    def run(self, inputs):
+        if inputs["frame_id"] == 3:
+            raise RuntimeError("node failed")
+        return super().run(inputs)
+
+
+class BatchingNode(SlowNode):
+    def __init__(self, delay=0.0):
+        super().__init__(delay)
+        self.batch_sizes = []
+
+    def run_batch(self, inputs):
+        self.batch_sizes.append(len(inputs))
+        return [self.run(frame_inputs) for frame_inputs in inputs]
+
+
+class TestPipelinedExecutor:
+    def test_preserves_frame_order(self):
+        slow_node = SlowNode(delay=0.001)
+        sink_node = SinkNode()
+        pipeline = Pipeline([SourceNode(), slow_node, sink_node])
+
+        num_frames = PipelinedExecutor(pipeline, queue_size=2).run()
+
+        assert num_frames == NUM_FRAMES + 1
+        assert slow_node.seen == list(range(1, NUM_FRAMES + 1))
+        assert sink_node.results == [2 * i for i in range(1, NUM_FRAMES + 1)]
+        assert sink_node.ended
+        assert pipeline.terminate
+
+    def test_pipeline_end_carries_over_skipped_outputs(self):
+        pipeline = Pipeline([SourceNode(), SlowNode(), SinkNode()])
+
+        PipelinedExecutor(pipeline).run()
+
+        assert pipeline.data == {
+            "frame_id": None,
+            "pipeline_end": True,
+            "result": 2 * NUM_FRAMES,
+        }
+
+    def test_num_iter(self):
+        sink_node = SinkNode()
+        pipeline = Pipeline([SourceNode(), SlowNode(), sink_node])
+
+        num_frames = PipelinedExecutor(pipeline, num_iter=3).run()
+
+        assert num_frames == 3
+        assert sink_node.results == [2, 4, 6]
+        assert not sink_node.ended
+
+    def test_node_error_is_raised(self):
+        pipeline = Pipeline([SourceNode(), FailingNode(), SinkNode()])
+
+        with pytest.raises(RuntimeError, match="node failed"):
+            PipelinedExecutor(pipeline, queue_size=1).run()
+
+    def test_invalid_queue_size(self):
+        pipeline = Pipeline([SourceNode(), SlowNode(), SinkNode()])
+
+        with pytest.raises(ValueError, match="queue_size"):
+            PipelinedExecutor(pipeline, queue_size=0)
+
+    def test_batches_frames(self):
+        batching_node = BatchingNode()
+        sink_node = SinkNode()
+        pipeline = Pipeline([SourceNode(), batching_node, sink_node])
+
+        PipelinedExecutor(
+            pipeline, queue_size=NUM_FRAMES + 1, batch_size=4, batch_timeout=1.0
+        ).run()
+
+        assert max(batching_node.batch_sizes) > 1
+        assert all(size <= 4 for size in batching_node.batch_sizes)
+        assert sum(batching_node.batch_sizes) == NUM_FRAMES
+        assert batching_node.seen == list(range(1, NUM_FRAMES + 1))
+        assert sink_node.results == [2 * i for i in range(1, NUM_FRAMES + 1)]
+        assert pipeline.data["result"] == 2 * NUM_FRAMES
+
+    def test_batch_size_ignored_by_non_batching_nodes(self):
+        slow_node = SlowNode()
+        sink_node = SinkNode()
+        pipeline = Pipeline([SourceNode(), slow_node, sink_node])
+
+        PipelinedExecutor(pipeline, batch_size=4).run()
+
+        assert not slow_node.supports_batching
+        assert slow_node.seen == list(range(1, NUM_FRAMES + 1))
+        assert sink_node.results == [2 * i for i in range(1, NUM_FRAMES + 1)]
+
+    def test_invalid_batch_size(self):
+        pipeline = Pipeline([SourceNode(), SlowNode(), SinkNode()])
+
+        with pytest.raises(ValueError, match="batch_size"):
+            PipelinedExecutor(pipeline, batch_size=0)
+
+
+class TestConcurrentExecutor:
+    def test_runs_independent_nodes_concurrently(self):
+        first_node = SlowNode(delay=0.1)
+        second_node = SlowNode(delay=0.1, output="other_result")
+        sink_node = SinkNode()
+        pipeline = Pipeline(
+            [SourceNode(num_frames=3), first_node, second_node, sink_node]
+        )
+
+        start_time = time.perf_counter()
+        num_frames = ConcurrentExecutor(pipeline).run()
+        elapsed = time.perf_counter() - start_time
+
+        assert pipeline.dependencies[2] == {0}
+        assert elapsed < 3 * (0.1 + 0.1)
+        assert num_frames == 4
+        assert first_node.seen == second_node.seen == [1, 2, 3]
+        assert sink_node.results == [2, 4, 6]
+        assert sink_node.ended
+        assert pipeline.terminate
+
+    def test_later_producer_takes_precedence(self):
+        first_node = SlowNode(delay=0.05)
+        second_node = SlowNode(factor=-1)
+        sink_node = SinkNode()
+        pipeline = Pipeline(
+            [SourceNode(num_frames=3), first_node, second_node, sink_node]
+        )
+
+        ConcurrentExecutor(pipeline).run()
+
+        assert sink_node.results == [-1, -2, -3]
+        assert pipeline.data == {"frame_id": None, "pipeline_end": True, "result": -3}
+
+    def test_num_iter(self):
+        sink_node = SinkNode()
+        pipeline = Pipeline([SourceNode(), SlowNode(), sink_node])
+
+        assert ConcurrentExecutor(pipeline, num_iter=3).run() == 3
+        assert sink_node.results == [2, 4, 6]
+
+    def test_node_error_is_raised(self):
+        pipeline = Pipeline([SourceNode(), FailingNode(), SinkNode()])
+
+        with pytest.raises(RuntimeError, match="node failed"):
+            ConcurrentExecutor(pipeline).run()
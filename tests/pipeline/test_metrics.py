@@ -0,0 +1,95 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+
+import numpy as np
+import pytest
+
+from peekingduck.pipeline.metrics import MetricsRecorder
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+
+
+class ImageNode(AbstractNode):
+    def __init__(self, node_path="input.image"):
+        super().__init__({"input": ["none"], "output": ["img"]}, node_path=node_path)
+
+    def run(self, inputs):
+        return {"img": np.zeros((10, 10, 3), dtype=np.uint8), "labels": ["a", "bc"]}
+
+
+@pytest.fixture
+def nodes():
+    return [ImageNode(), ImageNode("model.detector"), ImageNode("model.detector")]
+
+
+class TestMetricsRecorder:
+    def test_duplicate_node_names(self, nodes):
+        recorder = MetricsRecorder(nodes)
+
+        assert list(recorder.summary()) == [
+            "input.image",
+            "model.detector[1]",
+            "model.detector[2]",
+        ]
+
+    def test_run_node(self, nodes):
+        recorder = MetricsRecorder(nodes)
+        for _ in range(3):
+            outputs = recorder.run_node(nodes[0], {})
+
+        stats = recorder.summary()["input.image"]
+        assert outputs["img"].shape == (10, 10, 3)
+        assert stats["count"] == 3
+        assert stats["output_bytes"]["total"] == 3 * (300 + 3)
+        assert stats["output_bytes"]["p50"] == 303
+        assert stats["wall_time"]["total"] >= stats["wall_time"]["max"] > 0
+        assert recorder.summary()["model.detector[1]"]["count"] == 0
+
+    def test_rolling_quantiles(self, nodes):
+        recorder = MetricsRecorder(nodes, window=10)
+        for wall_time in range(100):
+            recorder.record(nodes[0], wall_time, 0.0, 0)
+
+        stats = recorder.summary()["input.image"]["wall_time"]
+        assert stats["max"] == 99
+        assert 90 <= stats["p50"] <= stats["p95"] <= stats["p99"] <= 99
+
+    @pytest.mark.usefixtures("tmp_dir")
+    def test_export_json(self, nodes):
+        recorder = MetricsRecorder(nodes, export_path="metrics.json", export_interval=0)
+        recorder.run_node(nodes[0], {})
+
+        with open("metrics.json") as infile:
+            exported = json.load(infile)
+        assert exported["nodes"]["input.image"]["count"] == 1
+
+    @pytest.mark.usefixtures("tmp_dir")
+    def test_export_prometheus(self, nodes):
+        recorder = MetricsRecorder(
+            nodes, export_path="metrics.prom", export_format="prometheus"
+        )
+        recorder.run_node(nodes[0], {})
+        recorder.export()
+
+        with open("metrics.prom") as infile:
+            lines = infile.read().splitlines()
+        assert "# TYPE peekingduck_node_latency_seconds summary" in lines
+        assert 'peekingduck_node_output_bytes_count{node="input.image"} 1' in lines
+        assert 'peekingduck_node_output_bytes{node="input.image",quantile="0.95"} 303.0' in lines
+
+    def test_invalid_format(self, nodes):
+        with pytest.raises(ValueError, match="export_format"):
+            MetricsRecorder(nodes, export_format="csv")
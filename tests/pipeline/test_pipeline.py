@@ -27,10 +27,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 
 from peekingduck.pipeline.nodes.abstract_node import AbstractNode
-from peekingduck.pipeline.pipeline import Pipeline
+from peekingduck.pipeline.pipeline import DataPoolView, Pipeline
 
 
 class MockedNode(AbstractNode):
@@ -78,3 +79,160 @@ class TestPipeline:
 
     def test_empty_pipeline_results(self, pipeline_correct):
         assert not pipeline_correct.get_pipeline_results()
+
+    def test_get_node_inputs(self, pipeline_correct, test_node_end):
+        pipeline_correct.data = {"test_output_1": 1, "unused": 2}
+
+        assert pipeline_correct.get_node_inputs(test_node_end) == {"test_output_1": 1}
+
+    def test_get_node_inputs_optional(self, pipeline_correct, test_node_end):
+        pipeline_correct.data = {"test_output_1": 1, "unused": 2}
+        test_node_end.optional_inputs = ["unused", "missing"]
+
+        assert pipeline_correct.get_node_inputs(test_node_end) == {
+            "test_output_1": 1,
+            "unused": 2,
+        }
+
+    def test_get_node_inputs_all(self, pipeline_correct):
+        all_node = MockedNode({"input": ["all"], "output": ["none"]})
+        pipeline_correct.data = {"img": np.zeros((2, 2, 3)), "bboxes": [[0, 0, 1, 1]]}
+        inputs = pipeline_correct.get_node_inputs(all_node)
+
+        assert isinstance(inputs, DataPoolView)
+        assert inputs["img"] is not pipeline_correct.data["img"]
+        assert np.shares_memory(inputs["img"], pipeline_correct.data["img"])
+
+
+    def test_dependencies(self):
+        nodes = [
+            MockedNode({"input": ["none"], "output": ["img", "pipeline_end"]}),
+            MockedNode({"input": ["img"], "output": ["bboxes"]}),
+            MockedNode({"input": ["img"], "output": ["bboxes"]}),
+            MockedNode({"input": ["img"], "output": ["density_map"]}),
+            MockedNode({"input": ["bboxes", "img"], "output": ["img"]}),
+            MockedNode({"input": ["img", "bboxes"], "output": ["none"]}),
+            MockedNode({"input": ["density_map"], "output": ["count"]}),
+            MockedNode({"input": ["all"], "output": ["none"]}),
+        ]
+
+        assert Pipeline(nodes).dependencies == [
+            set(),
+            {0},
+            {0},
+            {0},
+            # Reads the latest bboxes, overwrites img read by nodes 1-3
+            {0, 1, 2, 3},
+            # No outputs, acts through side effects
+            {0, 1, 2, 3, 4},
+            # Runs after the side effects of node 5
+            {0, 3, 5},
+            {0, 1, 2, 3, 4, 5, 6},
+        ]
+
+
+    @pytest.mark.parametrize("run_every", [1, 2])
+    def test_propagated_outputs(self, run_every):
+        """Checks that a tracker only produces bboxes, and is ordered before
+        the other readers of the detector's bboxes, when the detector may be
+        skipped.
+        """
+        tracker_config = {
+            "input": ["img", "bboxes"],
+            "output": ["obj_attrs"],
+            "propagated_outputs": ["bboxes", "bbox_scores"],
+        }
+        nodes = [
+            MockedNode({"input": ["none"], "output": ["img", "pipeline_end"]}),
+            MockedNode(
+                {"input": ["img"], "output": ["bboxes"], "run_every": run_every}
+            ),
+            MockedNode({"input": ["img", "bboxes"], "output": ["count"]}),
+            MockedNode(tracker_config),
+        ]
+        pipeline = Pipeline(nodes)
+
+        if run_every == 1:
+            assert nodes[3].outputs == ["obj_attrs"]
+            assert pipeline.dependencies[3] == {0, 1}
+        else:
+            assert nodes[3].outputs == ["obj_attrs", "bboxes", "bbox_scores"]
+            # Overwrites the bboxes read by node 2
+            assert pipeline.dependencies[3] == {0, 1, 2}
+
+    def test_release_data(self):
+        nodes = [
+            MockedNode({"input": ["none"], "output": ["img", "pipeline_end"]}),
+            MockedNode({"input": ["img"], "output": ["bboxes", "masks"]}),
+            MockedNode({"input": ["img", "bboxes"], "output": ["count"]}),
+            MockedNode({"input": ["img"], "output": ["none"]}),
+        ]
+        pipeline = Pipeline(nodes, release_outputs=True)
+        pipeline.data = {"img": 1, "pipeline_end": False, "bboxes": 2, "masks": 3}
+
+        assert nodes[1].unused_outputs == {"masks"}
+        assert nodes[2].unused_outputs == {"count"}
+        pipeline.release_data(1)
+        assert "masks" not in pipeline.data
+        pipeline.release_data(2)
+        assert "bboxes" not in pipeline.data
+        pipeline.release_data(3)
+        assert pipeline.data == {"pipeline_end": False}
+
+    def test_release_data_keeps_keys_read_in_next_iteration(self):
+        nodes = [
+            MockedNode({"input": ["none"], "output": ["img"]}),
+            MockedNode(
+                {"input": ["img"], "output": ["state"], "optional_inputs": ["state"]}
+            ),
+        ]
+        pipeline = Pipeline(nodes, release_outputs=True)
+        pipeline.data = {"img": 1, "state": 2}
+
+        pipeline.release_data(1)
+        assert pipeline.data == {"state": 2}
+        assert not nodes[1].unused_outputs
+
+    def test_release_data_disabled_by_default(self, pipeline_correct, test_node_end):
+        pipeline_correct.data = {"test_output_1": 1, "test_output_2": 2}
+        pipeline_correct.release_data(1)
+
+        assert pipeline_correct.data == {"test_output_1": 1, "test_output_2": 2}
+        assert not test_node_end.unused_outputs
+
+
+class TestDataPoolView:
+    def test_arrays_are_read_only(self):
+        data = {"img": np.zeros((2, 2, 3))}
+        view = DataPoolView(data)
+
+        with pytest.raises(ValueError):
+            view["img"][0, 0, 0] = 1
+        assert data["img"].flags.writeable
+        assert view["img"] is view["img"]
+
+    def test_containers_are_copied(self):
+        data = {"bbox_labels": ["person"], "obj_attrs": {"ids": [1]}}
+        view = DataPoolView(data)
+        view["bbox_labels"].append("car")
+        view["obj_attrs"]["ids"].append(2)
+
+        assert data == {"bbox_labels": ["person"], "obj_attrs": {"ids": [1]}}
+        assert view["bbox_labels"] == ["person", "car"]
+
+    def test_copy_on_write(self):
+        data = {"bboxes": np.zeros((1, 4)), "count": 1}
+        view = DataPoolView(data)
+        view["bboxes"] = np.ones((1, 4))
+        view["fps"] = 30.0
+        del view["count"]
+
+        assert set(data) == {"bboxes", "count"}
+        np.testing.assert_equal(data["bboxes"], np.zeros((1, 4)))
+        assert dict(view) == {"bboxes": view["bboxes"], "fps": 30.0}
+        assert "count" not in view
+        assert len(view) == 2
+        with pytest.raises(KeyError):
+            view["count"]
+        with pytest.raises(KeyError):
+            del view["count"]
@@ -0,0 +1,83 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from peekingduck.pipeline.nodes.abstract_node import AbstractNode
+from peekingduck.pipeline.scheduler import MAX_SKIPPED_FRAMES, FrameScheduler
+
+
+class MockedNode(AbstractNode):
+    def __init__(self, config, **kwargs):
+        super().__init__(config, node_path="model.mocked", **kwargs)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def run(self, inputs):
+        return {}
+
+
+def create_nodes(**kwargs):
+    return [
+        MockedNode({"input": ["none"], "output": ["img"]}),
+        MockedNode({"input": ["img"], "output": ["bboxes", "bbox_labels"]}, **kwargs),
+        MockedNode({"input": ["img", "bboxes"], "output": ["none"]}),
+    ]
+
+
+class TestFrameScheduler:
+    def test_disabled_by_default(self):
+        scheduler = FrameScheduler(create_nodes())
+
+        assert not scheduler.enabled
+        assert all(not scheduler.plan_frame() for _ in range(5))
+
+    def test_run_every(self):
+        scheduler = FrameScheduler(create_nodes(run_every=3))
+
+        plans = [scheduler.plan_frame() for _ in range(7)]
+
+        assert scheduler.enabled
+        assert plans == [set(), {1}, {1}, set(), {1}, {1}, set()]
+        assert scheduler.get_stale_outputs({1}) == {"bboxes", "bbox_labels"}
+        assert scheduler.skippable_outputs == {"bboxes", "bbox_labels"}
+
+    def test_latency_budget(self):
+        scheduler = FrameScheduler(create_nodes(latency_budget=0.5))
+
+        assert scheduler.plan_frame() == set()
+        scheduler.end_frame(1.0)
+        # Behind by 0.5s, skipped until the pipeline catches up
+        assert scheduler.plan_frame() == {1}
+        scheduler.end_frame(0.25)
+        assert scheduler.plan_frame() == {1}
+        scheduler.end_frame(0.25)
+        assert scheduler.plan_frame() == set()
+
+    def test_latency_budget_max_skipped_frames(self):
+        scheduler = FrameScheduler(create_nodes(latency_budget=0.1))
+
+        plans = []
+        for _ in range(MAX_SKIPPED_FRAMES + 2):
+            plans.append(scheduler.plan_frame())
+            scheduler.end_frame(1.0)
+
+        assert plans[1 : MAX_SKIPPED_FRAMES + 1] == [{1}] * MAX_SKIPPED_FRAMES
+        assert plans[MAX_SKIPPED_FRAMES + 1] == set()
+
+    @pytest.mark.parametrize("config", [{"run_every": 0}, {"latency_budget": -1.0}])
+    def test_invalid_config(self, config):
+        with pytest.raises(ValueError):
+            FrameScheduler(create_nodes(**config))
@@ -0,0 +1,83 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import pytest
+import torch
+
+from peekingduck.pipeline.utils.torch_weights import (
+    MMAP_SUFFIX,
+    load_checkpoint,
+    load_state_dict,
+)
+
+
+@pytest.fixture(name="model")
+def fixture_model():
+    torch.manual_seed(0)
+    return torch.nn.Sequential(torch.nn.Linear(8, 4), torch.nn.Linear(4, 2))
+
+
+def _assert_same_weights(model_1, model_2):
+    for param_1, param_2 in zip(
+        model_1.state_dict().values(), model_2.state_dict().values()
+    ):
+        assert torch.equal(param_1, param_2)
+
+
+def _new_model():
+    return torch.nn.Sequential(torch.nn.Linear(8, 4), torch.nn.Linear(4, 2))
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestTorchWeights:
+    def test_load_checkpoint(self, model):
+        torch.save(model.state_dict(), "weights.pth")
+
+        loaded = _new_model()
+        load_state_dict(loaded, load_checkpoint(Path("weights.pth")))
+
+        _assert_same_weights(model, loaded)
+
+    def test_load_checkpoint_mmap(self, model):
+        torch.save({"model": model.state_dict()}, "weights.pth")
+
+        state_dict = load_checkpoint("weights.pth", mmap=True)["model"]
+        loaded = _new_model()
+        load_state_dict(loaded, state_dict, mmap=True)
+
+        _assert_same_weights(model, loaded)
+        # The parameters use the memory-mapped tensors instead of copies
+        assert loaded[0].weight.data_ptr() == state_dict["0.weight"].data_ptr()
+        assert isinstance(loaded[0].weight, torch.nn.Parameter)
+        assert not Path(f"weights{MMAP_SUFFIX}.pth").exists()
+
+    def test_load_legacy_checkpoint_mmap(self, model):
+        torch.save(
+            model.state_dict(), "weights.pth", _use_new_zipfile_serialization=False
+        )
+
+        loaded = _new_model()
+        load_state_dict(loaded, load_checkpoint("weights.pth", mmap=True), mmap=True)
+
+        mmap_path = Path(f"weights{MMAP_SUFFIX}.pth")
+        assert mmap_path.exists()
+        _assert_same_weights(model, loaded)
+
+        # The converted copy is reused
+        mtime = mmap_path.stat().st_mtime_ns
+        load_checkpoint("weights.pth", mmap=True)
+        assert mmap_path.stat().st_mtime_ns == mtime
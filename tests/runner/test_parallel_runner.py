@@ -0,0 +1,171 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+
+import ast
+import csv
+from pathlib import Path
+
+import cv2
+import pytest
+import yaml
+
+from peekingduck.parallel_runner import (
+    ParallelRunner,
+    Segment,
+    split_into_segments,
+    split_into_shards,
+)
+
+PIPELINE_PATH = Path("pipeline_config.yml")
+
+
+def create_pipeline_yaml(source, media_writer=False, **media_writer_config):
+    nodes = [
+        {"input.visual": {"source": source}},
+        {
+            "output.csv_writer": {
+                "stats_to_track": ["filename"],
+                "file_path": "stats.csv",
+                "logging_interval": 0,
+            }
+        },
+    ]
+    if media_writer:
+        nodes.append(
+            {"output.media_writer": {"output_dir": "output", **media_writer_config}}
+        )
+    with open(PIPELINE_PATH, "w") as outfile:
+        yaml.dump({"nodes": nodes}, outfile, default_flow_style=False)
+
+
+def create_parallel_runner(num_workers, segment_overlap=30):
+    return ParallelRunner(
+        pipeline_path=PIPELINE_PATH,
+        config_updates_cli="None",
+        custom_nodes_parent_subdir="src",
+        num_workers=num_workers,
+        segment_overlap=segment_overlap,
+    )
+
+
+def count_frames(video_path):
+    stream = cv2.VideoCapture(str(video_path))
+    num_frames = 0
+    while stream.read()[0]:
+        num_frames += 1
+    stream.release()
+    return num_frames
+
+
+@pytest.mark.parametrize(
+    "num_files, num_shards, sizes",
+    [(4, 2, [2, 2]), (5, 2, [3, 2]), (7, 3, [3, 2, 2]), (2, 4, [1, 1])],
+)
+def test_split_into_shards(num_files, num_shards, sizes):
+    files = [Path(f"{idx}.png") for idx in range(num_files)]
+    shards = split_into_shards(files, num_shards)
+
+    assert [len(shard) for shard in shards] == sizes
+    assert [file_path for shard in shards for file_path in shard] == files
+
+
+def test_split_into_shards_no_files():
+    with pytest.raises(ValueError):
+        split_into_shards([], 2)
+
+
+def test_split_into_segments():
+    assert split_into_segments(10, 3, 2) == [
+        Segment(0, 4, 0),
+        Segment(4, 7, 2),
+        Segment(7, 10, 2),
+    ]
+    assert split_into_segments(10, 2, 8) == [Segment(0, 5, 0), Segment(5, 10, 5)]
+
+
+def test_split_into_segments_unknown_frame_count():
+    with pytest.raises(ValueError):
+        split_into_segments(0, 2, 2)
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestParallelRunner:
+    def test_run(self, create_input_image):
+        Path("images").mkdir()
+        filenames = [f"image{idx}.png" for idx in range(5)]
+        for filename in filenames:
+            create_input_image(str(Path("images") / filename), (48, 64, 3))
+        create_pipeline_yaml("images")
+        parallel_runner = create_parallel_runner(num_workers=2)
+        parallel_runner.run()
+        summary = parallel_runner.summary()
+
+        assert [len(shard) for shard in parallel_runner.shards] == [3, 2]
+        assert summary["num_files"] == 5
+        assert summary["failed_workers"] == []
+        assert list(Path.cwd().glob("stats_worker*.csv")) == []
+        with open(summary["csv_path"], newline="") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        assert [row["filename"] for row in rows] == filenames
+
+    def test_shard_config_updates(self, create_input_image):
+        create_input_image("image1.png", (48, 64, 3))
+        create_input_image("image2.png", (48, 64, 3))
+        create_pipeline_yaml(["image1.png", "image2.png"])
+        parallel_runner = create_parallel_runner(num_workers=2)
+        config_updates = ast.literal_eval(parallel_runner._get_shard_config_updates(1))
+
+        assert config_updates["input.visual"]["source"] == [
+            str(Path("image2.png").resolve())
+        ]
+        assert config_updates["output.csv_writer"]["file_path"] == "stats_worker1.csv"
+
+    def test_run_video_segments(self, create_input_video):
+        create_input_video("video.avi", fps=10, size=(48, 64, 3), num_frames=20)
+        create_pipeline_yaml("video.avi", media_writer=True)
+        parallel_runner = create_parallel_runner(num_workers=3, segment_overlap=3)
+        config_updates = ast.literal_eval(
+            parallel_runner._get_shard_config_updates(1)
+        )
+        parallel_runner.run()
+        summary = parallel_runner.summary()
+
+        assert parallel_runner.segments == [
+            Segment(0, 7, 0),
+            Segment(7, 14, 3),
+            Segment(14, 20, 3),
+        ]
+        assert config_updates["input.visual"]["start_frame"] == 4
+        assert config_updates["input.visual"]["end_frame"] == 14
+        assert summary["failed_workers"] == []
+        with open(summary["csv_path"], newline="") as csv_file:
+            assert len(list(csv.DictReader(csv_file))) == 20
+        assert count_frames(summary["video_path"]) == 20
+        assert [path.name for path in Path("output").iterdir()] == [
+            Path(summary["video_path"]).name
+        ]
+
+    def test_init_video_segments_dropping_frames(self, create_input_video):
+        create_input_video("video.avi", fps=10, size=(48, 64, 3), num_frames=20)
+        create_pipeline_yaml("video.avi", media_writer=True, backpressure="drop")
+        with pytest.raises(SystemExit):
+            create_parallel_runner(num_workers=2)
+
+    def test_init_invalid_source(self, create_input_image):
+        create_input_image("image1.png", (48, 64, 3))
+        create_pipeline_yaml("image1.png")
+        with pytest.raises(SystemExit):
+            create_parallel_runner(num_workers=2)
@@ -50,6 +50,54 @@ class MockedNode(AbstractNode):
         return output
 
 
+class CountingNode(MockedNode):
+    def __init__(self, config):
+        super().__init__(config)
+        self.count = 0
+
+    def run(self, inputs):
+        self.count += 1
+        return {"count": self.count}
+
+
+class EndNode(MockedNode):
+    def __init__(self, config):
+        super().__init__(config)
+        self.optional_inputs = ["stale_outputs"]
+        self.stale = []
+        self.counts = []
+
+    def run(self, inputs):
+        self.stale.append(inputs["stale_outputs"])
+        self.counts.append(inputs["count"])
+        return {"pipeline_end": False}
+
+
+class IntermittentSourceNode(MockedNode):
+    """Outputs no new frame on every other iteration."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.num_calls = 0
+
+    def run(self, inputs):
+        self.num_calls += 1
+        img = None if self.num_calls % 2 else self.num_calls
+        return {"img": img, "pipeline_end": False}
+
+
+class ModelNode(AbstractNode):
+    def __init__(self, config):
+        super().__init__(
+            config, node_path=f"model.{PKD_NODE_NAME}", pkd_base_dir=MODULE_DIR
+        )
+        self.images = []
+
+    def run(self, inputs):
+        self.images.append(inputs[self.inputs[0]])
+        return {"bboxes": []}
+
+
 def create_node_config(config_dir, node_name):
     config_text = {"root": None, "input": ["none"], "output": ["pipeline_end"]}
     with open(config_dir / f"{node_name}.yml", "w") as fp:
@@ -67,7 +115,7 @@ def setup():
     create_pipeline_yaml(NODES)
 
 
-def get_pipeline_with_default_node_names():
+def get_pipeline_with_default_node_names(release_outputs=False):
     mock_node = mock.Mock()
     mock_node.inputs = ["none"]
     mock_node.name = f"peekingduck.pipeline.nodes.{PKD_NODE}"
@@ -79,7 +127,7 @@ def get_pipeline_with_default_node_names():
     return mock_pipeline
 
 
-def replace_declarativeloader_get_pipeline():
+def replace_declarativeloader_get_pipeline(release_outputs=False):
     mock_pipeline = mock.Mock()
     mock_pipeline.nodes = []
 
@@ -218,6 +266,113 @@ class TestRunner:
         assert runner_with_nodes.pipeline.data == correct_data
         assert runner_with_nodes.pipeline.get_pipeline_results() == correct_data
 
+    def test_run_nodes_pipelined(self, test_input_node, test_node_end):
+        setup()
+        test_runner = Runner(nodes=[test_input_node, test_node_end], mode="pipelined")
+        test_runner.run()
+
+        assert test_runner.pipeline.data == {
+            "test_output_1": "test_output_0",
+            "test_output_2": "test_output_0",
+            "pipeline_end": "test_output_1",
+        }
+
+    def test_run_nodes_concurrent(self, test_input_node, test_node_end):
+        setup()
+        test_runner = Runner(nodes=[test_input_node, test_node_end], mode="concurrent")
+        test_runner.run()
+
+        assert test_runner.pipeline.data == {
+            "test_output_1": "test_output_0",
+            "test_output_2": "test_output_0",
+            "pipeline_end": "test_output_1",
+        }
+
+    def test_run_nodes_release_outputs(self, test_input_node, test_node_end):
+        setup()
+        test_runner = Runner(
+            nodes=[test_input_node, test_node_end], release_outputs=True
+        )
+        test_runner.run()
+
+        assert test_runner.pipeline.data == {"pipeline_end": "test_output_1"}
+
+    @pytest.mark.parametrize("mode", ["sequential", "pipelined", "concurrent"])
+    def test_run_every(self, test_input_node, mode):
+        setup()
+        counting_node = CountingNode({"input": ["test_output_1"], "output": ["count"]})
+        counting_node.run_every = 2
+        end_node = EndNode({"input": ["count"], "output": ["pipeline_end"]})
+        test_runner = Runner(
+            nodes=[test_input_node, counting_node, end_node], mode=mode, num_iter=5
+        )
+        test_runner.run()
+
+        assert counting_node.count == 3
+        assert end_node.stale == [set(), {"count"}, set(), {"count"}, set()]
+        assert end_node.counts == [1, 1, 2, 2, 3]
+
+    def test_metrics(self, runner_with_nodes):
+        runner_with_nodes.run()
+        metrics = runner_with_nodes.metrics()
+
+        assert list(metrics) == [f"{PKD_NODE}[0]", f"{PKD_NODE}[1]"]
+        assert all(stats["count"] == 1 for stats in metrics.values())
+
+    def test_warmup(self):
+        setup()
+        for node_type in (PKD_NODE_TYPE, "model"):
+            config_dir = MODULE_DIR / "configs" / node_type
+            config_dir.mkdir(parents=True, exist_ok=True)
+            create_node_config(config_dir, PKD_NODE_NAME)
+        input_node = MockedNode({"input": ["none"], "output": ["img"]})
+        input_node.frame_size = (64, 48)
+        model_node = ModelNode({"input": ["img"], "output": ["bboxes"]})
+        counting_node = CountingNode({"input": ["img"], "output": ["count"]})
+        skipped_node = ModelNode({"input": ["count"], "output": ["bbox_labels"]})
+        test_runner = Runner(
+            nodes=[input_node, model_node, counting_node, skipped_node],
+            num_iter=1,
+            warmup=True,
+        )
+
+        assert list(test_runner.warmup_times) == [f"model.{PKD_NODE_NAME}[1]"]
+        assert model_node.images[0].shape == (48, 64, 3)
+        assert counting_node.count == 0
+        assert not skipped_node.images
+        assert all(stats["count"] == 0 for stats in test_runner.metrics().values())
+
+        test_runner.run()
+
+        assert model_node.images[1] == "test_output_0"
+        assert skipped_node.images == [1]
+        assert test_runner.metrics()[f"model.{PKD_NODE_NAME}[1]"]["count"] == 1
+
+    @pytest.mark.parametrize("mode", ["sequential", "pipelined", "concurrent"])
+    def test_run_skips_empty_frames(self, test_input_node, mode):
+        setup()
+        source_node = IntermittentSourceNode(
+            {"input": ["none"], "output": ["img", "pipeline_end"]}
+        )
+        counting_node = CountingNode({"input": ["img"], "output": ["count"]})
+        test_runner = Runner(
+            nodes=[source_node, counting_node], mode=mode, num_iter=3
+        )
+        test_runner.run()
+
+        assert counting_node.count == 3
+        assert test_runner.pipeline.data["img"] == 6
+
+    def test_init_invalid_mode(self, test_input_node, test_node_end):
+        with pytest.raises(SystemExit):
+            Runner(nodes=[test_input_node, test_node_end], mode="invalid")
+
+    def test_init_batch_size_requires_pipelined_mode(
+        self, test_input_node, test_node_end
+    ):
+        with pytest.raises(SystemExit):
+            Runner(nodes=[test_input_node, test_node_end], batch_size=2)
+
     def test_pipeline_not_deleted_after_run(self, runner_with_nodes):
         assert isinstance(runner_with_nodes.pipeline, object) == True
 
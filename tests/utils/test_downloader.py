@@ -0,0 +1,245 @@
+# Copyright 2025 Natsunoyuki AI Laboratory
+#
+# PeekingDuckReborn is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by the Free 
+# Software Foundation, either version 3 of the License, or (at your option) any 
+# later version.
+#
+# PeekingDuckReborn is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or 
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more 
+# details.
+#
+# You should have received a copy of the GNU General Public License along with 
+# PeekingDuckReborn. If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from peekingduck.utils.downloader import Downloader, extract_zip, read_json
+
+CONTENT = os.urandom(10 * 1024 + 123)
+RANGE_SIZE = 1024
+
+
+def _etag(content):
+    return f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+
+
+ETAG = _etag(CONTENT)
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serves files with support for single range requests and ``If-Range``
+    and records the requested ranges.
+    """
+
+    accept_ranges = True
+    requested_ranges = []
+
+    def do_HEAD(self):
+        path = Path(self.translate_path(self.path))
+        self.send_response(200)
+        if self.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.send_header("ETag", _etag(path.read_bytes()))
+        self.end_headers()
+
+    def do_GET(self):
+        content = Path(self.translate_path(self.path)).read_bytes()
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if (
+            range_header is None
+            or not self.accept_ranges
+            or (if_range is not None and if_range != _etag(content))
+        ):
+            self.send_response(200)
+            body = content
+        else:
+            start, end = range_header.replace("bytes=", "").split("-")
+            start = int(start)
+            end = int(end) if end else len(content) - 1
+            type(self).requested_ranges.append((start, end))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{end}/{len(content)}"
+            )
+            body = content[start : end + 1]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(name="server")
+def fixture_server(tmp_path):
+    (tmp_path / "weights.bin").write_bytes(CONTENT)
+    RangeRequestHandler.accept_ranges = True
+    RangeRequestHandler.requested_ranges = []
+    httpd = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(RangeRequestHandler, directory=str(tmp_path))
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestDownloader:
+    def test_parallel_range_download(self, server):
+        destination = Path("weights.bin")
+        digest = Downloader(num_connections=4, range_size=RANGE_SIZE).download(
+            f"{server}/weights.bin", destination
+        )
+
+        assert destination.read_bytes() == CONTENT
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+        assert len(RangeRequestHandler.requested_ranges) == 11
+        assert not Path("weights.bin.part").exists()
+        assert not Path("weights.bin.part.json").exists()
+
+    def test_resume_range_download(self, server):
+        url = f"{server}/weights.bin"
+        # Simulate an interrupted download where only the 2nd range completed
+        part_path = Path("weights.bin.part")
+        part_path.write_bytes(
+            bytes(RANGE_SIZE) + CONTENT[RANGE_SIZE : 2 * RANGE_SIZE]
+        )
+        with open(part_path, "r+b") as outfile:
+            outfile.truncate(len(CONTENT))
+        Path("weights.bin.part.json").write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "size": len(CONTENT),
+                    "validator": ETAG,
+                    "done": [RANGE_SIZE],
+                }
+            )
+        )
+
+        Downloader(num_connections=2, range_size=RANGE_SIZE).download(
+            url, Path("weights.bin")
+        )
+
+        assert Path("weights.bin").read_bytes() == CONTENT
+        assert len(RangeRequestHandler.requested_ranges) == 10
+        assert (RANGE_SIZE, 2 * RANGE_SIZE - 1) not in (
+            RangeRequestHandler.requested_ranges
+        )
+
+    def test_resume_stream_download(self, server):
+        url = f"{server}/weights.bin"
+        Path("weights.bin.part").write_bytes(CONTENT[:100])
+        Path("weights.bin.part.json").write_text(
+            json.dumps({"url": url, "validator": ETAG})
+        )
+
+        digest = Downloader(range_size=len(CONTENT)).download(url, Path("weights.bin"))
+
+        assert Path("weights.bin").read_bytes() == CONTENT
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+        assert RangeRequestHandler.requested_ranges == [(100, len(CONTENT) - 1)]
+        assert not Path("weights.bin.part.json").exists()
+
+    @pytest.mark.parametrize("range_size", [RANGE_SIZE, len(CONTENT)])
+    def test_partial_download_of_replaced_file_is_discarded(self, server, range_size):
+        """Checks that a partial download of an older version of the file is
+        not resumed.
+        """
+        url = f"{server}/weights.bin"
+        part_path = Path("weights.bin.part")
+        part_path.write_bytes(os.urandom(len(CONTENT)))
+        state = {"url": url, "validator": '"old"'}
+        if range_size == RANGE_SIZE:
+            state.update(size=len(CONTENT), done=[0, RANGE_SIZE])
+        else:
+            part_path.write_bytes(part_path.read_bytes()[:100])
+        Path("weights.bin.part.json").write_text(json.dumps(state))
+
+        digest = Downloader(range_size=range_size).download(url, Path("weights.bin"))
+
+        assert Path("weights.bin").read_bytes() == CONTENT
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+        if range_size == RANGE_SIZE:
+            assert len(RangeRequestHandler.requested_ranges) == 11
+        else:
+            assert not RangeRequestHandler.requested_ranges
+
+    def test_file_replaced_during_download(self, server, tmp_path):
+        """Checks that ranges of a file which changed after the download
+        started are rejected through If-Range.
+        """
+        (tmp_path / "weights.bin").write_bytes(CONTENT[::-1])
+
+        with mock.patch.object(
+            Downloader, "_probe", return_value=(len(CONTENT), ETAG)
+        ), pytest.raises(ConnectionError):
+            Downloader(range_size=RANGE_SIZE).download(
+                f"{server}/weights.bin", Path("weights.bin")
+            )
+        assert not Path("weights.bin").exists()
+
+    def test_download_without_range_support(self, server):
+        RangeRequestHandler.accept_ranges = False
+        Path("weights.bin.part").write_bytes(b"stale")
+
+        Downloader(range_size=RANGE_SIZE).download(
+            f"{server}/weights.bin", Path("weights.bin")
+        )
+
+        assert Path("weights.bin").read_bytes() == CONTENT
+        assert not RangeRequestHandler.requested_ranges
+
+    def test_checksum_mismatch(self, server):
+        with pytest.raises(ValueError) as excinfo:
+            Downloader(range_size=RANGE_SIZE).download(
+                f"{server}/weights.bin", Path("weights.bin"), expected_sha256="0"
+            )
+        assert "Checksum mismatch" in str(excinfo.value)
+        assert not Path("weights.bin").exists()
+        assert not Path("weights.bin.part").exists()
+
+    @pytest.mark.parametrize("as_url", [True, False])
+    def test_local_mirror(self, as_url):
+        mirror_dir = Path("mirror").resolve()
+        mirror_dir.mkdir()
+        (mirror_dir / "weights.bin").write_bytes(CONTENT)
+        (mirror_dir / "checksums.json").write_text(json.dumps({"key": "value"}))
+        base_url = mirror_dir.as_uri() if as_url else str(mirror_dir)
+
+        digest = Downloader().download(f"{base_url}/weights.bin", Path("weights.bin"))
+
+        assert Path("weights.bin").read_bytes() == CONTENT
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+        assert read_json(f"{base_url}/checksums.json") == {"key": "value"}
+
+    def test_extract_zip(self):
+        with zipfile.ZipFile("weights.zip", "w") as outfile:
+            outfile.writestr("saved_model/", "")
+            outfile.writestr("saved_model/saved_model.pb", b"model")
+            for i in range(8):
+                outfile.writestr(f"saved_model/variables/part{i}", str(i))
+
+        extract_zip(Path("weights.zip"), Path("extracted"), num_workers=4)
+
+        assert Path("extracted/saved_model/saved_model.pb").read_bytes() == b"model"
+        for i in range(8):
+            assert Path(f"extracted/saved_model/variables/part{i}").read_text() == (
+                str(i)
+            )
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import subprocess
+import threading
+import time
 from pathlib import Path
 from unittest import TestCase, mock
 
@@ -21,7 +23,9 @@ import pytest
 from peekingduck.utils.requirement_checker import (
     PKD_NODE_PREFIX,
     RequirementChecker,
+    RequirementStamp,
     check_requirements,
+    has_system_requirements,
 )
 
 INSTALL_FAQ_LINK = (
@@ -116,3 +120,101 @@ class TestRequirementChecker:
                 assert f"The {NODE_WITH_SYS_PKG} node" in msg
                 assert f"requires sys_package_name{i}" in msg
                 assert f"instructions at {INSTALL_FAQ_LINK}" in msg
+
+
+@pytest.fixture
+def stamp(requirements_file):
+    stamp = RequirementStamp(Path.cwd() / "stamps", requirements_file)
+    with mock.patch.object(RequirementChecker, "_stamp", stamp):
+        yield stamp
+
+
+@pytest.mark.usefixtures("tmp_dir")
+class TestRequirementStamp:
+    def test_stamp_is_saved(self, requirements_file):
+        stamp = RequirementStamp(Path.cwd() / "stamps", requirements_file)
+        stamp.add(NODE_WITH_UPDATE)
+
+        assert NODE_WITH_UPDATE in stamp
+        assert NODE_WITH_UPDATE in RequirementStamp(
+            Path.cwd() / "stamps", requirements_file
+        )
+
+    def test_stamp_is_discarded_when_requirements_change(self, requirements_file):
+        stamp = RequirementStamp(Path.cwd() / "stamps", requirements_file)
+        stamp.add(NODE_WITH_UPDATE)
+        with open(requirements_file, "a") as outfile:
+            outfile.write(f"{NODE_WITH_UPDATE} {PKG_REQ_TYPE_PYTHON} pkg_name2\n")
+
+        assert NODE_WITH_UPDATE not in RequirementStamp(
+            Path.cwd() / "stamps", requirements_file
+        )
+
+    def test_has_system_requirements(self, requirements_file):
+        assert has_system_requirements(NODE_WITH_SYS_PKG, requirements_file)
+        assert not has_system_requirements("node_type.node_name2", requirements_file)
+
+    def test_checker_skips_stamped_identifier(self, stamp):
+        with mock.patch(
+            "peekingduck.utils.requirement_checker.check_requirements",
+            return_value=0,
+        ) as mock_check, mock.patch(
+            "peekingduck.utils.requirement_checker.has_system_requirements",
+            return_value=False,
+        ):
+            RequirementChecker.find_spec(PKD_NODE_PREFIX + NODE_WITH_UPDATE)
+            RequirementChecker.find_spec(PKD_NODE_PREFIX + NODE_WITH_UPDATE)
+
+            mock_check.assert_called_once_with(NODE_WITH_UPDATE)
+            assert NODE_WITH_UPDATE in stamp
+
+    def test_checker_does_not_stamp_updated_identifier(self, stamp):
+        with mock.patch(
+            "peekingduck.utils.requirement_checker.check_requirements",
+            return_value=1,
+        ), mock.patch.object(RequirementChecker, "n_update", 0):
+            RequirementChecker.find_spec(PKD_NODE_PREFIX + NODE_WITH_UPDATE)
+
+            assert RequirementChecker.n_update == 1
+            assert NODE_WITH_UPDATE not in stamp
+
+    def test_checker_is_thread_safe(self, stamp):
+        """Checks that concurrent imports of the same node check its
+        requirements and count its updates once.
+        """
+
+        def slow_check_requirements(identifier):
+            time.sleep(0.05)
+            return 1 if identifier == NODE_WITH_UPDATE else 0
+
+        with mock.patch(
+            "peekingduck.utils.requirement_checker.check_requirements",
+            side_effect=slow_check_requirements,
+        ) as mock_check, mock.patch(
+            "peekingduck.utils.requirement_checker.has_system_requirements",
+            return_value=False,
+        ), mock.patch.object(RequirementChecker, "n_update", 0):
+            threads = [
+                threading.Thread(
+                    target=RequirementChecker.find_spec,
+                    args=(PKD_NODE_PREFIX + identifier,),
+                )
+                for identifier in [NODE_WITH_UPDATE, "node_type.node_name2"] * 4
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert RequirementChecker.n_update == 4
+            assert mock_check.call_count == 5
+            assert "node_type.node_name2" in stamp
+
+    def test_checker_skip_environment_variable(self, stamp, monkeypatch):
+        monkeypatch.setenv("PEEKINGDUCK_SKIP_REQ_CHECK", "1")
+        with mock.patch(
+            "peekingduck.utils.requirement_checker.check_requirements"
+        ) as mock_check:
+            RequirementChecker.find_spec(PKD_NODE_PREFIX + NODE_WITH_UPDATE)
+
+            mock_check.assert_not_called()